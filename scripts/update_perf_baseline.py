@@ -100,6 +100,7 @@ def run_all_benchmarks():
         DirectOptimizedProtocol,
         ShadowsV0Protocol,
     )
+    from quartumse.protocols._kernels import pack_words
 
     circuit, obs_set, gt, paulis_raw = build_workload()
     results: dict[str, dict] = {}
@@ -208,21 +209,19 @@ def run_all_benchmarks():
     t = timeit(qc_run)
     record("quick_comparison_3proto", t)
 
-    # 8) eigenvalue_direct_naive
+    # 8) packed_estimate_direct_naive
     naive = DirectNaiveProtocol()
     rng = np.random.default_rng(99)
-    bitstrings = ["".join(str(b) for b in row) for row in rng.integers(0, 2, size=(N_SHOTS, 4))]
+    outcomes = pack_words(rng.integers(0, 2, size=(N_SHOTS, 4), dtype=np.uint8))
 
-    t = timeit(lambda: naive._estimate_from_bitstrings(bitstrings, "ZIZI", 1.0), n_runs=21)
-    record("eigenvalue_direct_naive", t)
+    t = timeit(lambda: naive._estimate_from_outcomes(outcomes, "ZIZI", 1.0), n_runs=21)
+    record("packed_estimate_direct_naive", t)
 
-    # 9) eigenvalue_direct_grouped
+    # 9) packed_estimate_direct_grouped
     grouped = DirectGroupedProtocol()
 
-    t = timeit(
-        lambda: grouped._estimate_from_bitstrings(bitstrings, "ZIZI", "ZZZZ", 1.0), n_runs=21
-    )
-    record("eigenvalue_direct_grouped", t)
+    t = timeit(lambda: grouped._estimate_from_outcomes(outcomes, "ZIZI", "ZZZZ", 1.0), n_runs=21)
+    record("packed_estimate_direct_grouped", t)
 
     return results
 
@@ -457,10 +457,11 @@ def _extract_raw_shot_records(
     records = []
     protocol_id = estimates.protocol_id or ""
     for chunk in estimates.raw_chunks:
-        if chunk.bitstrings:
+        if chunk.setting_ids:
             # Check metadata for measurement bases (shadows protocol)
             meta_bases = chunk.metadata.get("measurement_bases") if chunk.metadata else None
-            for setting_id, bitstring_list in chunk.bitstrings.items():
+            for setting_id in chunk.setting_ids:
+                bitstring_list = chunk.get_bitstrings(setting_id)
                 records.append(
                     {
                         "protocol_id": protocol_id,
@@ -275,7 +275,7 @@ class ShadowEstimator(Estimator):
                 f"Using safe default batch size: {max_experiments}"
             )
 
-        measurement_outcomes_list: list[np.ndarray] = []
+        measured_bitstrings: list[str] = []
 
         sampler = self._get_runtime_sampler()
 
@@ -287,25 +287,25 @@ class ShadowEstimator(Estimator):
 
                 for batch_idx, _ in enumerate(circuit_batch):
                     counts = result[batch_idx].data.meas.get_counts()
-                    bitstring = list(counts.keys())[0].replace(" ", "")
-                    outcomes = np.array([int(b) for b in bitstring[::-1]], dtype=int)
-                    measurement_outcomes_list.append(outcomes)
+                    measured_bitstrings.append(next(iter(counts)).replace(" ", ""))
             else:
                 job = self.backend.run(circuit_batch, shots=1)  # Each circuit is one shadow
                 result = job.result()
 
                 for batch_idx, _ in enumerate(circuit_batch):
                     counts = result.get_counts(batch_idx)
-                    bitstring = list(counts.keys())[0].replace(" ", "")
-                    outcomes = np.array([int(b) for b in bitstring[::-1]], dtype=int)
-                    measurement_outcomes_list.append(outcomes)
+                    measured_bitstrings.append(next(iter(counts)).replace(" ", ""))
 
-        if len(measurement_outcomes_list) != shadow_size:
+        if len(measured_bitstrings) != shadow_size:
             raise RuntimeError(
                 "Collected measurement outcomes do not match the requested shadow size."
             )
 
-        measurement_outcomes = np.asarray(measurement_outcomes_list, dtype=int)
+        # Decode all shots at once: ASCII '0'/'1' minus ord('0') gives 0/1, and
+        # reversing the columns puts qubit 0 first
+        measurement_outcomes = np.frombuffer(
+            "".join(measured_bitstrings).encode(), dtype=np.uint8
+        ).reshape(len(measured_bitstrings), -1)[:, ::-1].astype(int) - ord("0")
 
         measurement_bases = self.shadow_impl.measurement_bases
         if measurement_bases is None:
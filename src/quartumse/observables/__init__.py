@@ -33,6 +33,7 @@ from .core import (
     Observable,
     ObservableSet,
     ObservableType,
+    pauli_product,
 )
 from .generators import (
     ClusteredSupportGenerator,
@@ -49,6 +50,8 @@ from .grouping import (
     CommutingGroup,
     build_commutation_graph,
     build_qubitwise_commutation_graph,
+    dsatur_grouping,
+    edge_coloring_grouping,
     greedy_grouping,
     partition_observable_set,
     pauli_commutes,
@@ -61,6 +64,7 @@ from .suites import (
     ObjectiveType,
     # Core classes
     ObservableSuite,
+    SuiteBundle,
     SuiteType,
     # Pauli string generators
     generate_all_k_local,
@@ -87,6 +91,7 @@ __all__ = [
     "Observable",
     "ObservableSet",
     "ObservableType",
+    "pauli_product",
     # Generators
     "ObservableGenerator",
     "GeneratorConfig",
@@ -106,11 +111,14 @@ __all__ = [
     "build_qubitwise_commutation_graph",
     "greedy_grouping",
     "sorted_insertion_grouping",
+    "dsatur_grouping",
+    "edge_coloring_grouping",
     "partition_observable_set",
     "verify_grouping",
     # Suites (Benchmarking)
     "ObservableSuite",
     "ObjectiveType",
+    "SuiteBundle",
     "SuiteType",
     "generate_all_k_local",
     "generate_zz_correlators",
@@ -23,6 +23,7 @@ import uuid
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from typing import Any
 
 import numpy as np
@@ -45,6 +46,96 @@ PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
 
 PAULI_MATRICES = {"I": PAULI_I, "X": PAULI_X, "Y": PAULI_Y, "Z": PAULI_Z}
 
+# Byte-level Pauli codes with bit 0 = x part and bit 1 = z part (I=0, X=1, Z=2, Y=3).
+# Strings are translated once to these bytes; read little-endian as an int, qubit q
+# occupies byte q, so the x and z masks are that int masked to each byte's low bit.
+_PAULI_CODES = bytes.maketrans(b"IXZY", b"\x00\x01\x02\x03")
+# Inverse table for decoding union masks; identity positions default to Z
+_BASIS_FROM_CODES = bytes.maketrans(b"\x00\x01\x02\x03", b"ZXZY")
+# Exact inverse of _PAULI_CODES
+_PAULI_FROM_CODES = bytes.maketrans(b"\x00\x01\x02\x03", b"IXZY")
+
+# Exponent t of i in the single-qubit product P_a P_b = i^t P_{a ^ b}, indexed by
+# code (I=0, X=1, Z=2, Y=3); e.g. X Z = -iY and X Y = iZ
+_PAULI_PHASE_TABLE = np.array(
+    [[0, 0, 0, 0], [0, 0, -1, 1], [0, 1, 0, -1], [0, -1, 1, 0]], dtype=np.int8
+)
+_PAULI_PHASE_TABLE.flags.writeable = False
+_I_POWERS = (1, 1j, -1, -1j)
+
+
+@cache
+def _low_bits(n_qubits: int) -> int:
+    """Mask with the low bit of each of the first n_qubits bytes set."""
+    return int.from_bytes(b"\x01" * n_qubits, "little")
+
+
+def _pauli_bytes(pauli_string: str) -> bytes:
+    """Translate a Pauli string into its per-qubit code bytes."""
+    return pauli_string.encode("ascii").translate(_PAULI_CODES)
+
+
+def _bytes_xz(codes: bytes) -> tuple[int, int]:
+    """Split per-qubit code bytes into symplectic (x, z) masks."""
+    value = int.from_bytes(codes, "little")
+    low = _low_bits(len(codes))
+    return value & low, (value >> 1) & low
+
+
+def _pauli_xz(pauli_string: str) -> tuple[int, int]:
+    """Encode a Pauli string as symplectic (x, z) bitmasks.
+
+    Args:
+        pauli_string: Pauli string (e.g., "XYZII").
+
+    Returns:
+        Tuple of (x_mask, z_mask) with qubit q stored at bit 8 * q.
+    """
+    return _bytes_xz(_pauli_bytes(pauli_string))
+
+
+def _xz_to_basis(x_mask: int, z_mask: int, n_qubits: int) -> str:
+    """Decode a qubit-wise union (x, z) mask into a measurement basis string."""
+    codes = (x_mask | (z_mask << 1)).to_bytes(n_qubits, "little")
+    return codes.translate(_BASIS_FROM_CODES).decode("ascii")
+
+
+def _codes_commute(c1: bytes, c2: bytes) -> bool:
+    """Global commutation on code bytes: symplectic inner product is even."""
+    x1, z1 = _bytes_xz(c1)
+    x2, z2 = _bytes_xz(c2)
+    return ((x1 & z2) ^ (x2 & z1)).bit_count() % 2 == 0
+
+
+def _codes_qubitwise_commute(c1: bytes, c2: bytes) -> bool:
+    """Qubit-wise commutation on code bytes: no shared qubit with differing codes."""
+    x1, z1 = _bytes_xz(c1)
+    x2, z2 = _bytes_xz(c2)
+    return (x1 | z1) & (x2 | z2) & ((x1 ^ x2) | (z1 ^ z2)) == 0
+
+
+def pauli_product(pauli1: str, pauli2: str) -> tuple[complex, str]:
+    """Multiply two Pauli strings.
+
+    Codes multiply by XOR, and the phase is the sum of per-qubit table
+    lookups in _PAULI_PHASE_TABLE, so no branching per qubit is needed.
+
+    Args:
+        pauli1: Left factor (e.g., "XYZ").
+        pauli2: Right factor of the same length.
+
+    Returns:
+        Tuple of (phase, pauli_string) with pauli1 * pauli2 = phase * pauli_string
+        and phase one of 1, 1j, -1, -1j.
+    """
+    if len(pauli1) != len(pauli2):
+        raise ValueError("Pauli strings must have same length")
+    codes1 = np.frombuffer(_pauli_bytes(pauli1), dtype=np.uint8)
+    codes2 = np.frombuffer(_pauli_bytes(pauli2), dtype=np.uint8)
+    exponent = int(_PAULI_PHASE_TABLE[codes1, codes2].sum()) % 4
+    product = (codes1 ^ codes2).tobytes().translate(_PAULI_FROM_CODES).decode("ascii")
+    return _I_POWERS[exponent], product
+
 
 @dataclass
 class Observable:
@@ -70,9 +161,9 @@ class Observable:
     # Cached computed properties for performance
     _cached_locality: int | None = field(default=None, repr=False, compare=False)
     _cached_support: list[int] | None = field(default=None, repr=False, compare=False)
-    _cached_basis_indices: NDArray[np.int_] | None = field(
-        default=None, repr=False, compare=False
-    )
+    _cached_support_array: NDArray[np.intp] | None = field(default=None, repr=False, compare=False)
+    _cached_basis_indices: NDArray[np.int_] | None = field(default=None, repr=False, compare=False)
+    _cached_native_basis: str | None = field(default=None, repr=False, compare=False)
     _cached_sparse_matrix: Any | None = field(default=None, repr=False, compare=False)
     _cached_dense_matrix: NDArray[np.complexfloating] | None = field(
         default=None, repr=False, compare=False
@@ -134,6 +225,15 @@ class Observable:
             self._cached_support = [i for i, c in enumerate(self.pauli_string) if c != "I"]
         return self._cached_support
 
+    @property
+    def support_array(self) -> NDArray[np.intp]:
+        """Support as a read-only ``intp`` index array, for fancy indexing. Cached."""
+        if self._cached_support_array is None:
+            support = np.fromiter(self.support, dtype=np.intp, count=len(self.support))
+            support.flags.writeable = False
+            self._cached_support_array = support
+        return self._cached_support_array
+
     @property
     def basis_indices(self) -> NDArray[np.int_]:
         """Measurement basis indices for non-identity terms (X->1, Y->2, Z->0)."""
@@ -145,6 +245,13 @@ class Observable:
             )
         return self._cached_basis_indices
 
+    @property
+    def native_basis(self) -> str:
+        """Measurement basis that reads this observable directly (I measured as Z). Cached."""
+        if self._cached_native_basis is None:
+            self._cached_native_basis = self.pauli_string.replace("I", "Z")
+        return self._cached_native_basis
+
     def to_matrix(self) -> NDArray[np.complexfloating]:
         """Convert to dense matrix representation."""
         if self._cached_dense_matrix is None:
@@ -178,12 +285,11 @@ class Observable:
                 f"{self.n_qubits} vs {other.n_qubits}"
             )
 
-        anticommute_count = 0
-        for p1, p2 in zip(self.pauli_string, other.pauli_string, strict=False):
-            if p1 != "I" and p2 != "I" and p1 != p2:
-                anticommute_count += 1
+        # Identity and equal strings commute trivially (locality is cached)
+        if self.locality == 0 or other.locality == 0 or self.pauli_string == other.pauli_string:
+            return True
 
-        return anticommute_count % 2 == 0
+        return _codes_commute(_pauli_bytes(self.pauli_string), _pauli_bytes(other.pauli_string))
 
     def shared_basis(self, other: Observable) -> str | None:
         """Get shared measurement basis if observables commute qubit-wise.
@@ -194,18 +300,12 @@ class Observable:
         if self.n_qubits != other.n_qubits:
             return None
 
-        basis = []
-        for p1, p2 in zip(self.pauli_string, other.pauli_string, strict=False):
-            if p1 == "I":
-                basis.append(p2 if p2 != "I" else "Z")  # Default to Z
-            elif p2 == "I":
-                basis.append(p1)
-            elif p1 == p2:
-                basis.append(p1)
-            else:
-                return None  # Conflict on this qubit
+        x1, z1 = _pauli_xz(self.pauli_string)
+        x2, z2 = _pauli_xz(other.pauli_string)
+        if (x1 | z1) & (x2 | z2) & ((x1 ^ x2) | (z1 ^ z2)):
+            return None  # Conflict on some qubit
 
-        return "".join(basis)
+        return _xz_to_basis(x1 | x2, z1 | z2, self.n_qubits)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -283,6 +383,10 @@ class ObservableSet:
     metadata: dict[str, Any] = field(default_factory=dict)
     # Index for O(1) lookup by observable_id
     _id_index: dict[str, Observable] = field(default_factory=dict, repr=False, compare=False)
+    # (n_qubits, Pauli strings) -> 64-bit digest from the last fingerprint call
+    _cached_fingerprint: tuple[tuple[int, tuple[str, ...]], int] | None = field(
+        default=None, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate and set defaults."""
@@ -322,6 +426,20 @@ class ObservableSet:
             return self._id_index[observable_id]
         raise KeyError(f"Observable with ID '{observable_id}' not found")
 
+    @property
+    def fingerprint(self) -> int:
+        """64-bit content hash of the Pauli strings and qubit count.
+
+        Cached against the Pauli strings it was computed from, so in-place
+        edits to ``observables`` are picked up on the next access.
+        """
+        key = (self.n_qubits, tuple(obs.pauli_string for obs in self.observables))
+        if self._cached_fingerprint is None or self._cached_fingerprint[0] != key:
+            payload = f"{key[0]}|" + "|".join(key[1])
+            digest = hashlib.blake2b(payload.encode(), digest_size=8).digest()
+            self._cached_fingerprint = (key, int.from_bytes(digest, "little"))
+        return self._cached_fingerprint[1]
+
     def locality_distribution(self) -> dict[int, int]:
         """Get distribution of Pauli weights."""
         dist: dict[int, int] = {}
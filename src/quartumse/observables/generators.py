@@ -343,17 +343,15 @@ class CorrelatorGenerator(ObservableGenerator):
         correlator_type: str,
     ) -> list[Observable]:
         """Create two-point correlator observables."""
+        letter = {"two_point_z": ord("Z"), "two_point_xx": ord("X")}.get(correlator_type)
+        # Mutate one identity template in place and reset it after each term
+        template = bytearray(b"I" * n_qubits)
         observables = []
         for i, j in pairs:
-            paulis = ["I"] * n_qubits
-            if correlator_type == "two_point_z":
-                paulis[i] = "Z"
-                paulis[j] = "Z"
-            elif correlator_type == "two_point_xx":
-                paulis[i] = "X"
-                paulis[j] = "X"
-            pauli_string = "".join(paulis)
-            observables.append(Observable(pauli_string=pauli_string))
+            if letter is not None:
+                template[i] = template[j] = letter
+            observables.append(Observable(pauli_string=template.decode("ascii")))
+            template[i] = template[j] = ord("I")
         return observables
 
     def _generate_k_tuples(
@@ -384,13 +382,15 @@ class CorrelatorGenerator(ObservableGenerator):
         n_qubits: int,
     ) -> list[Observable]:
         """Create k-local Z-string observables."""
+        # Mutate one identity template in place and reset it after each term
+        template = bytearray(b"I" * n_qubits)
         observables = []
         for qubit_tuple in tuples:
-            paulis = ["I"] * n_qubits
             for i in qubit_tuple:
-                paulis[i] = "Z"
-            pauli_string = "".join(paulis)
-            observables.append(Observable(pauli_string=pauli_string))
+                template[i] = ord("Z")
+            observables.append(Observable(pauli_string=template.decode("ascii")))
+            for i in qubit_tuple:
+                template[i] = ord("I")
         return observables
 
 
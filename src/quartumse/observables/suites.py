@@ -16,15 +16,23 @@ References:
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
+from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache, partial
 from itertools import combinations, product
 from math import comb
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import numpy as np
 
-from .core import Observable, ObservableSet
+from ..utils.jit import HAS_NUMBA, njit
+from .core import _PAULI_PHASE_TABLE, Observable, ObservableSet
+
+if TYPE_CHECKING:
+    from .grouping import CommutingGroup
 
 
 class ObjectiveType(Enum):
@@ -73,6 +81,20 @@ class ObservableSuite:
     objective: ObjectiveType = ObjectiveType.PER_OBSERVABLE
     description: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Read-only i-exponent table for single-qubit Pauli products, shared by all suites
+    PAULI_PHASE_TABLE: ClassVar[np.ndarray] = _PAULI_PHASE_TABLE
+    # Partition results keyed by method, tagged with the set fingerprint they were built from
+    _commutation_cache: dict[str, tuple[int, list[CommutingGroup], dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _weight_ids: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _weight_vec: np.ndarray = field(
+        default_factory=lambda: np.zeros(0), init=False, repr=False, compare=False
+    )
+    # Row of each weighted observable in observable_set, aligned with _weight_vec
+    _weight_rows: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.intp), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate suite configuration."""
@@ -88,6 +110,27 @@ class ObservableSuite:
                 missing = weight_ids - obs_ids
                 raise ValueError(f"Weight keys not found in observables: {missing}")
 
+        # Aligned weight vector and an objective function specialized once per suite
+        self._weight_ids = list(self.weights) if self.weights else []
+        self._weight_vec = np.fromiter(
+            self.weights.values() if self.weights else (),
+            dtype=np.float64,
+            count=len(self._weight_ids),
+        )
+        if self._weight_ids:
+            rows = {obs.observable_id: i for i, obs in enumerate(self.observable_set)}
+            self._weight_rows = np.fromiter(
+                (rows[obs_id] for obs_id in self._weight_ids),
+                dtype=np.intp,
+                count=len(self._weight_ids),
+            )
+        if self.objective == ObjectiveType.PER_OBSERVABLE:
+            self.compute_objective = self._compute_per_observable  # type: ignore[method-assign]
+        elif self.objective == ObjectiveType.WEIGHTED_SUM and self.weights:
+            self.compute_objective = self._compute_weighted_sum  # type: ignore[method-assign]
+        elif self.objective == ObjectiveType.MAX_ERROR:
+            self.compute_objective = self._compute_max_error  # type: ignore[method-assign]
+
     @property
     def n_observables(self) -> int:
         """Number of observables in the suite."""
@@ -107,9 +150,15 @@ class ObservableSuite:
         """Distribution of Pauli weights."""
         return self.observable_set.locality_distribution()
 
-    def commutation_analysis(self) -> dict[str, Any]:
+    def commutation_analysis(self, method: str = "greedy") -> dict[str, Any]:
         """Analyze commutation structure of the suite.
 
+        The underlying partition is cached per method and reused until the
+        observable set's fingerprint changes.
+
+        Args:
+            method: Grouping method passed to partition_observable_set.
+
         Returns dict with:
             - n_commuting_groups: Number of groups after greedy partitioning
             - max_group_size: Largest commuting group
@@ -118,45 +167,72 @@ class ObservableSuite:
         """
         from .grouping import partition_observable_set
 
-        groups, stats = partition_observable_set(self.observable_set)
+        fingerprint = self.observable_set.fingerprint
+        cached = self._commutation_cache.get(method)
+        if cached is not None and cached[0] == fingerprint:
+            _, groups, stats = cached
+        else:
+            groups, stats = partition_observable_set(self.observable_set, method=method)
+            self._commutation_cache[method] = (fingerprint, groups, stats)
 
         return {
             "n_commuting_groups": len(groups),
             "max_group_size": max(len(g.observables) for g in groups) if groups else 0,
             "fully_commuting": len(groups) == 1,
             "grouping_efficiency": self.n_observables / len(groups) if groups else 0,
-            "partition_stats": stats,
+            "partition_stats": dict(stats),
         }
 
-    def compute_objective(self, estimates: dict[str, float]) -> float:
+    def compute_objective(self, estimates: dict[str, float] | np.ndarray) -> float:
         """Compute the objective value from observable estimates.
 
         Args:
-            estimates: Dict mapping observable_id -> estimated expectation value
+            estimates: Dict mapping observable_id -> estimated expectation value,
+                or an array of estimates aligned with the suite's observable order
 
         Returns:
             Objective value (interpretation depends on objective type)
+
+        Note:
+            ``__post_init__`` rebinds this method on the instance to the
+            specialized ``_compute_*`` function for the suite's objective, so
+            this dispatching body only runs for objectives without one.
         """
         if self.objective == ObjectiveType.PER_OBSERVABLE:
-            # Return mean estimate (not very meaningful, but consistent)
-            return np.mean(list(estimates.values()))
+            return self._compute_per_observable(estimates)
 
         elif self.objective == ObjectiveType.WEIGHTED_SUM:
             if not self.weights:
                 raise ValueError("WEIGHTED_SUM objective requires weights")
-            total = 0.0
-            for obs_id, weight in self.weights.items():
-                if obs_id in estimates:
-                    total += weight * estimates[obs_id]
-            return total
+            return self._compute_weighted_sum(estimates)
 
         elif self.objective == ObjectiveType.MAX_ERROR:
-            # This requires truth values, return NaN for now
-            return float("nan")
+            return self._compute_max_error(estimates)
 
         else:
             raise ValueError(f"Unknown objective type: {self.objective}")
 
+    def _compute_per_observable(self, estimates: dict[str, float] | np.ndarray) -> float:
+        """Mean estimate (not very meaningful, but consistent)."""
+        if isinstance(estimates, np.ndarray):
+            return float(np.mean(estimates))
+        return np.mean(np.fromiter(estimates.values(), dtype=np.float64, count=len(estimates)))
+
+    def _compute_weighted_sum(self, estimates: dict[str, float] | np.ndarray) -> float:
+        """Weighted sum over the suite weights; missing estimates contribute nothing."""
+        if isinstance(estimates, np.ndarray):
+            return float(self._weight_vec @ estimates[self._weight_rows])
+        values = np.fromiter(
+            (estimates.get(obs_id, 0.0) for obs_id in self._weight_ids),
+            dtype=np.float64,
+            count=len(self._weight_ids),
+        )
+        return float(np.dot(self._weight_vec, values))
+
+    def _compute_max_error(self, estimates: dict[str, float] | np.ndarray) -> float:
+        """Worst-case error requires truth values, so return NaN for now."""
+        return float("nan")
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -178,7 +254,7 @@ class ObservableSuite:
         name: str,
         suite_type: SuiteType,
         pauli_strings: list[str],
-        weights: dict[str, float] | None = None,
+        weights: dict[str, float] | np.ndarray | None = None,
         **kwargs: Any,
     ) -> ObservableSuite:
         """Create suite from Pauli strings.
@@ -187,13 +263,24 @@ class ObservableSuite:
             name: Suite name
             suite_type: Suite category
             pauli_strings: List of Pauli string representations
-            weights: Optional dict mapping Pauli string -> coefficient
+            weights: Optional dict mapping Pauli string -> coefficient, or an
+                array with one coefficient per Pauli string (same order)
             **kwargs: Additional arguments (objective, description, metadata)
         """
-        obs_set = ObservableSet.from_pauli_strings(pauli_strings)
-
-        # Convert weights from Pauli string keys to observable_id keys
-        if weights:
+        # Intern so equal terms share one string object across suites
+        obs_set = ObservableSet.from_pauli_strings(list(map(sys.intern, pauli_strings)))
+
+        # Convert weights from Pauli string keys (or rows) to observable_id keys
+        if isinstance(weights, np.ndarray):
+            if len(weights) != len(obs_set):
+                raise ValueError(
+                    f"Expected {len(obs_set)} weights (one per Pauli string), got {len(weights)}"
+                )
+            weights = {
+                obs.observable_id: coeff
+                for obs, coeff in zip(obs_set.observables, weights.tolist(), strict=True)
+            }
+        elif weights:
             id_weights = {}
             for obs in obs_set.observables:
                 if obs.pauli_string in weights:
@@ -208,12 +295,156 @@ class ObservableSuite:
             **kwargs,
         )
 
+    @classmethod
+    def from_soa(
+        cls,
+        name: str,
+        suite_type: SuiteType,
+        x_words: np.ndarray,
+        z_words: np.ndarray,
+        n_qubits: int,
+        weights: dict[str, float] | np.ndarray | None = None,
+        **kwargs: Any,
+    ) -> ObservableSuite:
+        """Create suite from bit-packed (x, z) word arrays.
+
+        The arrays use the layout of _paulis_soa and are stringified in one
+        vectorized pass, only here at the ObservableSet boundary.
+
+        Args:
+            name: Suite name
+            suite_type: Suite category
+            x_words: (M, ceil(n_qubits / 64)) uint64 X-part words
+            z_words: (M, ceil(n_qubits / 64)) uint64 Z-part words
+            n_qubits: Number of qubits
+            weights: Optional dict mapping Pauli string -> coefficient, or an
+                array with one coefficient per row
+            **kwargs: Additional arguments (objective, description, metadata)
+        """
+        return cls.from_pauli_strings(
+            name=name,
+            suite_type=suite_type,
+            pauli_strings=_soa_to_strings(x_words, z_words, n_qubits),
+            weights=weights,
+            **kwargs,
+        )
+
 
 # =============================================================================
 # PAULI STRING GENERATORS
 # =============================================================================
 
 
+def _rows_to_strings(buf: np.ndarray) -> list[str]:
+    """Decode a (M, n_qubits) uint8 ASCII buffer into M Pauli strings."""
+    n_qubits = buf.shape[1]
+    if n_qubits == 0:
+        return [""] * buf.shape[0]
+    text = np.ascontiguousarray(buf).tobytes().decode("ascii")
+    return [text[i : i + n_qubits] for i in range(0, len(text), n_qubits)]
+
+
+# ASCII lookup for Pauli codes (I=0, X=1, Y=2, Z=3)
+_PAULI_ASCII = np.frombuffer(b"IXYZ", dtype=np.uint8)
+# ASCII lookup for symplectic codes x | z << 1 (I=0, X=1, Z=2, Y=3)
+_XZ_ASCII = np.frombuffer(b"IXZY", dtype=np.uint8)
+
+
+def _paulis_soa(n_qubits: int, n_terms: int) -> tuple[np.ndarray, np.ndarray]:
+    """Allocate all-identity Paulis as structure-of-arrays bit-packed words.
+
+    Qubit q of term m lives at bit q % 64 of word q // 64 in row m of the
+    X-part and Z-part arrays.
+
+    Returns:
+        Tuple of (x_words, z_words), each (n_terms, ceil(n_qubits / 64)) uint64.
+    """
+    n_words = max(1, -(-n_qubits // 64))
+    return (
+        np.zeros((n_terms, n_words), dtype=np.uint64),
+        np.zeros((n_terms, n_words), dtype=np.uint64),
+    )
+
+
+def _set_soa_sites(
+    x_words: np.ndarray,
+    z_words: np.ndarray,
+    rows: np.ndarray,
+    qubits: np.ndarray,
+    pauli: str,
+) -> None:
+    """Place a single-qubit Pauli at (rows[k], qubits[k]) for every k.
+
+    Each row may appear at most once per call.
+    """
+    words = qubits // 64
+    bits = np.left_shift(np.uint64(1), (qubits % 64).astype(np.uint64))
+    if pauli in ("X", "Y"):
+        x_words[rows, words] |= bits
+    if pauli in ("Z", "Y"):
+        z_words[rows, words] |= bits
+
+
+def _soa_to_strings(x_words: np.ndarray, z_words: np.ndarray, n_qubits: int) -> list[str]:
+    """Decode bit-packed (x, z) words into Pauli strings."""
+    shape = (x_words.shape[0], x_words.shape[1] * 8)
+    x_bits, z_bits = (
+        np.unpackbits(
+            words.astype("<u8", copy=False).view(np.uint8).reshape(shape),
+            axis=1,
+            count=n_qubits,
+            bitorder="little",
+        )
+        for words in (x_words, z_words)
+    )
+    return _rows_to_strings(_XZ_ASCII[x_bits | (z_bits << 1)])
+
+
+def _pair_paulis_soa(n_qubits: int, pauli: str) -> tuple[np.ndarray, np.ndarray]:
+    """All P_i P_j strings (i < j, row-major pair order) for one Pauli letter P."""
+    first, second = np.triu_indices(n_qubits, k=1)
+    rows = np.arange(len(first))
+    x_words, z_words = _paulis_soa(n_qubits, len(rows))
+    _set_soa_sites(x_words, z_words, rows, first, pauli)
+    _set_soa_sites(x_words, z_words, rows, second, pauli)
+    return x_words, z_words
+
+
+def _emit_up_to_2_local_soa(
+    n_qubits: int, basis: str, include_global: bool = True, pairs_first: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fill one SoA with every 1- and 2-local string in a single basis, plus P^n.
+
+    Rows are the singles, then the pairs i < j in row-major order (swapped
+    when ``pairs_first``), then the global string. P^n only duplicates a
+    pair (n = 2) or a single (n = 1), so it is skipped there.
+
+    Returns:
+        Tuple of (x_words, z_words) in the layout of _paulis_soa.
+    """
+    first, second = np.triu_indices(n_qubits, k=1)
+    n_pairs = len(first)
+    add_global = include_global and n_qubits > 2
+    x_words, z_words = _paulis_soa(n_qubits, n_qubits + n_pairs + int(add_global))
+
+    single_start, pair_start = (n_pairs, 0) if pairs_first else (0, n_qubits)
+    qubits = np.arange(n_qubits)
+    _set_soa_sites(x_words, z_words, single_start + qubits, qubits, basis)
+    pair_rows = pair_start + np.arange(n_pairs)
+    _set_soa_sites(x_words, z_words, pair_rows, first, basis)
+    _set_soa_sites(x_words, z_words, pair_rows, second, basis)
+
+    if add_global:
+        bits = np.zeros(x_words.shape[1] * 64, dtype=np.uint8)
+        bits[:n_qubits] = 1
+        global_words = np.packbits(bits, bitorder="little").view("<u8")
+        if basis in ("X", "Y"):
+            x_words[-1] = global_words
+        if basis in ("Z", "Y"):
+            z_words[-1] = global_words
+    return x_words, z_words
+
+
 def generate_all_k_local(n_qubits: int, k: int) -> list[str]:
     """Generate ALL k-local Pauli strings on n qubits.
 
@@ -226,17 +457,20 @@ def generate_all_k_local(n_qubits: int, k: int) -> list[str]:
     Returns:
         List of Pauli strings
     """
-    paulis = []
-    pauli_ops = ["X", "Y", "Z"]
+    position_sets = list(combinations(range(n_qubits), k))
+    op_sets = list(product(b"XYZ", repeat=k))
+    combos = np.array(position_sets, dtype=np.intp).reshape(len(position_sets), k)
+    ops = np.array(op_sets, dtype=np.uint8).reshape(len(op_sets), k)
 
-    for positions in combinations(range(n_qubits), k):
-        for ops in product(pauli_ops, repeat=k):
-            pauli_list = ["I"] * n_qubits
-            for pos, op in zip(positions, ops, strict=False):
-                pauli_list[pos] = op
-            paulis.append("".join(pauli_list))
+    # Scatter every (positions, operators) pair into an 'I'-filled buffer in one pass
+    out = np.full((len(combos), len(ops), n_qubits), ord("I"), dtype=np.uint8)
+    out[
+        np.arange(len(combos))[:, None, None],
+        np.arange(len(ops))[None, :, None],
+        combos[:, None, :],
+    ] = ops[None, :, :]
 
-    return paulis
+    return _rows_to_strings(out.reshape(len(combos) * len(ops), n_qubits))
 
 
 def generate_zz_correlators(
@@ -254,9 +488,21 @@ def generate_zz_correlators(
     Returns:
         List of ZZ Pauli strings
     """
+    if pairs is None:
+        return list(_zz_correlators_cached(n_qubits, graph))
     return generate_edge_correlators(n_qubits, pairs=pairs, graph=graph, paulis=["ZZ"])
 
 
+@lru_cache(maxsize=64)
+def _zz_correlators_cached(
+    n_qubits: int, graph: Literal["all", "chain", "ring"]
+) -> tuple[str, ...]:
+    """Memoized graph-based ZZ correlators (suite makers rebuild these repeatedly)."""
+    if graph == "all":
+        return tuple(_soa_to_strings(*_pair_paulis_soa(n_qubits, "Z"), n_qubits))
+    return tuple(generate_edge_correlators(n_qubits, graph=graph, paulis=["ZZ"]))
+
+
 def generate_edge_correlators(
     n_qubits: int,
     pairs: list[tuple[int, int]] | None = None,
@@ -288,17 +534,86 @@ def generate_edge_correlators(
         else:
             raise ValueError(f"Unknown graph type: {graph}")
 
-    result = []
-    for i, j in pairs:
-        for pp in paulis:
-            if len(pp) != 2:
-                raise ValueError(f"Pauli pair must be 2 characters, got: {pp}")
-            pauli_list = ["I"] * n_qubits
-            pauli_list[i] = pp[0]
-            pauli_list[j] = pp[1]
-            result.append("".join(pauli_list))
+    if not pairs:
+        return []
+    for pp in paulis:
+        if len(pp) != 2:
+            raise ValueError(f"Pauli pair must be 2 characters, got: {pp}")
 
-    return result
+    pairs_arr = np.asarray(pairs, dtype=np.intp).reshape(len(pairs), 2)
+    return _edge_paulis(n_qubits, pairs_arr[:, 0], pairs_arr[:, 1], paulis)
+
+
+def _edge_paulis(
+    n_qubits: int,
+    first_qubits: np.ndarray,
+    second_qubits: np.ndarray,
+    paulis: list[str],
+) -> list[str]:
+    """Two-site Pauli strings for aligned qubit index arrays.
+
+    One row per (edge, pauli) with edges varying slowest; both sites are
+    scattered into an 'I'-filled uint8 buffer with one fancy-index write each.
+    """
+    first = np.frombuffer("".join(pp[0] for pp in paulis).encode("ascii"), dtype=np.uint8)
+    second = np.frombuffer("".join(pp[1] for pp in paulis).encode("ascii"), dtype=np.uint8)
+    out = np.empty((len(first_qubits) * len(paulis), n_qubits), dtype=np.uint8)
+
+    if HAS_NUMBA:
+        _emit_edge_paulis(
+            np.asarray(first_qubits, dtype=np.intp),
+            np.asarray(second_qubits, dtype=np.intp),
+            first,
+            second,
+            out,
+        )
+    else:
+        rows = np.arange(len(out))
+        edge_idx, pauli_idx = np.divmod(rows, len(paulis))
+        out.fill(ord("I"))
+        out[rows, first_qubits[edge_idx]] = first[pauli_idx]
+        out[rows, second_qubits[edge_idx]] = second[pauli_idx]
+
+    return _rows_to_strings(out)
+
+
+@njit(cache=True)
+def _emit_edge_paulis(
+    first_qubits: np.ndarray,
+    second_qubits: np.ndarray,
+    first: np.ndarray,
+    second: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Fill ``out`` row by row with two-site Paulis (compiled when Numba is present)."""
+    n_paulis = len(first)
+    row = 0
+    for e in range(len(first_qubits)):
+        for p in range(n_paulis):
+            for q in range(out.shape[1]):
+                out[row, q] = 73  # 'I'
+            out[row, first_qubits[e]] = first[p]
+            out[row, second_qubits[e]] = second[p]
+            row += 1
+
+
+def _merge_weight_classes(*classes: tuple[int, Sequence[str]]) -> list[str]:
+    """Concatenate duplicate-free term lists, each of a single Pauli weight.
+
+    Strings of different weight can never be equal, so a list is only
+    filtered against earlier lists of the same weight (first occurrence
+    wins); everything else is appended without hashing.
+    """
+    merged: list[str] = []
+    by_weight: dict[int, list[Sequence[str]]] = {}
+    for weight, terms in classes:
+        earlier = by_weight.setdefault(weight, [])
+        if earlier:
+            seen = {term for prev in earlier for term in prev}
+            terms = [term for term in terms if term not in seen]
+        merged.extend(terms)
+        earlier.append(terms)
+    return merged
 
 
 def generate_single_qubit(n_qubits: int, paulis: str = "XYZ") -> list[str]:
@@ -311,13 +626,21 @@ def generate_single_qubit(n_qubits: int, paulis: str = "XYZ") -> list[str]:
     Returns:
         List of single-qubit Pauli strings
     """
+    return list(_single_qubit_cached(n_qubits, paulis))
+
+
+@lru_cache(maxsize=64)
+def _single_qubit_cached(n_qubits: int, paulis: str) -> tuple[str, ...]:
+    """Memoized body of generate_single_qubit."""
+    # Mutate one identity template in place and decode it once per term
+    template = bytearray(b"I" * n_qubits)
     result = []
     for i in range(n_qubits):
-        for p in paulis:
-            pauli_list = ["I"] * n_qubits
-            pauli_list[i] = p
-            result.append("".join(pauli_list))
-    return result
+        for p in paulis.encode("ascii"):
+            template[i] = p
+            result.append(template.decode("ascii"))
+        template[i] = ord("I")
+    return tuple(result)
 
 
 def generate_global_pauli(n_qubits: int, paulis: str = "XYZ") -> list[str]:
@@ -358,83 +681,167 @@ def sample_random_paulis(
     Returns:
         List of sampled Pauli strings
     """
+    return list(_sample_random_paulis_cached(n_qubits, n_samples, strategy, max_weight, seed))
+
+
+@lru_cache(maxsize=32)
+def _sample_random_paulis_cached(
+    n_qubits: int,
+    n_samples: int,
+    strategy: str,
+    max_weight: int | None,
+    seed: int,
+) -> tuple[str, ...]:
+    """Memoized body of sample_random_paulis (suite makers reuse identical seeds)."""
     rng = np.random.default_rng(seed)
     if max_weight is None:
         max_weight = n_qubits
 
-    sampled = set()
-    pauli_ops = ["X", "Y", "Z"]
+    # Insertion-ordered dict used as a set: deterministic output order
+    sampled: dict[str, None] = {}
 
     if strategy == "stratified":
-        samples_per_k = max(1, n_samples // max_weight)
-        remainder = n_samples - samples_per_k * max_weight
-
-        for k in range(1, max_weight + 1):
-            n_at_k = samples_per_k + (1 if k <= remainder else 0)
-            max_possible = comb(n_qubits, k) * (3**k)
-
-            if n_at_k >= max_possible:
-                sampled.update(generate_all_k_local(n_qubits, k))
-            else:
-                count = 0
-                attempts = 0
-                while count < n_at_k and attempts < n_at_k * 100:
-                    positions = tuple(sorted(rng.choice(n_qubits, k, replace=False)))
-                    ops = tuple(rng.choice(pauli_ops, k))
-                    pauli_list = ["I"] * n_qubits
-                    for pos, op in zip(positions, ops, strict=False):
-                        pauli_list[pos] = op
-                    pauli = "".join(pauli_list)
-                    if pauli not in sampled:
-                        sampled.add(pauli)
-                        count += 1
-                    attempts += 1
+        strata, first_weights = _stratified_plan(n_qubits, n_samples, max_weight)
+
+        # First draw for every sampled stratum in one batch, rows grouped by weight
+        drawn = _draw_weighted_paulis(rng, n_qubits, first_weights)
+
+        offset = 0
+        for k, n_at_k, batch in strata:
+            if batch is None:
+                sampled.update(dict.fromkeys(generate_all_k_local(n_qubits, k)))
+                continue
+            _fill_unique(
+                sampled,
+                len(sampled) + n_at_k,
+                n_at_k * 100,
+                lambda size, k=k: _draw_weighted_paulis(
+                    rng, n_qubits, np.full(size, k, dtype=np.intp)
+                ),
+                first_batch=drawn[offset : offset + batch],
+            )
+            offset += batch
 
     elif strategy == "uniform":
-        attempts = 0
-        while len(sampled) < n_samples and attempts < n_samples * 100:
-            pauli_list = rng.choice(["I", "X", "Y", "Z"], n_qubits)
-            pauli = "".join(pauli_list)
-            weight = sum(1 for c in pauli if c != "I")
-            if 0 < weight <= max_weight and pauli not in sampled:
-                sampled.add(pauli)
-            attempts += 1
+
+        def draw_uniform(size: int) -> list[str]:
+            codes = rng.integers(0, 4, size=(size, n_qubits), dtype=np.uint8)
+            weights = np.count_nonzero(codes, axis=1)
+            codes = codes[(weights > 0) & (weights <= max_weight)]
+            return _rows_to_strings(_PAULI_ASCII[codes])
+
+        _fill_unique(sampled, n_samples, n_samples * 100, draw_uniform)
 
     elif strategy == "importance":
         weights = np.array([1.0 / (3**k) for k in range(1, max_weight + 1)])
         weights /= weights.sum()
 
-        attempts = 0
-        while len(sampled) < n_samples and attempts < n_samples * 100:
-            k = rng.choice(range(1, max_weight + 1), p=weights)
-            positions = tuple(sorted(rng.choice(n_qubits, k, replace=False)))
-            ops = tuple(rng.choice(pauli_ops, k))
-            pauli_list = ["I"] * n_qubits
-            for pos, op in zip(positions, ops, strict=False):
-                pauli_list[pos] = op
-            pauli = "".join(pauli_list)
-            if pauli not in sampled:
-                sampled.add(pauli)
-            attempts += 1
+        _fill_unique(
+            sampled,
+            n_samples,
+            n_samples * 100,
+            lambda size: _draw_weighted_paulis(
+                rng, n_qubits, rng.choice(np.arange(1, max_weight + 1), size=size, p=weights)
+            ),
+        )
 
     elif strategy == "uniform_weight":
-        attempts = 0
-        while len(sampled) < n_samples and attempts < n_samples * 100:
-            k = rng.integers(1, max_weight + 1)
-            positions = tuple(sorted(rng.choice(n_qubits, k, replace=False)))
-            ops = tuple(rng.choice(pauli_ops, k))
-            pauli_list = ["I"] * n_qubits
-            for pos, op in zip(positions, ops, strict=False):
-                pauli_list[pos] = op
-            pauli = "".join(pauli_list)
-            if pauli not in sampled:
-                sampled.add(pauli)
-            attempts += 1
+        _fill_unique(
+            sampled,
+            n_samples,
+            n_samples * 100,
+            lambda size: _draw_weighted_paulis(
+                rng, n_qubits, rng.integers(1, max_weight + 1, size=size)
+            ),
+        )
 
     else:
         raise ValueError(f"Unknown sampling strategy: {strategy}")
 
-    return list(sampled)
+    return tuple(sampled)
+
+
+@lru_cache(maxsize=64)
+def _stratified_plan(
+    n_qubits: int, n_samples: int, max_weight: int
+) -> tuple[tuple[tuple[int, int, int | None], ...], np.ndarray]:
+    """Seed-independent setup of the stratified sampler.
+
+    Splits ``n_samples`` evenly over weights 1..max_weight (Hamilton
+    apportionment with equal shares, so the remainder goes to the lowest
+    weights) and decides per weight whether the class is small enough to
+    enumerate.
+
+    Returns:
+        ``(strata, first_weights)`` where each stratum is ``(weight, quota,
+        first batch size or None to enumerate the whole class)`` and
+        ``first_weights`` is the read-only per-row weight vector of the
+        batched first draw.
+    """
+    samples_per_k = max(1, n_samples // max_weight)
+    remainder = n_samples - samples_per_k * max_weight
+
+    strata: list[tuple[int, int, int | None]] = []
+    for k in range(1, max_weight + 1):
+        n_at_k = samples_per_k + (1 if k <= remainder else 0)
+        if n_at_k >= comb(n_qubits, k) * (3**k):
+            strata.append((k, n_at_k, None))
+        else:
+            strata.append((k, n_at_k, min(max(2 * n_at_k, 16), n_at_k * 100)))
+
+    sampled_strata = [(k, batch) for k, _, batch in strata if batch is not None]
+    first_weights = np.repeat(
+        np.array([k for k, _ in sampled_strata], dtype=np.intp),
+        [batch for _, batch in sampled_strata],
+    )
+    first_weights.flags.writeable = False
+    return tuple(strata), first_weights
+
+
+def _draw_weighted_paulis(
+    rng: np.random.Generator,
+    n_qubits: int,
+    weights: np.ndarray,
+) -> list[str]:
+    """Draw one random Pauli string per entry of ``weights`` in a single batch.
+
+    Support positions are chosen uniformly without replacement by ranking a
+    row of random keys (NumPy has no batched no-replacement choice); each
+    supported qubit gets X, Y or Z uniformly.
+    """
+    size = len(weights)
+    ranks = rng.random((size, n_qubits)).argsort(axis=1).argsort(axis=1)
+    ops = rng.integers(1, 4, size=(size, n_qubits), dtype=np.uint8)
+    codes = np.where(ranks < np.asarray(weights)[:, None], ops, 0)
+    return _rows_to_strings(_PAULI_ASCII[codes])
+
+
+def _fill_unique(
+    sampled: dict[str, None],
+    target_size: int,
+    max_attempts: int,
+    draw_batch: Callable[[int], list[str]],
+    first_batch: list[str] | None = None,
+) -> None:
+    """Add unique draws to ``sampled`` until it holds ``target_size`` strings.
+
+    Draws are requested in batches sized to the remaining deficit; every
+    drawn row counts as one attempt towards ``max_attempts``. A pre-drawn
+    ``first_batch`` is consumed before any further draws.
+    """
+    attempts = 0
+    batch = first_batch
+    while len(sampled) < target_size and attempts < max_attempts:
+        if batch is None:
+            batch_size = min(max(2 * (target_size - len(sampled)), 16), max_attempts - attempts)
+            batch = draw_batch(batch_size)
+        for pauli in batch:
+            if pauli not in sampled:
+                sampled[pauli] = None
+                if len(sampled) >= target_size:
+                    break
+        attempts += len(batch)
+        batch = None
 
 
 # =============================================================================
@@ -442,262 +849,443 @@ def sample_random_paulis(
 # =============================================================================
 
 
-def make_ghz_suites(n_qubits: int, seed: int = 42) -> dict[str, ObservableSuite]:
-    """Create benchmark suites for GHZ state verification.
-
-    GHZ state: |00...0⟩ + |11...1⟩ / √2
+class SuiteBundle(MutableMapping[str, ObservableSuite]):
+    """Mapping of suite name -> ObservableSuite that builds suites on first access.
 
-    Suites:
-        workload_stabilizers: GHZ stabilizer generators (X^n, Z_i Z_j pairs)
-        stress_random_1000: 1000 random observables, stratified by weight
-        commuting_z_only: All-Z correlators (grouped measurement advantage)
-        posthoc_library: 2000 observables for post-hoc querying tests
+    The circuit-specific makers return bundles so that callers who only
+    query one suite never pay for sampling the others. Builders return
+    memoized suites shared across calls; the bundle deep-copies each one
+    on first access, so the suites it hands out can be modified freely.
     """
-    suites = {}
 
-    # === WORKLOAD: GHZ Stabilizers ===
+    def __init__(self, builders: Mapping[str, Callable[[], ObservableSuite]]) -> None:
+        self._entries: dict[str, ObservableSuite | Callable[[], ObservableSuite]] = dict(builders)
+
+    def __getitem__(self, name: str) -> ObservableSuite:
+        entry = self._entries[name]
+        if not isinstance(entry, ObservableSuite):
+            entry = self._entries[name] = deepcopy(entry())
+        return entry
+
+    def __setitem__(self, name: str, suite: ObservableSuite) -> None:
+        self._entries[name] = suite
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        built = [
+            name for name, entry in self._entries.items() if isinstance(entry, ObservableSuite)
+        ]
+        return f"SuiteBundle(suites={list(self._entries)}, built={built})"
+
+    def build_all(self, max_workers: int | None = None) -> SuiteBundle:
+        """Build every pending suite, optionally on a thread pool.
+
+        Each builder samples with its own fixed seed, so parallel builds give
+        the same suites as sequential access.
+
+        Args:
+            max_workers: Optional number of worker threads; sequential if unset or 1.
+
+        Returns:
+            This bundle, for chaining.
+        """
+        pending = [
+            name for name, entry in self._entries.items() if not isinstance(entry, ObservableSuite)
+        ]
+        if max_workers and max_workers > 1 and len(pending) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self.__getitem__, pending))
+        else:
+            for name in pending:
+                self[name]
+        return self
+
+
+@lru_cache(maxsize=32)
+def _stress_suite(
+    name: str,
+    suite_type: SuiteType,
+    n_qubits: int,
+    n_samples: int,
+    seed: int,
+    description: str,
+) -> ObservableSuite:
+    """Suite of stratified random Paulis (stress and post-hoc libraries). Memoized."""
+    return ObservableSuite.from_pauli_strings(
+        name=name,
+        suite_type=suite_type,
+        pauli_strings=sample_random_paulis(n_qubits, n_samples, strategy="stratified", seed=seed),
+        description=description,
+    )
+
+
+# Seed-independent suites are built once per qubit count and shared by every
+# bundle (and seed) that binds them.
+
+
+@lru_cache(maxsize=32)
+def _ghz_workload_stabilizers(n_qubits: int) -> ObservableSuite:
     # Stabilizers: X^⊗n, Z_i Z_{i+1} for all i (and optionally all Z_i Z_j)
     stabilizer_paulis = []
     stabilizer_paulis.append("X" * n_qubits)  # Global X parity
     stabilizer_paulis.extend(generate_zz_correlators(n_qubits, graph="all"))  # All ZZ pairs
 
-    suites["workload_stabilizers"] = ObservableSuite.from_pauli_strings(
+    return ObservableSuite.from_pauli_strings(
         name="workload_stabilizers",
         suite_type=SuiteType.WORKLOAD,
         pauli_strings=stabilizer_paulis,
         description=f"GHZ stabilizer generators: X^{n_qubits} + all Z_i Z_j pairs",
     )
 
-    # === STRESS: Random 1000 observables ===
-    stress_paulis = sample_random_paulis(n_qubits, 1000, strategy="stratified", seed=seed)
-    suites["stress_random_1000"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_1000",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="1000 random Paulis, stratified by weight",
-    )
 
-    # === COMMUTING: Z-only correlators ===
-    z_paulis = generate_zz_correlators(n_qubits, graph="all")
-    z_paulis.extend(generate_single_qubit(n_qubits, paulis="Z"))
-    z_paulis.append("Z" * n_qubits)
+@lru_cache(maxsize=32)
+def _ghz_commuting_z_only(n_qubits: int) -> ObservableSuite:
+    # ZZ pairs, then single Z, then Z^n, filled into one SoA
+    x_words, z_words = _emit_up_to_2_local_soa(n_qubits, "Z", pairs_first=True)
 
-    suites["commuting_z_only"] = ObservableSuite.from_pauli_strings(
+    return ObservableSuite.from_soa(
         name="commuting_z_only",
         suite_type=SuiteType.COMMUTING,
-        pauli_strings=list(set(z_paulis)),  # Deduplicate
+        x_words=x_words,
+        z_words=z_words,
+        n_qubits=n_qubits,
         description="All-Z observables (fully commuting, grouped measurement advantage)",
     )
 
-    # === POSTHOC: Large library for querying tests ===
-    posthoc_paulis = sample_random_paulis(n_qubits, 2000, strategy="stratified", seed=seed + 1000)
-    suites["posthoc_library"] = ObservableSuite.from_pauli_strings(
-        name="posthoc_library",
-        suite_type=SuiteType.POSTHOC,
-        pauli_strings=posthoc_paulis,
-        description="2000 observables for post-hoc querying benchmark",
-    )
-
-    return suites
-
 
-def make_bell_suites(n_pairs: int, seed: int = 42) -> dict[str, ObservableSuite]:
-    """Create benchmark suites for Bell pair verification.
-
-    Bell pairs: ⊗_i (|00⟩ + |11⟩)_i / √2
+@lru_cache(maxsize=32)
+def _bell_workload_pair_correlations(n_pairs: int) -> ObservableSuite:
+    first_qubits = 2 * np.arange(n_pairs)
+    pair_paulis = _edge_paulis(2 * n_pairs, first_qubits, first_qubits + 1, ["XX", "YY", "ZZ"])
 
-    Suites:
-        workload_pair_correlations: XX, YY, ZZ on each Bell pair
-        diagnostics_single_qubit: Single-qubit Z for readout diagnostics
-        diagnostics_cross_pair: Cross-pair correlators (crosstalk detection)
-        stress_random_1000: Random observables
-    """
-    n_qubits = 2 * n_pairs
-    suites = {}
-
-    # === WORKLOAD: Pair correlations ===
-    pair_paulis = []
-    for i in range(n_pairs):
-        q1, q2 = 2 * i, 2 * i + 1
-        for pp in ["XX", "YY", "ZZ"]:
-            pauli_list = ["I"] * n_qubits
-            pauli_list[q1] = pp[0]
-            pauli_list[q2] = pp[1]
-            pair_paulis.append("".join(pauli_list))
-
-    suites["workload_pair_correlations"] = ObservableSuite.from_pauli_strings(
+    return ObservableSuite.from_pauli_strings(
         name="workload_pair_correlations",
         suite_type=SuiteType.WORKLOAD,
         pauli_strings=pair_paulis,
         description=f"XX, YY, ZZ on each of {n_pairs} Bell pairs",
     )
 
-    # === DIAGNOSTICS: Single-qubit Z ===
-    single_z = generate_single_qubit(n_qubits, paulis="Z")
-    suites["diagnostics_single_qubit"] = ObservableSuite.from_pauli_strings(
+
+@lru_cache(maxsize=32)
+def _bell_diagnostics_single_qubit(n_pairs: int) -> ObservableSuite:
+    return ObservableSuite.from_pauli_strings(
         name="diagnostics_single_qubit",
         suite_type=SuiteType.DIAGNOSTIC,
-        pauli_strings=single_z,
+        pauli_strings=generate_single_qubit(2 * n_pairs, paulis="Z"),
         description="Single-qubit Z for readout bias diagnostics",
     )
 
-    # === DIAGNOSTICS: Cross-pair correlators ===
-    cross_paulis = []
-    for i in range(n_pairs):
-        for j in range(i + 1, n_pairs):
-            # Z on first qubit of pair i, Z on first qubit of pair j
-            pauli_list = ["I"] * n_qubits
-            pauli_list[2 * i] = "Z"
-            pauli_list[2 * j] = "Z"
-            cross_paulis.append("".join(pauli_list))
-
-    if cross_paulis:
-        suites["diagnostics_cross_pair"] = ObservableSuite.from_pauli_strings(
-            name="diagnostics_cross_pair",
-            suite_type=SuiteType.DIAGNOSTIC,
-            pauli_strings=cross_paulis,
-            description="Cross-pair ZZ correlators for crosstalk detection",
-        )
-
-    # === STRESS: Random 1000 ===
-    stress_paulis = sample_random_paulis(n_qubits, 1000, strategy="stratified", seed=seed)
-    suites["stress_random_1000"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_1000",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="1000 random Paulis, stratified by weight",
-    )
-
-    return suites
 
+@lru_cache(maxsize=32)
+def _bell_diagnostics_cross_pair(n_pairs: int) -> ObservableSuite:
+    # Z on first qubit of pair i, Z on first qubit of pair j, for all i < j
+    pair_i, pair_j = np.triu_indices(n_pairs, k=1)
+    cross_paulis = _edge_paulis(2 * n_pairs, 2 * pair_i, 2 * pair_j, ["ZZ"])
 
-def make_ising_suites(n_qubits: int, seed: int = 42) -> dict[str, ObservableSuite]:
-    """Create benchmark suites for Ising/Trotter physics.
-
-    Transverse-field Ising: H = -J Σ Z_i Z_{i+1} - h Σ X_i
-
-    Suites:
-        workload_energy: Hamiltonian terms (ZZ chain + X single-qubit)
-        workload_correlations: Z_i Z_j at multiple distances
-        stress_random_1000: Random observables
-    """
-    suites = {}
+    return ObservableSuite.from_pauli_strings(
+        name="diagnostics_cross_pair",
+        suite_type=SuiteType.DIAGNOSTIC,
+        pauli_strings=cross_paulis,
+        description="Cross-pair ZZ correlators for crosstalk detection",
+    )
 
-    # === WORKLOAD: Energy (Hamiltonian terms) ===
-    energy_paulis = []
-    energy_weights = {}
 
-    # ZZ chain terms (J = 1.0)
-    zz_chain = generate_zz_correlators(n_qubits, graph="chain")
-    for ps in zz_chain:
-        energy_paulis.append(ps)
-        energy_weights[ps] = -1.0  # -J
+@lru_cache(maxsize=32)
+def _ising_workload_energy(n_qubits: int) -> ObservableSuite:
+    # ZZ chain terms (J = 1.0) followed by X single-qubit terms (h = 0.5),
+    # filled into one SoA
+    n_bonds = max(n_qubits - 1, 0)
+    x_words, z_words = _paulis_soa(n_qubits, n_bonds + n_qubits)
+    bonds = np.arange(n_bonds)
+    _set_soa_sites(x_words, z_words, bonds, bonds, "Z")
+    _set_soa_sites(x_words, z_words, bonds, bonds + 1, "Z")
+    qubits = np.arange(n_qubits)
+    _set_soa_sites(x_words, z_words, n_bonds + qubits, qubits, "X")
 
-    # X single-qubit terms (h = 0.5)
-    x_single = generate_single_qubit(n_qubits, paulis="X")
-    for ps in x_single:
-        energy_paulis.append(ps)
-        energy_weights[ps] = -0.5  # -h
+    # Coefficients aligned with the SoA rows
+    energy_weights = np.full(n_bonds + n_qubits, -0.5)  # -h
+    energy_weights[:n_bonds] = -1.0  # -J
 
-    suites["workload_energy"] = ObservableSuite.from_pauli_strings(
+    return ObservableSuite.from_soa(
         name="workload_energy",
         suite_type=SuiteType.WORKLOAD,
-        pauli_strings=energy_paulis,
+        x_words=x_words,
+        z_words=z_words,
+        n_qubits=n_qubits,
         weights=energy_weights,
         objective=ObjectiveType.WEIGHTED_SUM,
         description="Ising Hamiltonian: -J Σ Z_i Z_{i+1} - h Σ X_i",
     )
 
-    # === WORKLOAD: Correlation functions ===
-    corr_paulis = []
-    for r in range(1, min(n_qubits, 5)):  # Distances 1, 2, 3, 4
-        for i in range(n_qubits - r):
-            pauli_list = ["I"] * n_qubits
-            pauli_list[i] = "Z"
-            pauli_list[i + r] = "Z"
-            corr_paulis.append("".join(pauli_list))
 
-    suites["workload_correlations"] = ObservableSuite.from_pauli_strings(
+@lru_cache(maxsize=32)
+def _ising_workload_correlations(n_qubits: int) -> ObservableSuite:
+    distances = np.arange(1, min(n_qubits, 5))  # Distances 1, 2, 3, 4
+    counts = n_qubits - distances
+    offsets = np.repeat(distances, counts)
+    # Site index restarts at 0 for each distance block
+    sites = np.arange(len(offsets)) - np.repeat(np.cumsum(counts) - counts, counts)
+    # Every (site, site + r) pair is distinct, so no deduplication is needed
+    corr_paulis = _edge_paulis(n_qubits, sites, sites + offsets, ["ZZ"])
+
+    return ObservableSuite.from_pauli_strings(
         name="workload_correlations",
         suite_type=SuiteType.WORKLOAD,
-        pauli_strings=list(set(corr_paulis)),
+        pauli_strings=corr_paulis,
         description="Z_i Z_j correlators at distances r=1,2,3,4",
     )
 
-    # === STRESS: Random 1000 ===
-    stress_paulis = sample_random_paulis(n_qubits, 1000, strategy="stratified", seed=seed)
-    suites["stress_random_1000"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_1000",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="1000 random Paulis, stratified by weight",
+
+def _qaoa_cost_suite(
+    n_qubits: int, name: str, suite_type: SuiteType, description: str, **kwargs: Any
+) -> ObservableSuite:
+    # CRITICAL: Include wrap-around edge (n-1, 0)!
+    edge_paulis = generate_zz_correlators(n_qubits, graph="ring")
+    # (1 - ⟨ZZ⟩)/2, so weight is -0.5 on ⟨ZZ⟩; one coefficient per edge_paulis row
+    edge_weights = np.full(len(edge_paulis), 0.5)
+
+    return ObservableSuite.from_pauli_strings(
+        name=name,
+        suite_type=suite_type,
+        pauli_strings=edge_paulis,
+        weights=edge_weights,
+        objective=ObjectiveType.WEIGHTED_SUM,
+        description=description,
+        **kwargs,
     )
 
-    return suites
 
+@lru_cache(maxsize=32)
+def _qaoa_workload_cost(n_qubits: int) -> ObservableSuite:
+    return _qaoa_cost_suite(
+        n_qubits,
+        "workload_cost",
+        SuiteType.WORKLOAD,
+        f"QAOA ring cost: {n_qubits} edges INCLUDING wrap (n-1,0)",
+        metadata={"graph": "ring", "includes_wrap": True},
+    )
 
-def make_qaoa_ring_suites(n_qubits: int, seed: int = 42) -> dict[str, ObservableSuite]:
-    """Create benchmark suites for QAOA MAX-CUT on ring graph.
 
-    Ring graph: edges (i, i+1) for i=0..n-2, PLUS wrap-around (n-1, 0)
+@lru_cache(maxsize=32)
+def _qaoa_commuting_cost(n_qubits: int) -> ObservableSuite:
+    # This shows where grouped direct measurement dominates
+    return _qaoa_cost_suite(
+        n_qubits,
+        "commuting_cost",
+        SuiteType.COMMUTING,
+        "Same as workload_cost (all ZZ commute → grouped wins)",
+    )
 
-    Cost function: C = Σ_e (1 - ⟨Z_i Z_j⟩) / 2
 
-    Suites:
-        workload_cost: All edge ZZ terms (INCLUDING wrap-around!)
-        commuting_z_only: Same as workload (all commute in Z basis)
-        stress_random_1000: Random observables
-    """
-    suites = {}
+@lru_cache(maxsize=32)
+def _phase_workload_signal(n_qubits: int) -> ObservableSuite:
+    # CRITICAL: Always include Y^n for all n >= 2
+    return ObservableSuite.from_pauli_strings(
+        name="workload_phase_signal",
+        suite_type=SuiteType.WORKLOAD,
+        pauli_strings=["X" * n_qubits, "Y" * n_qubits],
+        description=f"Phase sensing: X^{n_qubits} and Y^{n_qubits} (always included)",
+        metadata={"includes_Y_global": True},
+    )
 
-    # === WORKLOAD: Cost Hamiltonian ===
-    # CRITICAL: Include wrap-around edge (n-1, 0)!
-    edge_paulis = generate_zz_correlators(n_qubits, graph="ring")
-    edge_weights = dict.fromkeys(edge_paulis, 0.5)  # (1 - ⟨ZZ⟩)/2, so weight is -0.5 on ⟨ZZ⟩
 
-    suites["workload_cost"] = ObservableSuite.from_pauli_strings(
-        name="workload_cost",
+@lru_cache(maxsize=32)
+def _phase_workload_stabilizers(n_qubits: int) -> ObservableSuite:
+    phase_paulis = ("X" * n_qubits, "Y" * n_qubits)
+    stabilizer_paulis = _merge_weight_classes(
+        (n_qubits, phase_paulis), (2, _zz_correlators_cached(n_qubits, "chain"))
+    )
+
+    return ObservableSuite.from_pauli_strings(
+        name="workload_stabilizers",
         suite_type=SuiteType.WORKLOAD,
-        pauli_strings=edge_paulis,
-        weights=edge_weights,
-        objective=ObjectiveType.WEIGHTED_SUM,
-        description=f"QAOA ring cost: {n_qubits} edges INCLUDING wrap (n-1,0)",
-        metadata={"graph": "ring", "includes_wrap": True},
+        pauli_strings=stabilizer_paulis,
+        description="GHZ stabilizers for fidelity estimation",
     )
 
-    # === COMMUTING: Same terms (all ZZ commute) ===
-    # This shows where grouped direct measurement dominates
-    suites["commuting_cost"] = ObservableSuite.from_pauli_strings(
-        name="commuting_cost",
-        suite_type=SuiteType.COMMUTING,
-        pauli_strings=edge_paulis,
-        weights=edge_weights,
-        objective=ObjectiveType.WEIGHTED_SUM,
-        description="Same as workload_cost (all ZZ commute → grouped wins)",
+
+def make_ghz_suites(n_qubits: int, seed: int = 42) -> SuiteBundle:
+    """Create benchmark suites for GHZ state verification.
+
+    GHZ state: |00...0⟩ + |11...1⟩ / √2
+
+    Suites:
+        workload_stabilizers: GHZ stabilizer generators (X^n, Z_i Z_j pairs)
+        stress_random_1000: 1000 random observables, stratified by weight
+        commuting_z_only: All-Z correlators (grouped measurement advantage)
+        posthoc_library: 2000 observables for post-hoc querying tests
+
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
+    """
+    return SuiteBundle(
+        {
+            # === WORKLOAD: GHZ Stabilizers ===
+            "workload_stabilizers": partial(_ghz_workload_stabilizers, n_qubits),
+            # === STRESS: Random 1000 observables ===
+            "stress_random_1000": partial(
+                _stress_suite,
+                "stress_random_1000",
+                SuiteType.STRESS,
+                n_qubits,
+                1000,
+                seed,
+                "1000 random Paulis, stratified by weight",
+            ),
+            # === COMMUTING: Z-only correlators ===
+            "commuting_z_only": partial(_ghz_commuting_z_only, n_qubits),
+            # === POSTHOC: Large library for querying tests ===
+            "posthoc_library": partial(
+                _stress_suite,
+                "posthoc_library",
+                SuiteType.POSTHOC,
+                n_qubits,
+                2000,
+                seed + 1000,
+                "2000 observables for post-hoc querying benchmark",
+            ),
+        }
     )
 
-    # === STRESS: Random mixed to show where shadows helps ===
-    stress_paulis = sample_random_paulis(n_qubits, 1000, strategy="stratified", seed=seed)
-    suites["stress_random_1000"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_1000",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="1000 random Paulis (non-commuting → shadows may help)",
+
+def make_bell_suites(n_pairs: int, seed: int = 42) -> SuiteBundle:
+    """Create benchmark suites for Bell pair verification.
+
+    Bell pairs: ⊗_i (|00⟩ + |11⟩)_i / √2
+
+    Suites:
+        workload_pair_correlations: XX, YY, ZZ on each Bell pair
+        diagnostics_single_qubit: Single-qubit Z for readout diagnostics
+        diagnostics_cross_pair: Cross-pair correlators (crosstalk detection)
+        stress_random_1000: Random observables
+
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
+    """
+    builders: dict[str, Callable[[], ObservableSuite]] = {
+        # === WORKLOAD: Pair correlations ===
+        "workload_pair_correlations": partial(_bell_workload_pair_correlations, n_pairs),
+        # === DIAGNOSTICS: Single-qubit Z ===
+        "diagnostics_single_qubit": partial(_bell_diagnostics_single_qubit, n_pairs),
+    }
+    # === DIAGNOSTICS: Cross-pair correlators ===
+    # Cross-pair terms only exist with at least two pairs
+    if n_pairs > 1:
+        builders["diagnostics_cross_pair"] = partial(_bell_diagnostics_cross_pair, n_pairs)
+    # === STRESS: Random 1000 ===
+    builders["stress_random_1000"] = partial(
+        _stress_suite,
+        "stress_random_1000",
+        SuiteType.STRESS,
+        2 * n_pairs,
+        1000,
+        seed,
+        "1000 random Paulis, stratified by weight",
     )
+    return SuiteBundle(builders)
 
-    # === POSTHOC: Library for "measure once, query later" ===
-    posthoc_paulis = sample_random_paulis(n_qubits, 2000, strategy="stratified", seed=seed + 1000)
-    suites["posthoc_library"] = ObservableSuite.from_pauli_strings(
-        name="posthoc_library",
-        suite_type=SuiteType.POSTHOC,
-        pauli_strings=posthoc_paulis,
-        description="2000 observables for post-hoc querying benchmark",
+
+def make_ising_suites(n_qubits: int, seed: int = 42) -> SuiteBundle:
+    """Create benchmark suites for Ising/Trotter physics.
+
+    Transverse-field Ising: H = -J Σ Z_i Z_{i+1} - h Σ X_i
+
+    Suites:
+        workload_energy: Hamiltonian terms (ZZ chain + X single-qubit)
+        workload_correlations: Z_i Z_j at multiple distances
+        stress_random_1000: Random observables
+
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
+    """
+    return SuiteBundle(
+        {
+            # === WORKLOAD: Energy (Hamiltonian terms) ===
+            "workload_energy": partial(_ising_workload_energy, n_qubits),
+            # === WORKLOAD: Correlation functions ===
+            "workload_correlations": partial(_ising_workload_correlations, n_qubits),
+            # === STRESS: Random 1000 ===
+            "stress_random_1000": partial(
+                _stress_suite,
+                "stress_random_1000",
+                SuiteType.STRESS,
+                n_qubits,
+                1000,
+                seed,
+                "1000 random Paulis, stratified by weight",
+            ),
+        }
     )
 
-    return suites
 
+def make_qaoa_ring_suites(n_qubits: int, seed: int = 42) -> SuiteBundle:
+    """Create benchmark suites for QAOA MAX-CUT on ring graph.
+
+    Ring graph: edges (i, i+1) for i=0..n-2, PLUS wrap-around (n-1, 0)
+
+    Cost function: C = Σ_e (1 - ⟨Z_i Z_j⟩) / 2
 
-def make_phase_sensing_suites(n_qubits: int, seed: int = 42) -> dict[str, ObservableSuite]:
+    Suites:
+        workload_cost: All edge ZZ terms (INCLUDING wrap-around!)
+        commuting_z_only: Same as workload (all commute in Z basis)
+        stress_random_1000: Random observables
+
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
+    """
+    return SuiteBundle(
+        {
+            # === WORKLOAD: Cost Hamiltonian ===
+            "workload_cost": partial(_qaoa_workload_cost, n_qubits),
+            # === COMMUTING: Same terms (all ZZ commute) ===
+            "commuting_cost": partial(_qaoa_commuting_cost, n_qubits),
+            # === STRESS: Random mixed to show where shadows helps ===
+            "stress_random_1000": partial(
+                _stress_suite,
+                "stress_random_1000",
+                SuiteType.STRESS,
+                n_qubits,
+                1000,
+                seed,
+                "1000 random Paulis (non-commuting → shadows may help)",
+            ),
+            # === POSTHOC: Library for "measure once, query later" ===
+            "posthoc_library": partial(
+                _stress_suite,
+                "posthoc_library",
+                SuiteType.POSTHOC,
+                n_qubits,
+                2000,
+                seed + 1000,
+                "2000 observables for post-hoc querying benchmark",
+            ),
+        }
+    )
+
+
+def make_phase_sensing_suites(n_qubits: int, seed: int = 42) -> SuiteBundle:
     """Create benchmark suites for GHZ phase sensing / metrology.
 
     GHZ state with phase: (|00...0⟩ + e^{inφ}|11...1⟩) / √2
@@ -710,43 +1298,64 @@ def make_phase_sensing_suites(n_qubits: int, seed: int = 42) -> dict[str, Observ
         workload_phase_signal: X^n and Y^n (ALWAYS included for n >= 2)
         workload_stabilizers: Full GHZ stabilizer set
         stress_random_500: Random observables
+
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
     """
-    suites = {}
+    return SuiteBundle(
+        {
+            # === WORKLOAD: Phase signal observables ===
+            "workload_phase_signal": partial(_phase_workload_signal, n_qubits),
+            # === WORKLOAD: Full stabilizers (for fidelity estimation) ===
+            "workload_stabilizers": partial(_phase_workload_stabilizers, n_qubits),
+            # === STRESS: Random 500 ===
+            "stress_random_500": partial(
+                _stress_suite,
+                "stress_random_500",
+                SuiteType.STRESS,
+                n_qubits,
+                500,
+                seed,
+                "500 random Paulis for scaling test",
+            ),
+        }
+    )
 
-    # === WORKLOAD: Phase signal observables ===
-    # CRITICAL: Always include Y^n for all n >= 2
-    phase_paulis = ["X" * n_qubits, "Y" * n_qubits]
 
-    suites["workload_phase_signal"] = ObservableSuite.from_pauli_strings(
-        name="workload_phase_signal",
+@lru_cache(maxsize=32)
+def _chemistry_workload_energy(
+    hamiltonian_terms: tuple[str, ...],
+    hamiltonian_coeffs: tuple[float, ...],
+    molecule_name: str,
+) -> ObservableSuite:
+    weights = dict(zip(hamiltonian_terms, hamiltonian_coeffs, strict=False))
+    return ObservableSuite.from_pauli_strings(
+        name="workload_energy",
         suite_type=SuiteType.WORKLOAD,
-        pauli_strings=phase_paulis,
-        description=f"Phase sensing: X^{n_qubits} and Y^{n_qubits} (always included)",
-        metadata={"includes_Y_global": True},
+        pauli_strings=list(hamiltonian_terms),
+        weights=weights,
+        objective=ObjectiveType.WEIGHTED_SUM,
+        description=f"{molecule_name} Hamiltonian energy estimation",
     )
 
-    # === WORKLOAD: Full stabilizers (for fidelity estimation) ===
-    stabilizer_paulis = list(phase_paulis)  # Copy
-    stabilizer_paulis.extend(generate_zz_correlators(n_qubits, graph="chain"))
 
-    suites["workload_stabilizers"] = ObservableSuite.from_pauli_strings(
-        name="workload_stabilizers",
-        suite_type=SuiteType.WORKLOAD,
-        pauli_strings=list(set(stabilizer_paulis)),
-        description="GHZ stabilizers for fidelity estimation",
-    )
+@lru_cache(maxsize=32)
+def _chemistry_workload_energy_placeholder(n_qubits: int, molecule_name: str) -> ObservableSuite:
+    # Placeholder: use random 2-local as proxy for molecular Hamiltonian
+    placeholder_paulis = generate_zz_correlators(n_qubits, graph="all")
+    placeholder_paulis.extend(generate_single_qubit(n_qubits, paulis="XYZ"))
 
-    # === STRESS: Random 500 ===
-    stress_paulis = sample_random_paulis(n_qubits, 500, strategy="stratified", seed=seed)
-    suites["stress_random_500"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_500",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="500 random Paulis for scaling test",
+    return ObservableSuite.from_pauli_strings(
+        name="workload_energy_placeholder",
+        suite_type=SuiteType.WORKLOAD,
+        pauli_strings=placeholder_paulis,
+        description=f"{molecule_name} placeholder (use actual Hamiltonian when available)",
+        metadata={"is_placeholder": True},
     )
 
-    return suites
-
 
 def make_chemistry_suites(
     n_qubits: int,
@@ -754,7 +1363,7 @@ def make_chemistry_suites(
     hamiltonian_coeffs: list[float] | None = None,
     molecule_name: str = "generic",
     seed: int = 42,
-) -> dict[str, ObservableSuite]:
+) -> SuiteBundle:
     """Create benchmark suites for chemistry / VQE.
 
     Energy estimation: E = Σ_k c_k ⟨P_k⟩
@@ -769,43 +1378,37 @@ def make_chemistry_suites(
     Suites:
         workload_energy: Hamiltonian terms with weights (if provided)
         stress_random_1000: Random observables
-    """
-    suites = {}
 
+    Returns:
+        SuiteBundle, a lazy Mapping rather than a dict: each suite is built
+        from a memoized builder on first access and deep-copied into the
+        bundle, so callers never share mutable suites. Use ``dict(bundle)``
+        where a plain dict is required.
+    """
+    builders: dict[str, Callable[[], ObservableSuite]] = {}
     # === WORKLOAD: Energy ===
     if hamiltonian_terms and hamiltonian_coeffs:
-        weights = dict(zip(hamiltonian_terms, hamiltonian_coeffs, strict=False))
-        suites["workload_energy"] = ObservableSuite.from_pauli_strings(
-            name="workload_energy",
-            suite_type=SuiteType.WORKLOAD,
-            pauli_strings=hamiltonian_terms,
-            weights=weights,
-            objective=ObjectiveType.WEIGHTED_SUM,
-            description=f"{molecule_name} Hamiltonian energy estimation",
+        builders["workload_energy"] = partial(
+            _chemistry_workload_energy,
+            tuple(hamiltonian_terms),
+            tuple(hamiltonian_coeffs),
+            molecule_name,
         )
     else:
-        # Placeholder: use random 2-local as proxy for molecular Hamiltonian
-        placeholder_paulis = generate_zz_correlators(n_qubits, graph="all")
-        placeholder_paulis.extend(generate_single_qubit(n_qubits, paulis="XYZ"))
-
-        suites["workload_energy_placeholder"] = ObservableSuite.from_pauli_strings(
-            name="workload_energy_placeholder",
-            suite_type=SuiteType.WORKLOAD,
-            pauli_strings=placeholder_paulis,
-            description=f"{molecule_name} placeholder (use actual Hamiltonian when available)",
-            metadata={"is_placeholder": True},
+        builders["workload_energy_placeholder"] = partial(
+            _chemistry_workload_energy_placeholder, n_qubits, molecule_name
         )
-
     # === STRESS: Random 1000 ===
-    stress_paulis = sample_random_paulis(n_qubits, 1000, strategy="stratified", seed=seed)
-    suites["stress_random_1000"] = ObservableSuite.from_pauli_strings(
-        name="stress_random_1000",
-        suite_type=SuiteType.STRESS,
-        pauli_strings=stress_paulis,
-        description="1000 random Paulis, stratified by weight",
+    builders["stress_random_1000"] = partial(
+        _stress_suite,
+        "stress_random_1000",
+        SuiteType.STRESS,
+        n_qubits,
+        1000,
+        seed,
+        "1000 random Paulis, stratified by weight",
     )
-
-    return suites
+    return SuiteBundle(builders)
 
 
 # =============================================================================
@@ -883,26 +1486,16 @@ def make_commuting_suite(
         include_global: Include global string (e.g., Z^n)
         name: Suite name
     """
-    # All single-qubit in this basis
-    paulis = generate_single_qubit(n_qubits, paulis=basis)
-
-    # All 2-local in this basis
-    for i in range(n_qubits):
-        for j in range(i + 1, n_qubits):
-            pauli_list = ["I"] * n_qubits
-            pauli_list[i] = basis
-            pauli_list[j] = basis
-            paulis.append("".join(pauli_list))
-
-    if include_global:
-        paulis.append(basis * n_qubits)
+    x_words, z_words = _emit_up_to_2_local_soa(n_qubits, basis, include_global)
 
     if name is None:
         name = f"commuting_{basis}_only"
 
-    return ObservableSuite.from_pauli_strings(
+    return ObservableSuite.from_soa(
         name=name,
         suite_type=SuiteType.COMMUTING,
-        pauli_strings=list(set(paulis)),
+        x_words=x_words,
+        z_words=z_words,
+        n_qubits=n_qubits,
         description=f"All-{basis} observables (fully commuting)",
     )
@@ -34,6 +34,7 @@ from .base import (
     Protocol,
     ProtocolConfig,
     StaticProtocol,
+    configure_backend_for_batching,
 )
 
 # Import baseline protocols (triggers registration)
@@ -76,6 +77,7 @@ __all__ = [
     "StaticProtocol",
     "AdaptiveProtocol",
     "ProtocolConfig",
+    "configure_backend_for_batching",
     # State and data structures
     "ProtocolState",
     "MeasurementPlan",
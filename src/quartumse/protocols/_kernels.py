@@ -0,0 +1,218 @@
+"""Bit-packed parity kernels for classical post-processing.
+
+Outcomes are packed by :func:`pack_words`, which spreads each shot over
+``ceil(n_qubits / 64)`` uint64 words (qubit q in bit ``q % 64`` of word
+``q // 64``), and a Pauli's support becomes a word-wise mask
+(:func:`support_words`), so the eigenvalue of a shot is the parity of the
+popcounts of ``words & mask``. The counting loops are compiled with Numba when
+available (``pip install quartumse[jit]``); otherwise they are vectorized
+with NumPy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..utils.jit import HAS_NUMBA, njit, prange
+
+# Bits held by one packed word
+WORD_BITS = 64
+
+# Upper bound on (shots x masks x words) elements broadcast at once by group_parities
+_BLOCK_ELEMENTS = 1 << 22
+
+
+def n_words(n_qubits: int) -> int:
+    """Number of uint64 words holding ``n_qubits`` bits (at least one)."""
+    return max(1, -(-n_qubits // WORD_BITS))
+
+
+def _pack_rows(bits: NDArray[np.uint8], n_qubits: int) -> NDArray[np.uint64]:
+    """Pack each row of 0/1 ``bits`` little-endian into uint64 words."""
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    padded = np.zeros((len(bits), n_words(n_qubits) * 8), dtype=np.uint8)
+    padded[:, : packed.shape[1]] = packed
+    return padded.view("<u8").astype(np.uint64, copy=False)
+
+
+def pack_words(bits: NDArray[np.uint8]) -> NDArray[np.uint64]:
+    """Pack a (n_shots, n_qubits) 0/1 array into (n_shots, n_words) uint64 words.
+
+    Column q lands in bit ``q % 64`` of word ``q // 64``.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    if bits.ndim != 2:
+        bits = bits.reshape(len(bits), -1)
+    return _pack_rows(bits, bits.shape[1])
+
+
+def unpack_words(words: NDArray[np.uint64], n_qubits: int) -> NDArray[np.uint8]:
+    """Inverse of :func:`pack_words`: (n_shots, n_words) words to 0/1 columns."""
+    words = np.ascontiguousarray(words, dtype="<u8").reshape(len(words), -1)
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")
+    return bits[:, :n_qubits]
+
+
+@lru_cache(maxsize=4096)
+def support_words(pauli_string: str) -> NDArray[np.uint64]:
+    """Word-wise mask of the non-identity positions of ``pauli_string``.
+
+    Memoized per Pauli string, so the returned array is shared and read-only.
+    """
+    support = np.frombuffer(pauli_string.encode("ascii"), dtype=np.uint8) != ord("I")
+    mask = _pack_rows(support[np.newaxis, :].astype(np.uint8), len(pauli_string))[0]
+    mask.flags.writeable = False
+    return mask
+
+
+def word_parities(words: NDArray[np.uint64], mask: NDArray[np.uint64]) -> NDArray[np.uint8]:
+    """Per-shot parity (0 or 1) of ``words & mask`` over all words of a shot."""
+    masked = np.asarray(words, dtype=np.uint64) & mask
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(masked)
+    else:
+        # NumPy < 2.0: fold every word onto its lowest bit first
+        for shift in (32, 16, 8, 4, 2, 1):
+            masked ^= masked >> np.uint64(shift)
+        counts = masked & np.uint64(1)
+    return (counts.sum(axis=-1) & 1).astype(np.uint8)
+
+
+def group_parities(words: NDArray[np.uint64], masks: NDArray[np.uint64]) -> NDArray[np.uint8]:
+    """Parities of every shot under every mask, shape (n_shots, n_masks).
+
+    ``words`` is (n_shots, n_words) and ``masks`` (n_masks, n_words). Shots are
+    broadcast against all masks in blocks, keeping the temporaries bounded.
+    """
+    words = np.asarray(words, dtype=np.uint64)
+    masks = np.asarray(masks, dtype=np.uint64)
+    parities = np.empty((len(words), len(masks)), dtype=np.uint8)
+    step = max(1, _BLOCK_ELEMENTS // max(1, masks.size))
+    for start in range(0, len(words), step):
+        block = words[start : start + step, np.newaxis, :]
+        parities[start : start + step] = word_parities(block, masks)
+    return parities
+
+
+def _parities(packed: NDArray[np.uint64], mask: np.uint64) -> NDArray[np.uint64]:
+    """Vectorized per-shot parity of ``packed & mask`` (0 or 1)."""
+    masked = packed & mask
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masked) & np.uint64(1)
+    # NumPy < 2.0: fold the word onto its lowest bit
+    for shift in (32, 16, 8, 4, 2, 1):
+        masked ^= masked >> np.uint64(shift)
+    return masked & np.uint64(1)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _parity_sum(packed: np.ndarray, mask: np.uint64) -> int:
+    """Sum of (-1)^popcount(word & mask) over all words (compiled when Numba is present)."""
+    total = 0
+    for i in range(len(packed)):
+        x = packed[i] & mask
+        x ^= x >> np.uint64(32)
+        x ^= x >> np.uint64(16)
+        x ^= x >> np.uint64(8)
+        x ^= x >> np.uint64(4)
+        x ^= x >> np.uint64(2)
+        x ^= x >> np.uint64(1)
+        total += 1 - 2 * np.int64(x & np.uint64(1))
+    return total
+
+
+@njit(cache=True, nogil=True)
+def _odd_count(words: np.ndarray, mask: np.ndarray) -> int:
+    """Shots with odd parity under one (n_words,) mask (compiled when Numba is present).
+
+    The masked words of a shot are XOR-ed together before folding, since the
+    parity of a multi-word popcount is the parity of the XOR of its words.
+    """
+    n_shots, n_words = words.shape
+    total = 0
+    for i in range(n_shots):
+        x = np.uint64(0)
+        for w in range(n_words):
+            x ^= words[i, w] & mask[w]
+        x ^= x >> np.uint64(32)
+        x ^= x >> np.uint64(16)
+        x ^= x >> np.uint64(8)
+        x ^= x >> np.uint64(4)
+        x ^= x >> np.uint64(2)
+        x ^= x >> np.uint64(1)
+        total += np.int64(x & np.uint64(1))
+    return total
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def _group_odd_counts(words: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Shots with odd parity under each mask, masks processed in parallel with ``prange``."""
+    counts = np.zeros(masks.shape[0], dtype=np.int64)
+    for k in prange(masks.shape[0]):
+        counts[k] = _odd_count(words, masks[k])
+    return counts
+
+
+@njit(cache=True, nogil=True)
+def _group_odd_counts_serial(words: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Serial variant of :func:`_group_odd_counts` for callers running their own threads.
+
+    Numba's default workqueue threading layer aborts when parallel kernels
+    are entered from several threads at once, so thread pools use this one.
+    """
+    counts = np.zeros(masks.shape[0], dtype=np.int64)
+    for k in range(masks.shape[0]):
+        counts[k] = _odd_count(words, masks[k])
+    return counts
+
+
+def group_odd_counts(
+    words: NDArray[np.uint64], masks: NDArray[np.uint64], parallel: bool = True
+) -> NDArray[np.int64]:
+    """Number of shots with odd parity under each of the (n_masks, n_words) masks.
+
+    Uses the compiled kernel when Numba is installed and the broadcast
+    :func:`group_parities` otherwise. Pass ``parallel=False`` when calling
+    from several threads, which selects the serial compiled kernel.
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    if HAS_NUMBA:
+        kernel = _group_odd_counts if parallel else _group_odd_counts_serial
+        return kernel(words, masks)  # type: ignore[no-any-return]
+    return group_parities(words, masks).sum(axis=0, dtype=np.int64)
+
+
+@lru_cache(maxsize=4096)
+def odd_counter(pauli_string: str) -> Callable[[NDArray[np.uint64]], int]:
+    """Odd-parity shot counter specialized to one Pauli string (memoized).
+
+    The support mask is resolved once and bound into the returned closure,
+    which reads only the words the Pauli acts on: a single column for a
+    support within one word (the compiled loop when Numba is present), a
+    constant zero for the identity.
+    """
+    mask = support_words(pauli_string)
+    active = np.flatnonzero(mask)
+    if not len(active):
+        return lambda words: 0
+    if len(active) == 1:
+        column, word_mask = int(active[0]), np.uint64(mask[active[0]])
+
+        def count_word(words: NDArray[np.uint64]) -> int:
+            packed = np.ascontiguousarray(words[:, column], dtype=np.uint64)
+            if HAS_NUMBA:
+                return (len(packed) - int(_parity_sum(packed, word_mask))) // 2
+            return int(_parities(packed, word_mask).sum())
+
+        return count_word
+    active_mask = mask[active]
+
+    def count_words(words: NDArray[np.uint64]) -> int:
+        return int(word_parities(words[:, active], active_mask).sum())
+
+    return count_words
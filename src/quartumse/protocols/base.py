@@ -16,28 +16,368 @@ full budget, while adaptive protocols may return multiple plans across rounds.
 
 from __future__ import annotations
 
+import os
+import sys
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+import numpy as np
+from numpy.typing import NDArray
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Gate, Instruction
+from qiskit.circuit.library import HGate, SdgGate
 
 from .state import (
     Estimates,
     MeasurementPlan,
+    MeasurementSetting,
     ProtocolState,
     RawDatasetChunk,
     TimingBreakdown,
+    _bitstrings_to_array,
 )
 
 if TYPE_CHECKING:
+    from qiskit_aer import AerSimulator
+
     from quartumse.observables.core import ObservableSet
 
+# Shared simulator used when acquire() is called without a backend
+_DEFAULT_BACKEND: AerSimulator | None = None
+
+# Maximum entries kept in each per-protocol circuit cache
+_CIRCUIT_CACHE_SIZE = 256
+
+# Instructions Aer executes natively without listing them as basis gates
+_AER_DIRECTIVES = frozenset({"measure", "barrier", "reset"})
+
+# Per-round record written by Protocol.run(); meta_index locates the
+# state.round_metadata entry the round's timings are copied into
+_ROUND_TIMING_DTYPE = np.dtype(
+    [
+        ("quantum_ns", np.int64),
+        ("classical_ns", np.int64),
+        ("shots", np.int64),
+        ("settings", np.int64),
+        ("meta_index", np.int64),
+    ]
+)
+
+
+def configure_backend_for_batching(backend: AerSimulator) -> AerSimulator:
+    """Enable experiment-level parallelism on an Aer simulator.
+
+    StaticProtocol.acquire() submits the settings of a plan as one batched
+    job; these options let Aer simulate the circuits of that job
+    concurrently. The default backend is configured this way, so apply
+    this to caller-supplied simulators for the same behavior.
+
+    Args:
+        backend: Aer simulator to configure in place.
+
+    Returns:
+        The same backend, for chaining.
+    """
+    backend.set_options(
+        max_parallel_experiments=os.cpu_count() or 1,
+        max_parallel_threads=0,
+        max_parallel_shots=1,
+    )
+    return backend
+
+
+def _get_default_backend() -> AerSimulator:
+    """Return the shared default simulator, creating it on first use."""
+    global _DEFAULT_BACKEND
+    if _DEFAULT_BACKEND is None:
+        # Aer is imported on first use; callers with their own backend never load it
+        from qiskit_aer import AerSimulator
+
+        _DEFAULT_BACKEND = configure_backend_for_batching(AerSimulator(method="automatic"))
+    return _DEFAULT_BACKEND
+
 
+def _aer_runs_natively(circuit: QuantumCircuit, backend: Any) -> bool:
+    """Whether an Aer simulator can execute ``circuit`` without transpilation.
+
+    True for an unconstrained AerSimulator (no coupling map) whose basis
+    gates cover every operation in the circuit; noisy simulators built
+    from device models keep their restricted basis and are transpiled.
+    """
+    # A backend cannot be an AerSimulator unless qiskit_aer has been imported
+    aer = sys.modules.get("qiskit_aer")
+    if aer is None or not isinstance(backend, aer.AerSimulator):
+        return False
+    configuration = backend.configuration()
+    if configuration.coupling_map is not None:
+        return False
+    supported = _AER_DIRECTIVES.union(configuration.basis_gates)
+    return all(instruction.operation.name in supported for instruction in circuit.data)
+
+
+def _circuit_key(circuit: QuantumCircuit) -> tuple:
+    """Hashable description of a circuit's contents, used as a cache key.
+
+    Two circuits get equal keys when they apply the same operations, with
+    the same parameters, to the same qubit and clbit indices, so in-place
+    edits change the key and equal copies share cache entries. Custom
+    gates built with ``to_gate()``/``to_instruction()`` are described by
+    their definitions; other operations by their type and parameters.
+    """
+    qubits = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    clbits = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+    instructions = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        definition = None
+        if type(operation) in (Gate, Instruction) and operation.definition is not None:
+            definition = _circuit_key(operation.definition)
+        instructions.append(
+            (
+                type(operation),
+                operation.name,
+                tuple(_param_key(param) for param in operation.params),
+                definition,
+                tuple(qubits[qubit] for qubit in instruction.qubits),
+                tuple(clbits[clbit] for clbit in instruction.clbits),
+            )
+        )
+    return (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        _param_key(circuit.global_phase),
+        tuple(instructions),
+    )
+
+
+def _param_key(param: Any) -> Any:
+    """Hashable form of an instruction parameter for :func:`_circuit_key`."""
+    if isinstance(param, np.ndarray):
+        return (param.shape, param.dtype.str, param.tobytes())
+    if isinstance(param, QuantumCircuit):
+        return _circuit_key(param)
+    try:
+        hash(param)
+    except TypeError:
+        return repr(param)
+    return param
+
+
+@lru_cache(maxsize=4096)
+def _expand_basis_cached(
+    measurement_basis: str,
+    n_qubits: int,
+    target_qubits: tuple[int, ...] | None,
+) -> str:
+    """Expand a basis string to cover all qubits (memoized; bases recur often)."""
+    if not measurement_basis:
+        return "Z" * n_qubits
+
+    if len(measurement_basis) == n_qubits:
+        return measurement_basis.replace("I", "Z")
+
+    # Patch the targeted positions of a 'Z' template; for basis-sized
+    # inputs a bytearray beats NumPy's per-call array setup
+    basis = bytearray(b"Z" * n_qubits)
+    if target_qubits:
+        chars = measurement_basis.encode("ascii")
+        if len(chars) == len(target_qubits):
+            for char, qubit in zip(chars, target_qubits, strict=True):
+                basis[qubit] = char
+        else:
+            # Full-width basis indexed by qubit; targets past its end stay Z
+            for qubit in target_qubits:
+                if qubit < len(chars):
+                    basis[qubit] = chars[qubit]
+    return basis.decode("ascii").replace("I", "Z")
+
+
+# Qiskit gates carry no per-use state, so the rotation layers share instances
+_H = HGate()
+_SDG = SdgGate()
+
+
+@lru_cache(maxsize=4096)
+def _rotation_layer(basis: str) -> QuantumCircuit:
+    """Basis-change layer mapping X/Y measurements onto Z (memoized per basis).
+
+    Callers compose the returned circuit into their own and must not modify it.
+    """
+    layer = QuantumCircuit(len(basis))
+    for qubit, basis_char in enumerate(basis):
+        if basis_char == "X":
+            layer.append(_H, [qubit], copy=False)
+        elif basis_char == "Y":
+            layer.append(_SDG, [qubit], copy=False)
+            layer.append(_H, [qubit], copy=False)
+    return layer
+
+
+def _run_counts(
+    backend: Any,
+    circuits: list[QuantumCircuit],
+    shots_list: list[int],
+    seed: int,
+    shots_per_job: int | None = None,
+) -> tuple[list[dict[str, int]], NDArray[np.float64]]:
+    """Run transpiled circuits on a `.run()` backend and return counts and times.
+
+    Circuits sharing a shot count are submitted as one job, largest shot
+    count first. With shots_per_job set, larger groups are split into
+    sub-jobs of at most that many shots, seeded seed, seed + 1, ... in
+    order. Every job is submitted before any result is read. Aer queues
+    the jobs on its worker thread, so collecting and merging one job's
+    counts overlaps the simulation of the next. A group's time is the
+    wall time from the previous group's results to its own, split evenly
+    across its circuits. Top-level so it can execute in worker processes.
+    """
+    counts_list: list[dict[str, int]] = [{} for _ in circuits]
+    times = np.zeros(len(circuits), dtype=np.float64)
+
+    # Group circuits by shot count: one job (or run of sub-jobs) per group
+    shot_groups: dict[int, list[int]] = {}
+    for i, n_shots in enumerate(shots_list):
+        shot_groups.setdefault(n_shots, []).append(i)
+
+    start = time.perf_counter()
+    submitted = []
+    for n_shots, indices in sorted(shot_groups.items(), reverse=True):
+        if shots_per_job is None or n_shots <= shots_per_job:
+            sizes = [n_shots]
+        else:
+            sizes = [shots_per_job] * (n_shots // shots_per_job)
+            if n_shots % shots_per_job:
+                sizes.append(n_shots % shots_per_job)
+        group_circuits = [circuits[i] for i in indices]
+        jobs = [
+            backend.run(group_circuits, shots=size, seed_simulator=seed + j)
+            for j, size in enumerate(sizes)
+        ]
+        submitted.append((n_shots, indices, jobs))
+
+    mark = start
+    for n_shots, indices, jobs in submitted:
+        for job in jobs:
+            result = job.result()
+            for position, i in enumerate(indices):
+                try:
+                    counts = result.get_counts(position)
+                except Exception as e:
+                    compiled = circuits[i]
+                    raise RuntimeError(
+                        f"No counts from circuit execution. "
+                        f"num_qubits={compiled.num_qubits}, "
+                        f"num_clbits={compiled.num_clbits}, shots={n_shots}. "
+                        f"Original error: {e}"
+                    ) from e
+                if len(jobs) == 1:
+                    counts_list[i] = counts
+                else:
+                    merged = counts_list[i]
+                    for key, count in counts.items():
+                        merged[key] = merged.get(key, 0) + count
+        now = time.perf_counter()
+        times[indices] = (now - mark) / len(indices)
+        mark = now
+
+    return counts_list, times
+
+
+def _split_merged_counts(
+    unique_counts: list[dict[str, int]],
+    unique_times: NDArray[np.float64],
+    owners: list[int],
+    shots_list: list[int],
+    seed: int,
+) -> tuple[list[dict[str, int]], NDArray[np.float64]]:
+    """Split counts of merged experiments back into per-setting counts.
+
+    owners[i] is the experiment that setting i was merged into. Each
+    setting receives shots_list[i] outcomes drawn without replacement from
+    its experiment's remaining counts (a multivariate hypergeometric draw),
+    which has the same distribution as running the settings separately.
+    Experiment times are shared out in proportion to shots.
+    """
+    rng = np.random.default_rng(seed)
+    remaining = []
+    for counts in unique_counts:
+        keys = sorted(counts)
+        remaining.append((keys, np.fromiter((counts[k] for k in keys), dtype=np.int64)))
+    totals = np.zeros(len(unique_counts), dtype=np.int64)
+    np.add.at(totals, owners, shots_list)
+
+    counts_list: list[dict[str, int]] = []
+    times = np.empty(len(owners), dtype=np.float64)
+    for i, (owner, n_shots) in enumerate(zip(owners, shots_list, strict=True)):
+        keys, available = remaining[owner]
+        draw = rng.multivariate_hypergeometric(available, n_shots)
+        available -= draw
+        counts_list.append({key: int(n) for key, n in zip(keys, draw, strict=True) if n})
+        times[i] = unique_times[owner] * n_shots / totals[owner] if totals[owner] else 0.0
+
+    return counts_list, times
+
+
+def _run_counts_in_processes(
+    backend: Any,
+    circuits: list[QuantumCircuit],
+    shots_list: list[int],
+    seed: int,
+    n_workers: int,
+    shots_per_job: int | None = None,
+) -> tuple[list[dict[str, int]], NDArray[np.float64]]:
+    """Split circuits into contiguous blocks and run each in its own process.
+
+    The block starting at circuit k is seeded with seed + k, so results are
+    reproducible for a fixed seed and worker count (though not identical to
+    a single batched job, whose per-experiment seeds Aer derives itself).
+    Workers are spawned, so scripts calling this need the usual
+    ``if __name__ == "__main__":`` guard.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    bounds = np.linspace(0, len(circuits), n_workers + 1).astype(int).tolist()
+    counts_list: list[dict[str, int]] = []
+    times = np.empty(len(circuits), dtype=np.float64)
+    # Spawn rather than fork: forking after Aer has started its OpenMP
+    # threads can deadlock the children
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                _run_counts,
+                backend,
+                circuits[lo:hi],
+                shots_list[lo:hi],
+                seed + lo,
+                shots_per_job,
+            )
+            for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
+        for lo, future in zip(bounds[:-1], futures, strict=True):
+            block_counts, block_times = future.result()
+            counts_list.extend(block_counts)
+            times[lo : lo + len(block_times)] = block_times
+
+    return counts_list, times
+
+
+@dataclass(frozen=True, slots=True)
 class ProtocolConfig:
     """Configuration for a measurement protocol.
 
+    Configs are immutable; use dataclasses.replace() to derive a variant.
+    Protocol-specific settings live in ``extra``. The constructor no longer
+    accepts them as keyword arguments; use :meth:`from_kwargs`, which folds
+    unknown keywords into ``extra``, where code relied on that.
+
     Attributes:
         confidence_level: Target confidence level for CIs (default 0.95).
         random_seed: Random seed for reproducibility.
@@ -45,42 +385,74 @@ class ProtocolConfig:
         ci_method: CI construction method override (None = auto-select).
         clamp_bounds: Whether to clamp CI bounds to valid range.
         clamp_range: Range for clamping (default [-1, 1] for Pauli observables).
-        max_rounds: Maximum number of adaptive rounds (default 1 for static).
+        max_rounds: Maximum number of rounds. None (the default) resolves to
+            the protocol's default_max_rounds: 1 for static protocols, 10
+            for adaptive ones.
+        convergence_epsilon: Relative change in estimates below which an
+            adaptive round counts as stable (None disables the check).
+        convergence_patience: Consecutive stable rounds after which run()
+            stops an adaptive protocol early (default 2).
+        parallel_settings: Number of worker processes StaticProtocol.acquire()
+            spreads settings across (default 1, run in-process).
+        shots_per_job: Largest shot count StaticProtocol.acquire() sends to
+            the backend in one job. Bigger settings are split into sub-jobs
+            whose counts are merged as they arrive (default None, no split).
+        transpile_optimization_level: Qiskit optimization level used when a
+            measurement circuit has to be transpiled (default 0).
         extra: Additional protocol-specific configuration.
     """
 
-    def __init__(
-        self,
-        confidence_level: float = 0.95,
-        random_seed: int | None = None,
-        bootstrap_replicates: int = 1000,
-        ci_method: str | None = None,
-        clamp_bounds: bool = True,
-        clamp_range: tuple[float, float] = (-1.0, 1.0),
-        max_rounds: int = 1,
-        **extra: Any,
-    ) -> None:
-        self.confidence_level = confidence_level
-        self.random_seed = random_seed
-        self.bootstrap_replicates = bootstrap_replicates
-        self.ci_method = ci_method
-        self.clamp_bounds = clamp_bounds
-        self.clamp_range = clamp_range
-        self.max_rounds = max_rounds
-        self.extra = extra
+    confidence_level: float = 0.95
+    random_seed: int | None = None
+    bootstrap_replicates: int = 1000
+    ci_method: str | None = None
+    clamp_bounds: bool = True
+    clamp_range: tuple[float, float] = (-1.0, 1.0)
+    max_rounds: int | None = None
+    convergence_epsilon: float | None = None
+    convergence_patience: int = 2
+    parallel_settings: int = 1
+    shots_per_job: int | None = None
+    transpile_optimization_level: int = 0
+    extra: Mapping[str, Any] = field(default_factory=dict, hash=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Store extra as a read-only copy so it is as immutable as the rest."""
+        object.__setattr__(self, "extra", MappingProxyType(dict(self.extra)))
+
+    @classmethod
+    def from_kwargs(cls, **kwargs: Any) -> ProtocolConfig:
+        """Build a config from keyword arguments, folding unknown ones into extra.
+
+        Accepts the same calls as the pre-dataclass constructor, e.g.
+        ``ProtocolConfig.from_kwargs(random_seed=1, verbatim=True)``, and
+        inverts to_dict(). An explicit ``extra`` mapping is merged with the
+        folded keywords, which take precedence.
+        """
+        names = {f.name for f in fields(cls)}
+        known = {key: value for key, value in kwargs.items() if key in names}
+        unknown = {key: value for key, value in kwargs.items() if key not in names}
+        extra = {**known.pop("extra", {}), **unknown}
+        return cls(**known, extra=extra)
+
+    def __reduce__(self) -> tuple[type[ProtocolConfig], tuple[Any, ...]]:
+        """Pickle extra as a plain dict (mapping proxies cannot be pickled)."""
+        values = tuple(getattr(self, f.name) for f in fields(self) if f.name != "extra")
+        return type(self), (*values, dict(self.extra))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "confidence_level": self.confidence_level,
-            "random_seed": self.random_seed,
-            "bootstrap_replicates": self.bootstrap_replicates,
-            "ci_method": self.ci_method,
-            "clamp_bounds": self.clamp_bounds,
-            "clamp_range": self.clamp_range,
-            "max_rounds": self.max_rounds,
-            **self.extra,
-        }
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "extra"}
+        return {**data, **self.extra}
+
+    def _config_key(self) -> tuple[Any, ...]:
+        """Hashable key over every field, extra included, for memoizing per-config work.
+
+        hash(config) leaves out extra, whose values need not be hashable;
+        this key requires them to be.
+        """
+        values = tuple(getattr(self, f.name) for f in fields(self) if f.name != "extra")
+        return (*values, tuple(sorted(self.extra.items())))
 
 
 class Protocol(ABC):
@@ -112,6 +484,8 @@ class Protocol(ABC):
     # Subclasses must override these
     protocol_id: str = "abstract_protocol"
     protocol_version: str = "0.0.0"
+    # Rounds run() allows when the config leaves max_rounds unset
+    default_max_rounds: int = 1
 
     def __init__(self, config: ProtocolConfig | None = None) -> None:
         """Initialize protocol with configuration.
@@ -119,7 +493,14 @@ class Protocol(ABC):
         Args:
             config: Protocol configuration. Uses defaults if None.
         """
-        self.config = config or ProtocolConfig()
+        config = config or ProtocolConfig()
+        if config.max_rounds is None:
+            config = replace(config, max_rounds=self.default_max_rounds)
+        self.config = config
+        # LRU caches of stripped base circuits and transpiled measurement
+        # circuits, reused across rounds and runs (see StaticProtocol)
+        self._base_circuit_cache: OrderedDict[tuple, QuantumCircuit] = OrderedDict()
+        self._compiled_cache: OrderedDict[tuple, QuantumCircuit] = OrderedDict()
 
     @abstractmethod
     def initialize(
@@ -183,7 +564,7 @@ class Protocol(ABC):
             plan: Measurement plan to execute.
             backend: Quantum backend for execution.
             seed: Random seed for measurement randomness.
-            deadline: Absolute time (time.time()) by which to stop.
+            deadline: Absolute time (time.monotonic()) by which to stop.
                 If None, no timeout.
 
         Returns:
@@ -264,46 +645,102 @@ class Protocol(ABC):
         """
         seed = seed if seed is not None else (self.config.random_seed or 42)
 
-        deadline = (time.time() + timeout_s) if timeout_s is not None else None
+        deadline = (time.monotonic() + timeout_s) if timeout_s is not None else None
+        if isinstance(self, StaticProtocol) and self.config.max_rounds == 1:
+            return self._run_static_once(
+                circuit, observable_set, total_budget, backend, seed, deadline, hw_timing_profile
+            )
+
         timed_out = False
 
-        # Initialize + plan (pre-compute phase)
-        pre_compute_start = time.time()
+        # Initialize (pre-compute phase)
         state = self.initialize(observable_set, total_budget, seed)
         remaining = total_budget
         round_seed = seed
 
-        start_time = time.time()
+        # Elapsed times are differences of perf_counter_ns() readings; per-round
+        # values go into a preallocated record array and are copied into
+        # state.round_metadata once the loop ends
+        start_ns = time.perf_counter_ns()
+        round_timings = np.zeros(max(self.config.max_rounds, 0), dtype=_ROUND_TIMING_DTYPE)
+        n_rounds_run = 0
+        acquire_ns = 0
         total_aer_time = 0.0
-        all_per_setting_aer_times: list[float] = []
+        # Per-setting times accumulate in a float64 buffer grown by doubling
+        all_per_setting_aer_times = np.empty(64, dtype=np.float64)
+        n_setting_times = 0
+
+        # Stability-based early stopping and lookahead (adaptive protocols only)
+        adaptive = self if isinstance(self, AdaptiveProtocol) else None
+        epsilon = self.config.convergence_epsilon if adaptive is not None else None
+        previous_estimates: NDArray[np.float64] | None = None
+        stable_rounds = 0
+        lookahead = adaptive.lookahead if adaptive is not None else 1
+        # Rounds acquired ahead of time: (plan, chunk, share of acquire time)
+        pending: deque[tuple[MeasurementPlan, RawDatasetChunk, int]] = deque()
 
         # Main loop (single iteration for static protocols)
         while remaining > 0 and not state.converged:
             if state.n_rounds >= self.config.max_rounds:
                 break
 
-            # Check deadline before planning
-            if deadline is not None and time.time() >= deadline:
-                timed_out = True
-                break
-
-            # Plan
-            plan = self.next_plan(state, remaining)
-            if plan.total_shots == 0:
-                break
-
-            pre_compute_time = time.time() - pre_compute_start
-
-            # Acquire
-            round_start = time.time()
-            chunk = self.acquire(circuit, plan, backend, round_seed, deadline=deadline)
-            quantum_time = time.time() - round_start
+            if not pending:
+                # Check deadline before planning
+                if deadline is not None and time.monotonic() >= deadline:
+                    timed_out = True
+                    break
+
+                # Plan, up to `lookahead` rounds at once
+                k = min(lookahead, self.config.max_rounds - state.n_rounds)
+                if k > 1 and adaptive is not None:
+                    plans = adaptive.next_plans(state, remaining, k)[:k]
+                else:
+                    plans = [self.next_plan(state, remaining)]
+                n_plans = next(
+                    (i for i, plan in enumerate(plans) if plan.total_shots == 0), len(plans)
+                )
+                if n_plans == 0:
+                    break
+                plans = plans[:n_plans]
+
+                # Acquire
+                round_start_ns = time.perf_counter_ns()
+                if adaptive is not None and len(plans) > 1:
+                    chunks = adaptive._acquire_plans(
+                        circuit, plans, backend, round_seed, deadline=deadline
+                    )
+                else:
+                    chunks = [
+                        self.acquire(circuit, plans[0], backend, round_seed, deadline=deadline)
+                    ]
+                elapsed_ns = time.perf_counter_ns() - round_start_ns
+                acquire_ns += elapsed_ns
+                # A batched acquire's time is shared among its rounds by shots
+                batch_shots = max(sum(chunk.n_shots for chunk in chunks), 1)
+                for plan, chunk in zip(plans, chunks, strict=False):
+                    share = (
+                        elapsed_ns * chunk.n_shots // batch_shots if len(chunks) > 1 else elapsed_ns
+                    )
+                    pending.append((plan, chunk, share))
+                round_seed += len(plans)
+
+            plan, chunk, quantum_ns = pending.popleft()
+            acquired_ns = time.perf_counter_ns()
+            n_shots = chunk.n_shots
 
             # Extract per-setting AER times from chunk metadata
-            chunk_aer_time = chunk.metadata.get("aer_simulate_s", 0.0)
-            total_aer_time += chunk_aer_time
-            per_setting_times = chunk.metadata.get("per_setting_aer_times_s", [])
-            all_per_setting_aer_times.extend(per_setting_times)
+            total_aer_time += chunk.metadata.get("aer_simulate_s", 0.0)
+            setting_times = np.asarray(
+                chunk.metadata.get("per_setting_aer_times_s", ()), dtype=np.float64
+            )
+            needed = n_setting_times + len(setting_times)
+            if needed > len(all_per_setting_aer_times):
+                capacity = len(all_per_setting_aer_times)
+                while capacity < needed:
+                    capacity *= 2
+                all_per_setting_aer_times = np.resize(all_per_setting_aer_times, capacity)
+            all_per_setting_aer_times[n_setting_times:needed] = setting_times
+            n_setting_times = needed
 
             # Check if acquire() hit the deadline
             if chunk.metadata.get("timed_out", False):
@@ -313,41 +750,92 @@ class Protocol(ABC):
             state.add_chunk(chunk)
 
             # Update
-            classical_start = time.time()
             state = self.update(state, chunk)
-            classical_time = time.time() - classical_start
+            updated_ns = time.perf_counter_ns()
 
-            # Record round metadata (append if update() didn't already)
+            # Reserve this round's metadata entry (append if update() didn't already)
             if len(state.round_metadata) < state.n_rounds:
                 state.round_metadata.append({})
-            state.round_metadata[-1].update(
-                {
-                    "quantum_time_s": quantum_time,
-                    "classical_time_s": classical_time,
-                    "shots_this_round": chunk.n_shots,
-                    "settings_this_round": plan.n_settings,
-                }
+            round_timings[n_rounds_run] = (
+                quantum_ns,
+                updated_ns - acquired_ns,
+                n_shots,
+                plan.n_settings,
+                len(state.round_metadata) - 1,
             )
-
-            remaining -= chunk.n_shots
-            round_seed += 1
-
-            # Reset pre_compute_start for next round's planning
-            pre_compute_start = time.time()
+            n_rounds_run += 1
+
+            remaining -= n_shots
+
+            # Stop once estimates have stopped moving for `patience` rounds
+            if epsilon is not None:
+                current = self._quick_estimate(state)
+                if previous_estimates is not None and current.shape == previous_estimates.shape:
+                    delta = np.max(
+                        np.abs(current - previous_estimates) / (np.abs(previous_estimates) + 1e-12),
+                        initial=0.0,
+                    )
+                    stable_rounds = stable_rounds + 1 if delta < epsilon else 0
+                    if stable_rounds >= self.config.convergence_patience:
+                        state.converged = True
+                        state.early_stopped = True
+                previous_estimates = current
 
             if timed_out:
                 break
 
+        return self._finish_run(
+            circuit,
+            observable_set,
+            state,
+            round_timings[:n_rounds_run],
+            start_ns,
+            acquire_ns,
+            total_aer_time,
+            all_per_setting_aer_times[:n_setting_times],
+            timed_out,
+            hw_timing_profile,
+        )
+
+    def _finish_run(
+        self,
+        circuit: QuantumCircuit,
+        observable_set: ObservableSet,
+        state: ProtocolState,
+        round_timings: NDArray[np.void],
+        start_ns: int,
+        acquire_ns: int,
+        total_aer_time: float,
+        per_setting_aer_times: NDArray[np.float64],
+        timed_out: bool,
+        hw_timing_profile: Any | None,
+    ) -> Estimates:
+        """Record round timings, finalize and attach run()'s timing breakdown."""
+        # Record round metadata
+        state.round_timings = round_timings
+        for row in round_timings.tolist():
+            quantum_ns, classical_ns, shots, settings, meta_index = row
+            state.round_metadata[meta_index].update(
+                {
+                    "quantum_time_s": quantum_ns / 1e9,
+                    "classical_time_s": classical_ns / 1e9,
+                    "shots_this_round": shots,
+                    "settings_this_round": settings,
+                }
+            )
+
         # Finalize (post-process phase)
-        post_start = time.time()
+        post_start_ns = time.perf_counter_ns()
         estimates = self.finalize(state, observable_set)
-        post_time = time.time() - post_start
+        end_ns = time.perf_counter_ns()
         estimates.raw_chunks = state.accumulated_data
 
         # Add timing and protocol info
-        total_time = time.time() - start_time
-        estimates.time_quantum_s = sum(m.get("quantum_time_s", 0) for m in state.round_metadata)
-        estimates.time_classical_s = total_time - (estimates.time_quantum_s or 0)
+        total_time = (end_ns - start_ns) / 1e9
+        post_time = (end_ns - post_start_ns) / 1e9
+        acquire_wall = acquire_ns / 1e9
+        estimates.time_quantum_s = acquire_wall
+        estimates.time_classical_s = total_time - acquire_wall
         estimates.protocol_id = self.protocol_id
         estimates.protocol_version = self.protocol_version
 
@@ -356,20 +844,15 @@ class Protocol(ABC):
         if timed_out:
             estimates.n_shots_completed = state.total_shots_used
 
-        # Build timing breakdown
-        pre_compute_total = sum(
-            m.get("quantum_time_s", 0) for m in state.round_metadata
-        )
-        # pre_compute_time is from first round; approximate total pre-compute
-        # as total_time - acquire_wall - post_process
-        acquire_wall = estimates.time_quantum_s or 0.0
+        # Build timing breakdown; pre-compute is whatever is not acquire or
+        # post-processing (planning, update and bookkeeping)
         timing = TimingBreakdown(
             time_total_s=total_time,
             time_pre_compute_s=total_time - acquire_wall - post_time,
             time_acquire_wall_s=acquire_wall,
             time_aer_simulate_s=total_aer_time,
             time_post_process_s=post_time,
-            per_setting_aer_times_s=all_per_setting_aer_times,
+            per_setting_aer_times_s=per_setting_aer_times,
         )
 
         # Estimate quantum hardware time if profile provided
@@ -391,6 +874,92 @@ class Protocol(ABC):
 
         return estimates
 
+    def _run_static_once(
+        self,
+        circuit: QuantumCircuit,
+        observable_set: ObservableSet,
+        total_budget: int,
+        backend: AerSimulator | Any,
+        seed: int,
+        deadline: float | None,
+        hw_timing_profile: Any | None,
+    ) -> Estimates:
+        """Straight-line run() for single-round static protocols.
+
+        Performs initialize -> next_plan -> acquire -> update -> finalize
+        with the same bookkeeping as run()'s round loop, minus the loop.
+        """
+        start_ns = time.perf_counter_ns()
+        state = self.initialize(observable_set, total_budget, seed)
+        plan: MeasurementPlan | None = None
+        timed_out = False
+        if total_budget > 0 and not state.converged:
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out = True
+            else:
+                plan = self.next_plan(state, total_budget)
+        if plan is None or plan.total_shots == 0:
+            return self._finish_run(
+                circuit,
+                observable_set,
+                state,
+                np.zeros(0, dtype=_ROUND_TIMING_DTYPE),
+                start_ns,
+                0,
+                0.0,
+                np.zeros(0, dtype=np.float64),
+                timed_out,
+                hw_timing_profile,
+            )
+
+        round_start_ns = time.perf_counter_ns()
+        chunk = self.acquire(circuit, plan, backend, seed, deadline=deadline)
+        acquired_ns = time.perf_counter_ns()
+        n_shots = chunk.n_shots
+        state.add_chunk(chunk)
+        state = self.update(state, chunk)
+        updated_ns = time.perf_counter_ns()
+
+        if len(state.round_metadata) < state.n_rounds:
+            state.round_metadata.append({})
+        round_timings = np.array(
+            [
+                (
+                    acquired_ns - round_start_ns,
+                    updated_ns - acquired_ns,
+                    n_shots,
+                    plan.n_settings,
+                    len(state.round_metadata) - 1,
+                )
+            ],
+            dtype=_ROUND_TIMING_DTYPE,
+        )
+        setting_times = np.asarray(
+            chunk.metadata.get("per_setting_aer_times_s", ()), dtype=np.float64
+        )
+        return self._finish_run(
+            circuit,
+            observable_set,
+            state,
+            round_timings,
+            start_ns,
+            acquired_ns - round_start_ns,
+            chunk.metadata.get("aer_simulate_s", 0.0),
+            setting_times,
+            chunk.metadata.get("timed_out", False),
+            hw_timing_profile,
+        )
+
+    def clear_circuit_cache(self) -> None:
+        """Drop cached base and transpiled measurement circuits.
+
+        Cache keys describe a state-preparation circuit by its contents
+        (see ``_circuit_key``), so edited circuits never hit stale entries;
+        call this to release the cached circuits.
+        """
+        self._base_circuit_cache.clear()
+        self._compiled_cache.clear()
+
     def get_info(self) -> dict[str, Any]:
         """Get protocol information for manifest/logging."""
         return {
@@ -460,75 +1029,241 @@ class StaticProtocol(Protocol):
         """Execute measurements according to the plan.
 
         Default implementation executes measurement circuits using the
-        provided backend or sampler.
+        provided backend or sampler. Without a backend, a shared AerSimulator
+        configured by configure_backend_for_batching() is used.
 
         Args:
             circuit: The state preparation circuit.
             plan: Measurement plan to execute.
             backend: Quantum backend for execution.
             seed: Random seed for measurement randomness.
-            deadline: Absolute time (time.time()) by which to stop.
+            deadline: Absolute time (time.monotonic()) by which to stop.
                 If None, no timeout.
 
         Returns:
             RawDatasetChunk containing measurement outcomes.
         """
-        from qiskit_aer import AerSimulator
-
-        bitstrings: dict[str, list[str]] = {}
-        backend = backend or AerSimulator()
-        circuit_cache: dict[str, QuantumCircuit] = {}
+        backend = backend or _get_default_backend()
         hit_deadline = False
-        per_setting_aer_times: list[float] = []
-        total_aer_time = 0.0
 
-        for setting, n_shots in zip(plan.settings, plan.shots_per_setting, strict=False):
-            # Check deadline before each setting
-            if deadline is not None and time.time() >= deadline:
-                hit_deadline = True
-                break
-
-            basis_key = setting.measurement_basis
-            if basis_key not in circuit_cache:
-                measurement_circuit = self._build_measurement_circuit(
-                    circuit=circuit,
-                    measurement_basis=setting.measurement_basis,
-                    target_qubits=setting.target_qubits,
-                )
-                circuit_cache[basis_key] = self._transpile_circuit(
-                    measurement_circuit, backend
-                )
+        # Compile every setting first so the whole plan can be submitted at once
+        settings = plan.settings[: len(plan.shots_per_setting)]
+        shots_list = list(plan.shots_per_setting[: len(settings)])
+        if deadline is not None and time.monotonic() >= deadline:
+            hit_deadline = True
+            settings, shots_list = [], []
+        compiled_circuits = self._compiled_measurement_circuits(circuit, settings, backend)
+        setting_ids = [setting.setting_id for setting in settings]
+
+        setting_arrays, per_setting_aer_times = self._run_compiled_batch(
+            compiled_circuits, backend, shots_list, seed
+        )
+        return self._build_chunk(
+            circuit,
+            setting_ids,
+            setting_arrays,
+            per_setting_aer_times,
+            timed_out=hit_deadline,
+        )
 
-            compiled = circuit_cache[basis_key]
-            aer_start = time.time()
-            setting_bitstrings = self._run_compiled_circuit(
-                compiled, backend, n_shots, seed
-            )
-            aer_elapsed = time.time() - aer_start
-            per_setting_aer_times.append(aer_elapsed)
-            total_aer_time += aer_elapsed
+    @staticmethod
+    def _build_chunk(
+        circuit: QuantumCircuit,
+        setting_ids: list[str],
+        setting_arrays: list[NDArray[np.uint8]],
+        per_setting_aer_times: NDArray[np.float64],
+        timed_out: bool = False,
+    ) -> RawDatasetChunk:
+        """Package per-setting outcomes from _run_compiled_batch() as a chunk.
 
-            bitstrings[setting.setting_id] = setting_bitstrings
+        Only the uint8 arrays are stored; RawDatasetChunk.get_bitstrings()
+        renders strings from them when a caller needs that form.
+        """
+        bitstring_arrays = dict(zip(setting_ids, setting_arrays, strict=True))
+        # Chunks are kept by reference in ProtocolState, so freeze the arrays
+        for array in setting_arrays:
+            array.setflags(write=False)
 
         return RawDatasetChunk(
-            bitstrings=bitstrings,
-            settings_executed=list(bitstrings.keys()),
+            bitstring_arrays=bitstring_arrays,
+            settings_executed=list(bitstring_arrays),
             n_qubits=circuit.num_qubits,
             metadata={
-                "aer_simulate_s": total_aer_time,
+                "aer_simulate_s": float(per_setting_aer_times.sum()),
                 "per_setting_aer_times_s": per_setting_aer_times,
-                "timed_out": hit_deadline,
+                "timed_out": timed_out,
             },
         )
 
+    def run_batch(
+        self,
+        workloads: list[tuple[QuantumCircuit, ObservableSet]],
+        total_budget: int,
+        backend: AerSimulator | Any = None,
+        seed: int | None = None,
+    ) -> list[Estimates]:
+        """Run the protocol on several (circuit, observables) pairs at once.
+
+        Every pair is planned first, and the measurement circuits of all
+        plans are executed together: one backend job per distinct shot
+        count instead of one run() per pair. Each pair is then updated and
+        finalized on its own, as run() would. Subclasses that override
+        acquire() fall back to calling run() per pair.
+
+        Args:
+            workloads: (state-preparation circuit, observable set) pairs.
+            total_budget: Shot budget for each pair.
+            backend: Quantum backend (defaults to the shared simulator).
+            seed: Random seed (uses config.random_seed if None).
+
+        Returns:
+            Estimates for each pair, in input order.
+        """
+        seed = seed if seed is not None else (self.config.random_seed or 42)
+        if type(self).acquire is not StaticProtocol.acquire:
+            return [
+                self.run(circuit, observable_set, total_budget, backend, seed=seed)
+                for circuit, observable_set in workloads
+            ]
+
+        backend = backend or _get_default_backend()
+        states: list[ProtocolState] = []
+        setting_ids: list[list[str]] = []
+        compiled_circuits: list[QuantumCircuit] = []
+        shots_list: list[int] = []
+        for circuit, observable_set in workloads:
+            state = self.initialize(observable_set, total_budget, seed)
+            plan = self.next_plan(state, total_budget)
+            settings = plan.settings[: len(plan.shots_per_setting)]
+            states.append(state)
+            setting_ids.append([setting.setting_id for setting in settings])
+            compiled_circuits.extend(
+                self._compiled_measurement_circuits(circuit, settings, backend)
+            )
+            shots_list.extend(plan.shots_per_setting[: len(settings)])
+
+        start = time.perf_counter()
+        all_arrays, all_times = self._run_compiled_batch(
+            compiled_circuits, backend, shots_list, seed
+        )
+        acquire_wall = time.perf_counter() - start
+
+        results: list[Estimates] = []
+        offset = 0
+        for (circuit, observable_set), state, ids in zip(
+            workloads, states, setting_ids, strict=True
+        ):
+            block = slice(offset, offset + len(ids))
+            offset += len(ids)
+            chunk = self._build_chunk(circuit, ids, all_arrays[block], all_times[block])
+            state.add_chunk(chunk)
+            state = self.update(state, chunk)
+            estimates = self.finalize(state, observable_set)
+            estimates.raw_chunks = state.accumulated_data
+            estimates.protocol_id = self.protocol_id
+            estimates.protocol_version = self.protocol_version
+            # The shared job's wall time is attributed by shot share
+            share = sum(shots_list[block]) / max(sum(shots_list), 1)
+            estimates.time_quantum_s = acquire_wall * share
+            results.append(estimates)
+
+        return results
+
+    def _compiled_measurement_circuit(
+        self,
+        circuit: QuantumCircuit,
+        setting: MeasurementSetting,
+        backend: Any,
+    ) -> QuantumCircuit:
+        """Return the transpiled measurement circuit for a setting."""
+        return self._compiled_measurement_circuits(circuit, [setting], backend)[0]
+
+    def _compiled_measurement_circuits(
+        self,
+        circuit: QuantumCircuit,
+        settings: list[MeasurementSetting],
+        backend: Any,
+    ) -> list[QuantumCircuit]:
+        """Return the transpiled measurement circuits for settings, in order.
+
+        Results are kept in an instance-level LRU cache keyed on the contents
+        of the state-preparation circuit, backend name and expanded basis, so later
+        rounds and runs skip transpile(). Settings whose bases expand to the
+        same full-width string (e.g. "IZI" and "ZZI") share one circuit
+        object, which _run_compiled_batch() simulates once. Settings missing
+        from the cache are built and then transpiled together in one call.
+        """
+        backend_name = getattr(backend, "name", type(backend).__name__)
+        n_qubits = circuit.num_qubits
+        bases = [
+            self._expand_basis(setting.measurement_basis, n_qubits, setting.target_qubits)
+            for setting in settings
+        ]
+        circuit_key = _circuit_key(circuit)
+        keys = [(circuit_key, backend_name, basis) for basis in bases]
+
+        compiled: dict[tuple, QuantumCircuit] = {}
+        missing: dict[tuple, QuantumCircuit] = {}
+        base_circuit: QuantumCircuit | None = None
+        for key, basis in zip(keys, bases, strict=True):
+            if key in compiled or key in missing:
+                continue
+            cached = self._compiled_cache.get(key)
+            if cached is not None:
+                self._compiled_cache.move_to_end(key)
+                compiled[key] = cached
+            else:
+                if base_circuit is None:
+                    base_circuit = self._base_circuit(circuit, circuit_key)
+                missing[key] = self._build_measurement_circuit(
+                    circuit=circuit,
+                    measurement_basis=basis,
+                    target_qubits=None,
+                    base_circuit=base_circuit,
+                )
+
+        if missing:
+            transpiled = self._transpile_circuits(list(missing.values()), backend)
+            for key, result in zip(missing, transpiled, strict=True):
+                compiled[key] = result
+                self._compiled_cache[key] = result
+                if len(self._compiled_cache) > _CIRCUIT_CACHE_SIZE:
+                    self._compiled_cache.popitem(last=False)
+
+        return [compiled[key] for key in keys]
+
+    def _base_circuit(self, circuit: QuantumCircuit, key: tuple | None = None) -> QuantumCircuit:
+        """Return ``circuit`` without final measurements, cached per circuit.
+
+        ``key`` is ``_circuit_key(circuit)`` when the caller already has it.
+        """
+        if key is None:
+            key = _circuit_key(circuit)
+        cached = self._base_circuit_cache.get(key)
+        if cached is not None:
+            self._base_circuit_cache.move_to_end(key)
+            return cached
+
+        base_circuit = circuit.remove_final_measurements(inplace=False)
+        self._base_circuit_cache[key] = base_circuit
+        if len(self._base_circuit_cache) > _CIRCUIT_CACHE_SIZE:
+            self._base_circuit_cache.popitem(last=False)
+        return base_circuit
+
     def _build_measurement_circuit(
         self,
         circuit: QuantumCircuit,
         measurement_basis: str,
-        target_qubits: list[int] | None,
+        target_qubits: Sequence[int] | None,
+        base_circuit: QuantumCircuit | None = None,
     ) -> QuantumCircuit:
-        """Construct a measurement circuit matching the requested basis."""
-        base_circuit = circuit.remove_final_measurements(inplace=False)
+        """Construct a measurement circuit matching the requested basis.
+
+        ``base_circuit`` is ``circuit`` without final measurements; callers
+        building several settings pass it in to skip the cache lookup.
+        """
+        if base_circuit is None:
+            base_circuit = self._base_circuit(circuit)
         basis = self._expand_basis(
             measurement_basis,
             base_circuit.num_qubits,
@@ -536,22 +1271,20 @@ class StaticProtocol(Protocol):
         )
         measurement_circuit = base_circuit.copy()
 
-        for qubit, basis_char in enumerate(basis):
-            if basis_char == "X":
-                measurement_circuit.h(qubit)
-            elif basis_char == "Y":
-                measurement_circuit.sdg(qubit)
-                measurement_circuit.h(qubit)
+        rotations = _rotation_layer(basis)
+        if rotations.data:
+            measurement_circuit.compose(rotations, inplace=True, copy=False)
 
         measurement_circuit.measure_all()
 
-        # Verify measurements were added
-        if measurement_circuit.num_clbits == 0:
-            raise RuntimeError(
-                f"measure_all() did not add classical bits. "
-                f"Circuit: {circuit.name}, basis={basis}, "
-                f"num_qubits={measurement_circuit.num_qubits}"
-            )
+        # Verify measurements were added (skipped under python -O)
+        if __debug__:
+            if measurement_circuit.num_clbits == 0:
+                raise RuntimeError(
+                    f"measure_all() did not add classical bits. "
+                    f"Circuit: {circuit.name}, basis={basis}, "
+                    f"num_qubits={measurement_circuit.num_qubits}"
+                )
 
         return measurement_circuit
 
@@ -559,48 +1292,142 @@ class StaticProtocol(Protocol):
         self,
         measurement_basis: str,
         n_qubits: int,
-        target_qubits: list[int] | None,
+        target_qubits: Sequence[int] | None,
     ) -> str:
         """Expand a basis string to cover all qubits."""
-        if not measurement_basis:
-            return "Z" * n_qubits
-
-        if len(measurement_basis) == n_qubits:
-            return measurement_basis.replace("I", "Z")
-
-        basis = ["Z"] * n_qubits
-        if target_qubits:
-            if len(measurement_basis) == len(target_qubits):
-                for basis_char, qubit in zip(measurement_basis, target_qubits, strict=False):
-                    basis[qubit] = basis_char
-            else:
-                for qubit in target_qubits:
-                    if qubit < len(measurement_basis):
-                        basis[qubit] = measurement_basis[qubit]
-        return "".join(basis).replace("I", "Z")
+        return _expand_basis_cached(
+            measurement_basis,
+            n_qubits,
+            tuple(target_qubits) if target_qubits is not None else None,
+        )
 
     def _transpile_circuit(
         self,
         circuit: QuantumCircuit,
         backend: Any,
     ) -> QuantumCircuit:
-        """Transpile a measurement circuit for the given backend.
+        """Transpile a measurement circuit for the given backend."""
+        return self._transpile_circuits([circuit], backend)[0]
 
-        For backends with a `.sample()` method, returns the circuit unchanged.
+    def _transpile_circuits(
+        self,
+        circuits: list[QuantumCircuit],
+        backend: Any,
+    ) -> list[QuantumCircuit]:
+        """Transpile measurement circuits for the given backend.
+
+        For backends with a `.sample()` method, and for Aer simulators that
+        accept every gate in a circuit as-is, circuits are returned unchanged.
+        Setting ``config.extra["verbatim"]`` skips transpilation for any
+        backend, for callers whose circuits are already in its native gate
+        set. The rest go to a single transpile() call, which Qiskit spreads
+        over processes for multi-circuit inputs.
+        """
+        if hasattr(backend, "sample"):
+            return list(circuits)
+
+        # Circuits built by _build_measurement_circuit always measure; the
+        # check is for hand-made ones and is skipped under python -O
+        if __debug__:
+            for circuit in circuits:
+                if circuit.num_clbits == 0:
+                    raise ValueError(
+                        f"Circuit has no classical bits for measurement. "
+                        f"name={circuit.name}, num_qubits={circuit.num_qubits}, "
+                        f"num_clbits={circuit.num_clbits}"
+                    )
+
+        results = list(circuits)
+        if self.config.extra.get("verbatim", False):
+            return results
+        pending = [
+            i for i, circuit in enumerate(circuits) if not _aer_runs_natively(circuit, backend)
+        ]
+        if pending:
+            transpiled = transpile(
+                [circuits[i] for i in pending],
+                backend,
+                optimization_level=self.config.transpile_optimization_level,
+            )
+            for i, result in zip(pending, transpiled, strict=True):
+                results[i] = result
+        return results
+
+    def _run_compiled_batch(
+        self,
+        compiled_circuits: list[QuantumCircuit],
+        backend: Any,
+        shots_list: list[int],
+        seed: int,
+    ) -> tuple[list[NDArray[np.uint8]], NDArray[np.float64]]:
+        """Execute transpiled circuits and return per-circuit outcomes and times.
+
+        Outcomes are returned as (n_shots, n_qubits) uint8 arrays.
+
+        Backends with a `.run()` method receive one job per distinct shot
+        count, with all circuits sharing that count batched together, or
+        several sub-jobs when config.shots_per_job is exceeded (see
+        _run_counts); a group's wall time is split evenly across its
+        circuits. With config.parallel_settings > 1 the circuits are split
+        into contiguous blocks run in separate processes, and times are
+        per-process wall times. Settings sharing a compiled circuit run as
+        one experiment whose counts are split back between them (see
+        _split_merged_counts). Backends with a `.sample()` method are
+        called once per circuit.
         """
+        arrays: list[NDArray[np.uint8]] = [np.zeros((0, 0), dtype=np.uint8)] * len(
+            compiled_circuits
+        )
+        times = np.zeros(len(compiled_circuits), dtype=np.float64)
+
         if hasattr(backend, "sample"):
-            return circuit
+            execute = self._bind_sampler(backend)
+            for i, (compiled, n_shots) in enumerate(
+                zip(compiled_circuits, shots_list, strict=True)
+            ):
+                aer_start = time.perf_counter()
+                bitstrings = execute(compiled, n_shots, seed)
+                times[i] = time.perf_counter() - aer_start
+                arrays[i] = _bitstrings_to_array(bitstrings, compiled.num_qubits)
+            return arrays, times
+
+        # Settings that share a compiled circuit (same basis and targets) are
+        # simulated once with their shots summed
+        unique_circuits: list[QuantumCircuit] = []
+        unique_shots: list[int] = []
+        owners: list[int] = []
+        positions: dict[int, int] = {}
+        for compiled, n_shots in zip(compiled_circuits, shots_list, strict=True):
+            position = positions.setdefault(id(compiled), len(unique_circuits))
+            if position == len(unique_circuits):
+                unique_circuits.append(compiled)
+                unique_shots.append(n_shots)
+            else:
+                unique_shots[position] += n_shots
+            owners.append(position)
 
-        from qiskit import transpile
+        n_workers = min(self.config.parallel_settings, len(unique_circuits))
+        if n_workers > 1:
+            unique_counts, unique_times = _run_counts_in_processes(
+                backend, unique_circuits, unique_shots, seed, n_workers, self.config.shots_per_job
+            )
+        else:
+            unique_counts, unique_times = _run_counts(
+                backend, unique_circuits, unique_shots, seed, self.config.shots_per_job
+            )
 
-        if circuit.num_clbits == 0:
-            raise ValueError(
-                f"Circuit has no classical bits for measurement. "
-                f"name={circuit.name}, num_qubits={circuit.num_qubits}, "
-                f"num_clbits={circuit.num_clbits}"
+        if len(unique_circuits) == len(compiled_circuits):
+            counts_list = unique_counts
+            times = unique_times
+        else:
+            counts_list, times = _split_merged_counts(
+                unique_counts, unique_times, owners, shots_list, seed
             )
 
-        return transpile(circuit, backend)
+        for i, counts in enumerate(counts_list):
+            arrays[i] = self._counts_to_bit_array(counts, compiled_circuits[i].num_qubits)
+
+        return arrays, times
 
     def _run_compiled_circuit(
         self,
@@ -611,29 +1438,67 @@ class StaticProtocol(Protocol):
     ) -> list[str]:
         """Execute an already-transpiled circuit and return normalized bitstrings."""
         if hasattr(backend, "sample"):
-            result = backend.sample(compiled, n_shots=n_shots, seed=seed)
-            bitstrings = result.bitstrings
-        else:
-            job = backend.run(compiled, shots=n_shots, seed_simulator=seed)
-            result = job.result()
+            return self._bind_sampler(backend)(compiled, n_shots, seed)
 
-            try:
-                counts = result.get_counts()
-            except Exception as e:
-                raise RuntimeError(
-                    f"No counts from circuit execution. "
-                    f"num_qubits={compiled.num_qubits}, "
-                    f"num_clbits={compiled.num_clbits}, shots={n_shots}. "
-                    f"Original error: {e}"
-                ) from e
+        # A one-circuit batch: same submission and error path as acquire()
+        counts_list, _ = _run_counts(backend, [compiled], [n_shots], seed)
+        return self._counts_to_bitstrings(counts_list[0])
+
+    def _bind_sampler(self, backend: Any) -> Callable[[QuantumCircuit, int, int], list[str]]:
+        """Resolve a `.sample()` backend's execution path once per batch.
 
-            bitstrings = []
-            for bitstring in sorted(counts.keys()):
-                count = counts[bitstring]
-                cleaned = bitstring.replace(" ", "")
-                bitstrings.extend([cleaned] * count)
+        The returned function takes (compiled, n_shots, seed) and returns
+        bitstrings in qubit order; the method lookup and the SamplingResult
+        import are done here rather than per circuit.
+        """
+        from ..backends.sampler import SamplingResult
 
-        return [bs[::-1] for bs in bitstrings]
+        sample = backend.sample
+        counts_to_bitstrings = self._counts_to_bitstrings
+
+        def execute(compiled: QuantumCircuit, n_shots: int, seed: int) -> list[str]:
+            result = sample(compiled, n_shots=n_shots, seed=seed)
+            if isinstance(result, SamplingResult):
+                # Expand the counts so each distinct outcome is reversed once
+                return counts_to_bitstrings(result.counts_data)
+            # Reverse each distinct outcome once; shots share the strings
+            outcomes = result.bitstrings
+            reversed_outcomes = {bs: bs[::-1] for bs in set(outcomes)}
+            return list(map(reversed_outcomes.__getitem__, outcomes))
+
+        return execute
+
+    @staticmethod
+    def _counts_to_bitstrings(counts: dict[str, int]) -> list[str]:
+        """Expand a counts dict into per-shot bitstrings in qubit order.
+
+        Each distinct outcome is cleaned and reversed once; the shots of an
+        outcome share that single string object.
+        """
+        bitstrings: list[str] = []
+        for bitstring in sorted(counts.keys()):
+            bitstrings.extend([bitstring.replace(" ", "")[::-1]] * counts[bitstring])
+
+        return bitstrings
+
+    @staticmethod
+    def _counts_to_bit_array(counts: dict[str, int], n_qubits: int) -> NDArray[np.uint8]:
+        """Expand a counts dict into a (n_shots, n_qubits) uint8 outcome array.
+
+        Rows follow the same order as _counts_to_bitstrings(). Only the
+        distinct outcomes are parsed; shots are produced by np.repeat.
+        """
+        keys = sorted(counts.keys())
+        if not keys:
+            return np.zeros((0, n_qubits), dtype=np.uint8)
+
+        packed = "".join(key.replace(" ", "") for key in keys).encode()
+        # ASCII '0'/'1' minus ord('0') gives 0/1; keys print the last qubit
+        # first, so reversing the columns (a strided view) gives qubit order
+        unique = np.frombuffer(packed, dtype=np.uint8).reshape(len(keys), -1) - ord("0")
+        unique = unique[:, ::-1]
+        repeats = np.fromiter((counts[key] for key in keys), dtype=np.int64, count=len(keys))
+        return np.repeat(unique, repeats, axis=0)
 
     def _execute_measurement_circuit(
         self,
@@ -668,11 +1533,127 @@ class AdaptiveProtocol(Protocol):
     additional infrastructure for adaptive decision-making.
     """
 
-    def __init__(self, config: ProtocolConfig | None = None) -> None:
-        super().__init__(config)
-        # Default to more rounds for adaptive protocols
-        if config is None:
-            self.config.max_rounds = 10
+    default_max_rounds = 10
+    # Rounds run() may plan and acquire in one batch (see next_plans())
+    lookahead = 1
+
+    def next_plans(
+        self,
+        state: ProtocolState,
+        remaining_budget: int,
+        k: int,
+    ) -> list[MeasurementPlan]:
+        """Plan up to k rounds ahead for a single batched acquisition.
+
+        run() calls this instead of next_plan() when `lookahead` > 1,
+        acquires the returned plans together, then applies update() and
+        the convergence checks round by round. Rounds left once the
+        protocol converges are discarded. The plans share the state passed
+        in, so only protocols whose next rounds do not depend on the
+        intervening data should return more than one. The default plans a
+        single round.
+
+        Args:
+            state: Current protocol state.
+            remaining_budget: Remaining shot budget, shared by all plans.
+            k: Maximum number of plans to return.
+
+        Returns:
+            Between 1 and k measurement plans, in round order.
+        """
+        return [self.next_plan(state, remaining_budget)]
+
+    def _acquire_plans(
+        self,
+        circuit: QuantumCircuit,
+        plans: list[MeasurementPlan],
+        backend: AerSimulator | Any,
+        seed: int,
+        deadline: float | None = None,
+    ) -> list[RawDatasetChunk]:
+        """Acquire several plans with one acquire() call, split per plan.
+
+        Setting IDs are prefixed with the plan index so that plans may reuse
+        IDs; acquire() must key its dict-format outcomes by setting_id. If
+        the deadline cut the acquisition short, chunks stop after the first
+        plan with no outcomes, and the last chunk carries timed_out.
+        """
+        settings: list[MeasurementSetting] = []
+        shots: list[int] = []
+        observable_setting_map: dict[str, list[int]] = {}
+        for index, plan in enumerate(plans):
+            offset = len(settings)
+            for observable_id, setting_indices in plan.observable_setting_map.items():
+                observable_setting_map.setdefault(observable_id, []).extend(
+                    offset + i for i in setting_indices
+                )
+            settings.extend(
+                replace(setting, setting_id=f"{index}/{setting.setting_id}")
+                for setting in plan.settings
+            )
+            shots.extend(plan.shots_per_setting)
+
+        merged = MeasurementPlan(
+            settings=settings,
+            shots_per_setting=shots,
+            observable_setting_map=observable_setting_map,
+            metadata={"lookahead_rounds": len(plans)},
+        )
+        chunk = self.acquire(circuit, merged, backend, seed, deadline=deadline)
+
+        executed = {setting_id: i for i, setting_id in enumerate(chunk.settings_executed)}
+        times = np.asarray(chunk.metadata.get("per_setting_aer_times_s", ()), dtype=np.float64)
+        if len(times) != len(executed):
+            times = np.zeros(len(executed))
+
+        chunks: list[RawDatasetChunk] = []
+        for index, plan in enumerate(plans):
+            keys = [
+                (f"{index}/{setting.setting_id}", setting.setting_id)
+                for setting in plan.settings
+                if f"{index}/{setting.setting_id}" in executed
+            ]
+            if not keys and chunks:
+                break
+            setting_times = times[[executed[key] for key, _ in keys]]
+            chunks.append(
+                RawDatasetChunk(
+                    bitstrings={
+                        sid: chunk.bitstrings[key] for key, sid in keys if key in chunk.bitstrings
+                    },
+                    bitstring_arrays={
+                        sid: chunk.bitstring_arrays[key]
+                        for key, sid in keys
+                        if key in chunk.bitstring_arrays
+                    },
+                    packed_outcomes={
+                        sid: chunk.packed_outcomes[key]
+                        for key, sid in keys
+                        if key in chunk.packed_outcomes
+                    },
+                    settings_executed=[sid for _, sid in keys],
+                    n_qubits=chunk.n_qubits,
+                    metadata={
+                        **chunk.metadata,
+                        "aer_simulate_s": float(setting_times.sum()),
+                        "per_setting_aer_times_s": setting_times,
+                        "timed_out": False,
+                    },
+                )
+            )
+            if not keys:
+                break
+        chunks[-1].metadata["timed_out"] = chunk.metadata.get("timed_out", False)
+        return chunks
+
+    def _quick_estimate(self, state: ProtocolState) -> NDArray[np.float64]:
+        """Per-round point estimates used by run()'s stability check.
+
+        Defaults to the finalize() estimates; override with a cheaper
+        running estimate where one is available.
+        """
+        estimates = self.finalize(state, state.observable_set)
+        return np.array([est.estimate for est in estimates.estimates], dtype=float)
 
     @abstractmethod
     def check_convergence(
@@ -0,0 +1,170 @@
+"""Pauli expectation estimators shared by the direct baselines.
+
+Outcomes are stored as packed uint64 words (see ``_kernels.pack_words``), so
+an observable's ±1 eigenvalue on a shot is (-1)^parity(words & support mask).
+The number of odd-parity shots is a sufficient statistic for the mean and
+standard error, so protocols can also accumulate it while ingesting data.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ...observables import Observable
+from .._kernels import group_odd_counts, odd_counter, support_words
+from ..state import ObservableEstimate
+
+
+def odd_counts(
+    outcomes: NDArray[np.uint64], pauli_strings: list[str], parallel: bool = True
+) -> NDArray[np.int64]:
+    """Shots of packed ``outcomes`` with odd parity on each Pauli's support.
+
+    The support masks are stacked and counted in one pass (a Numba kernel
+    when available, parallel unless ``parallel=False``, otherwise an
+    (n_shots, K) NumPy broadcast). A single Pauli uses its memoized
+    ``_kernels.odd_counter`` instead.
+    """
+    if len(pauli_strings) == 1:
+        return np.array([odd_counter(pauli_strings[0])(outcomes)], dtype=np.int64)
+    masks = np.stack([support_words(pauli) for pauli in pauli_strings])
+    return group_odd_counts(outcomes, masks, parallel=parallel)
+
+
+def mean_se_from_counts(
+    odd: NDArray[np.int64] | list[int],
+    n_shots: int | NDArray[np.int64] | list[int],
+    coefficients: list[float],
+) -> list[tuple[float, float]]:
+    """Estimates from odd-parity counts, the sufficient statistic of ±1 data.
+
+    Args:
+        odd: Number of shots with eigenvalue -1, per observable.
+        n_shots: Shots behind the counts (positive), shared or per observable.
+        coefficients: Observable coefficients.
+
+    Returns:
+        (expectation value, standard error) per observable, in order.
+    """
+    n_shots = np.asarray(n_shots, dtype=np.float64)
+    means = 1.0 - 2.0 * np.asarray(odd, dtype=np.int64) / n_shots
+    # For ±1 eigenvalues the sample variance (ddof=1) is n(1 - mean²)/(n - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correction = np.where(n_shots > 1, n_shots / (n_shots - 1), np.nan)
+    stds = np.sqrt(np.clip(1.0 - means**2, 0.0, None) * correction)
+    scale = np.asarray(coefficients, dtype=np.float64)
+    ses = stds / np.sqrt(n_shots) * np.abs(scale)
+    return list(zip((means * scale).tolist(), ses.tolist(), strict=True))
+
+
+def grouped_estimates(
+    observables: list[Observable],
+    group_ids: Mapping[str, str],
+    group_shots: Mapping[str, int],
+    parity_counts: Mapping[str, int],
+    group_metadata: Mapping[str, Mapping[str, Any]] | None = None,
+) -> list[ObservableEstimate]:
+    """Per-observable estimates of a grouped baseline from its accumulated counts.
+
+    Every measured observable is estimated in one mean_se_from_counts() call.
+    Observables outside every group get (0, inf) with no settings, and
+    those whose group collected no shots get (0, inf) with one setting.
+
+    Args:
+        observables: Observables to report, in output order.
+        group_ids: Group measuring each observable_id.
+        group_shots: Shots collected per group_id.
+        parity_counts: Odd-parity shots per observable_id.
+        group_metadata: Extra metadata entries per group_id, added to the
+            estimates of the group's measured observables.
+
+    Returns:
+        One ObservableEstimate per observable, in order.
+    """
+    shots = {
+        obs.observable_id: group_shots.get(group_ids[obs.observable_id], 0)
+        for obs in observables
+        if obs.observable_id in group_ids
+    }
+    measured = [obs for obs in observables if shots.get(obs.observable_id)]
+    results = dict(
+        zip(
+            [obs.observable_id for obs in measured],
+            mean_se_from_counts(
+                [parity_counts[obs.observable_id] for obs in measured],
+                [shots[obs.observable_id] for obs in measured],
+                [obs.coefficient for obs in measured],
+            ),
+            strict=True,
+        )
+    )
+
+    estimates = []
+    for obs in observables:
+        group_id = group_ids.get(obs.observable_id)
+        if group_id is None or obs.observable_id not in results:
+            estimate = ObservableEstimate(
+                observable_id=obs.observable_id,
+                estimate=0.0,
+                se=float("inf"),
+                n_shots=0,
+                n_settings=0 if group_id is None else 1,
+            )
+        else:
+            expectation, se = results[obs.observable_id]
+            extra = group_metadata.get(group_id, {}) if group_metadata else {}
+            estimate = ObservableEstimate(
+                observable_id=obs.observable_id,
+                estimate=expectation,
+                se=se,
+                n_shots=shots[obs.observable_id],
+                n_settings=1,
+                metadata={"group_id": group_id, **extra},
+            )
+        estimates.append(estimate)
+    return estimates
+
+
+def group_mean_se(
+    outcomes: NDArray[np.uint64],
+    pauli_strings: list[str],
+    coefficients: list[float],
+) -> list[tuple[float, float]]:
+    """Estimate several observables from the same packed outcomes at once.
+
+    Args:
+        outcomes: Packed (n_shots, n_words) uint64 outcomes (non-empty).
+        pauli_strings: Pauli strings of the observables.
+        coefficients: Observable coefficients.
+
+    Returns:
+        (expectation value, standard error) per observable, in order.
+    """
+    return mean_se_from_counts(odd_counts(outcomes, pauli_strings), len(outcomes), coefficients)
+
+
+def pauli_mean_se(
+    outcomes: NDArray[np.uint64],
+    pauli_string: str,
+    coefficient: float,
+) -> tuple[float, float]:
+    """Estimate one Pauli observable from packed outcomes.
+
+    For P = P_1 ⊗ ... ⊗ P_n the estimate is the mean of (-1)^parity, where
+    parity counts the 1s on qubits with P_i ≠ I, scaled by the coefficient.
+
+    Args:
+        outcomes: Packed (n_shots, n_words) uint64 outcomes.
+        pauli_string: The Pauli operator being measured.
+        coefficient: Observable coefficient.
+
+    Returns:
+        Tuple of (expectation value, standard error); (0, inf) without shots.
+    """
+    if not len(outcomes):
+        return 0.0, float("inf")
+    return group_mean_se(outcomes, [pauli_string], [coefficient])[0]
@@ -16,9 +16,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ...observables import (
     CommutingGroup,
+    Observable,
     ObservableSet,
     partition_observable_set,
 )
@@ -28,10 +30,10 @@ from ..state import (
     Estimates,
     MeasurementPlan,
     MeasurementSetting,
-    ObservableEstimate,
     ProtocolState,
     RawDatasetChunk,
 )
+from ._estimate import grouped_estimates, odd_counts, pauli_mean_se
 
 
 @dataclass
@@ -41,13 +43,20 @@ class DirectGroupedState(ProtocolState):
     Additional attributes:
         groups: List of CommutingGroup objects.
         shots_per_group: Number of shots allocated per group.
-        group_bitstrings: Collected bitstrings for each group.
+        group_shots: Shots collected for each group. The outcomes themselves
+            stay in the chunks of accumulated_data.
+        parity_counts: Shots with odd parity on each observable's support,
+            accumulated by update() so finalize() needs no pass over outcomes.
+        observable_group_ids: Group measuring each observable_id, filled group
+            by group at initialize() so finalize() needs no regrouping.
         grouping_method: Method used for grouping.
     """
 
     groups: list[CommutingGroup] = field(default_factory=list)
     shots_per_group: int = 0
-    group_bitstrings: dict[str, list[str]] = field(default_factory=dict)
+    group_shots: dict[str, int] = field(default_factory=dict)
+    parity_counts: dict[str, int] = field(default_factory=dict)
+    observable_group_ids: dict[str, str] = field(default_factory=dict)
     grouping_method: str = "greedy"
 
 
@@ -64,20 +73,26 @@ class DirectGroupedProtocol(StaticProtocol):
         protocol_id: "direct_grouped"
         protocol_version: "1.0.0"
         grouping_method: Method for partitioning ("greedy" or "sorted_insertion")
+        max_workers: Threads counting parities across groups in update()
+            (None or 1 counts serially)
     """
 
     protocol_id: str = "direct_grouped"
     protocol_version: str = "1.0.0"
     grouping_method: str = "greedy"
+    max_workers: int | None = None
 
-    def __init__(self, grouping_method: str = "greedy") -> None:
+    def __init__(self, grouping_method: str = "greedy", max_workers: int | None = None) -> None:
         """Initialize protocol.
 
         Args:
             grouping_method: "greedy" or "sorted_insertion"
+            max_workers: Thread pool size for counting groups in parallel;
+                worthwhile with hundreds of groups per chunk.
         """
         super().__init__()
         self.grouping_method = grouping_method
+        self.max_workers = max_workers
 
     def initialize(
         self,
@@ -102,9 +117,6 @@ class DirectGroupedProtocol(StaticProtocol):
         # Ensure at least 1 shot per group (if budget allows)
         shots_per_group = max(1, total_budget // G) if G > 0 else 0
 
-        # Initialize storage for each group
-        group_bitstrings = {g.group_id: [] for g in groups}
-
         return DirectGroupedState(
             observable_set=observable_set,
             total_budget=total_budget,
@@ -112,8 +124,10 @@ class DirectGroupedProtocol(StaticProtocol):
             seed=seed,
             n_rounds=0,
             groups=groups,
+            observable_group_ids={
+                obs.observable_id: group.group_id for group in groups for obs in group.observables
+            },
             shots_per_group=shots_per_group,
-            group_bitstrings=group_bitstrings,
             grouping_method=self.grouping_method,
             metadata={
                 "protocol_id": self.protocol_id,
@@ -141,12 +155,14 @@ class DirectGroupedProtocol(StaticProtocol):
         settings = []
         shots_per_setting = []
         observable_setting_map: dict[str, list[int]] = {}
+        # One read-only target tuple shared by every setting
+        target_qubits = tuple(range(grouped_state.observable_set.n_qubits))
 
         for i, group in enumerate(grouped_state.groups):
             setting = MeasurementSetting(
                 setting_id=group.group_id,
                 measurement_basis=group.measurement_basis,
-                target_qubits=list(range(grouped_state.observable_set.n_qubits)),
+                target_qubits=target_qubits,
                 metadata={
                     "group_size": group.size,
                     "observable_ids": [obs.observable_id for obs in group.observables],
@@ -187,17 +203,54 @@ class DirectGroupedProtocol(StaticProtocol):
         if not isinstance(grouped_state, DirectGroupedState):
             raise TypeError("Expected DirectGroupedState")
 
-        # Store bitstrings for each group
-        for setting_id, bitstrings in data_chunk.bitstrings.items():
-            grouped_state.group_bitstrings[setting_id].extend(bitstrings)
+        groups = {group.group_id: group for group in grouped_state.groups}
+        parity_counts = grouped_state.parity_counts
+
+        # Count shots and odd parities for each group as outcomes stream in
+        batches: list[tuple[list[Observable], NDArray[np.uint64]]] = []
+        for setting_id in data_chunk.setting_ids:
+            outcomes = data_chunk.get_packed_words(setting_id)
+            if len(outcomes):
+                shots = grouped_state.group_shots
+                shots[setting_id] = shots.get(setting_id, 0) + len(outcomes)
+                batches.append((groups[setting_id].observables, outcomes))
+
+        for (observables, _), odd in zip(batches, self._count_groups(batches), strict=True):
+            for obs, n_odd in zip(observables, odd.tolist(), strict=True):
+                parity_counts[obs.observable_id] = parity_counts.get(obs.observable_id, 0) + n_odd
 
         # Update budget tracking
-        total_new_shots = sum(len(bs) for bs in data_chunk.bitstrings.values())
+        total_new_shots = data_chunk.n_shots
         grouped_state.remaining_budget -= total_new_shots
         grouped_state.round_number += 1
 
         return grouped_state
 
+    def _count_groups(
+        self, batches: list[tuple[list[Observable], NDArray[np.uint64]]]
+    ) -> list[NDArray[np.int64]]:
+        """Odd-parity counts for each (observables, packed outcomes) batch.
+
+        Groups are independent, so with ``max_workers`` > 1 they are counted
+        on a thread pool; the NumPy popcount and the Numba kernel both run
+        without holding the GIL. Threads use the serial Numba kernel, since
+        parallel kernels cannot be entered concurrently under Numba's
+        default threading layer.
+        """
+        threaded = bool(self.max_workers and self.max_workers > 1 and len(batches) > 1)
+
+        def count(batch: tuple[list[Observable], NDArray[np.uint64]]) -> NDArray[np.int64]:
+            observables, outcomes = batch
+            paulis = [obs.pauli_string for obs in observables]
+            return odd_counts(outcomes, paulis, parallel=not threaded)
+
+        if threaded:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(count, batches))
+        return [count(batch) for batch in batches]
+
     def finalize(
         self,
         state: ProtocolState,
@@ -219,55 +272,12 @@ class DirectGroupedProtocol(StaticProtocol):
         if not isinstance(grouped_state, DirectGroupedState):
             raise TypeError("Expected DirectGroupedState")
 
-        estimates = []
-
-        # Build mapping from observable_id to group
-        obs_to_group = {}
-        for group in grouped_state.groups:
-            for obs in group.observables:
-                obs_to_group[obs.observable_id] = group
-
-        for obs in observable_set.observables:
-            group = obs_to_group.get(obs.observable_id)
-
-            if group is None:
-                estimate = ObservableEstimate(
-                    observable_id=obs.observable_id,
-                    estimate=0.0,
-                    se=float("inf"),
-                    n_shots=0,
-                    n_settings=0,
-                )
-            else:
-                bitstrings = grouped_state.group_bitstrings.get(group.group_id, [])
-
-                if not bitstrings:
-                    estimate = ObservableEstimate(
-                        observable_id=obs.observable_id,
-                        estimate=0.0,
-                        se=float("inf"),
-                        n_shots=0,
-                        n_settings=1,
-                    )
-                else:
-                    # Compute expectation value from shared bitstrings
-                    expectation, se = self._estimate_from_bitstrings(
-                        bitstrings,
-                        obs.pauli_string,
-                        group.measurement_basis,
-                        obs.coefficient,
-                    )
-
-                    estimate = ObservableEstimate(
-                        observable_id=obs.observable_id,
-                        estimate=expectation,
-                        se=se,
-                        n_shots=len(bitstrings),
-                        n_settings=1,
-                        metadata={"group_id": group.group_id},
-                    )
-
-            estimates.append(estimate)
+        estimates = grouped_estimates(
+            observable_set.observables,
+            grouped_state.observable_group_ids,
+            grouped_state.group_shots,
+            grouped_state.parity_counts,
+        )
 
         return Estimates(
             estimates=estimates,
@@ -280,21 +290,21 @@ class DirectGroupedProtocol(StaticProtocol):
             },
         )
 
-    def _estimate_from_bitstrings(
+    def _estimate_from_outcomes(
         self,
-        bitstrings: list[str],
+        outcomes: NDArray[np.uint64],
         pauli_string: str,
         measurement_basis: str,
         coefficient: float,
     ) -> tuple[float, float]:
-        """Estimate expectation value from grouped measurement bitstrings.
+        """Estimate expectation value from grouped measurement outcomes.
 
         When measuring in a shared basis, we need to consider which qubits
         are relevant for each observable. The eigenvalue for observable P
         is determined by the parity of outcomes on P's support.
 
         Args:
-            bitstrings: List of measurement outcome bitstrings.
+            outcomes: Packed (n_shots, n_words) uint64 outcomes.
             pauli_string: The Pauli observable being estimated.
             measurement_basis: The shared measurement basis.
             coefficient: Observable coefficient.
@@ -302,20 +312,4 @@ class DirectGroupedProtocol(StaticProtocol):
         Returns:
             Tuple of (expectation value, standard error).
         """
-        if not bitstrings:
-            return 0.0, float("inf")
-
-        # Get positions where the observable has non-identity operators
-        support = [i for i, p in enumerate(pauli_string) if p != "I"]
-
-        # Vectorized eigenvalue computation (numpy, no Python loop)
-        bs_array = np.frombuffer(
-            "".join(bitstrings).encode(), dtype=np.uint8
-        ).reshape(len(bitstrings), -1)[:, support]
-        parities = (bs_array - 48).sum(axis=1) % 2
-        eigenvalues_array = np.where(parities == 0, 1.0, -1.0)
-        mean = float(np.mean(eigenvalues_array)) * coefficient
-        std = float(np.std(eigenvalues_array, ddof=1))
-        se = std / np.sqrt(len(eigenvalues_array)) * abs(coefficient)
-
-        return mean, se
+        return pauli_mean_se(outcomes, pauli_string, coefficient)
@@ -14,6 +14,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ...observables import ObservableSet
 from ..base import StaticProtocol
@@ -26,6 +27,7 @@ from ..state import (
     ProtocolState,
     RawDatasetChunk,
 )
+from ._estimate import mean_se_from_counts, odd_counts, pauli_mean_se
 
 
 @dataclass
@@ -34,11 +36,18 @@ class DirectNaiveState(ProtocolState):
 
     Additional attributes:
         shots_per_observable: Number of shots allocated per observable.
-        observable_bitstrings: Collected bitstrings for each observable.
+        observable_shots: Shots collected for each observable. The outcomes
+            themselves stay in the chunks of accumulated_data.
+        parity_counts: Shots with odd parity on each observable's support,
+            accumulated by update() so finalize() needs no pass over outcomes.
+        setting_observable_ids: Observable measured by each setting_id,
+            fixed at initialize() so update() needs no id parsing.
     """
 
     shots_per_observable: int = 0
-    observable_bitstrings: dict[str, list[str]] = field(default_factory=dict)
+    observable_shots: dict[str, int] = field(default_factory=dict)
+    parity_counts: dict[str, int] = field(default_factory=dict)
+    setting_observable_ids: dict[str, str] = field(default_factory=dict)
 
 
 @register_protocol
@@ -76,8 +85,10 @@ class DirectNaiveProtocol(StaticProtocol):
         # Ensure at least 1 shot per observable (if budget allows)
         shots_per_observable = max(1, total_budget // M) if M > 0 else 0
 
-        # Initialize storage for each observable
-        observable_bitstrings = {obs.observable_id: [] for obs in observable_set.observables}
+        # One setting per observable, in observable order
+        setting_observable_ids = {
+            f"setting_{i}": obs.observable_id for i, obs in enumerate(observable_set.observables)
+        }
 
         return DirectNaiveState(
             observable_set=observable_set,
@@ -86,7 +97,7 @@ class DirectNaiveProtocol(StaticProtocol):
             seed=seed,
             n_rounds=0,
             shots_per_observable=shots_per_observable,
-            observable_bitstrings=observable_bitstrings,
+            setting_observable_ids=setting_observable_ids,
             metadata={"protocol_id": self.protocol_id},
         )
 
@@ -111,15 +122,17 @@ class DirectNaiveProtocol(StaticProtocol):
         settings = []
         shots_per_setting = []
         observable_setting_map: dict[str, list[int]] = {}
+        # One read-only target tuple shared by every setting
+        target_qubits = tuple(range(state.observable_set.n_qubits))
 
-        for i, obs in enumerate(state.observable_set.observables):
+        setting_ids = direct_state.setting_observable_ids
+        observables = state.observable_set.observables
+        for i, (setting_id, obs) in enumerate(zip(setting_ids, observables, strict=True)):
             # Native measurement basis is the Pauli string with I -> Z
-            basis = obs.pauli_string.replace("I", "Z")
-
             setting = MeasurementSetting(
-                setting_id=f"setting_{i}",
-                measurement_basis=basis,
-                target_qubits=list(range(obs.n_qubits)),
+                setting_id=setting_id,
+                measurement_basis=obs.native_basis,
+                target_qubits=target_qubits,
                 metadata={"observable_id": obs.observable_id},
             )
             settings.append(setting)
@@ -151,15 +164,23 @@ class DirectNaiveProtocol(StaticProtocol):
         if not isinstance(direct_state, DirectNaiveState):
             raise TypeError("Expected DirectNaiveState")
 
-        # Store bitstrings for each setting
-        for setting_id, bitstrings in data_chunk.bitstrings.items():
-            # Find which observable this setting corresponds to
-            setting_idx = int(setting_id.split("_")[1])
-            obs = direct_state.observable_set.observables[setting_idx]
-            direct_state.observable_bitstrings[obs.observable_id].extend(bitstrings)
+        observable_set = direct_state.observable_set
+
+        # Count shots and odd parities for each observable as outcomes stream in
+        for setting_id in data_chunk.setting_ids:
+            outcomes = data_chunk.get_packed_words(setting_id)
+            if not len(outcomes):
+                continue
+            obs_id = direct_state.setting_observable_ids[setting_id]
+            shots = direct_state.observable_shots
+            shots[obs_id] = shots.get(obs_id, 0) + len(outcomes)
+
+            pauli = observable_set.get_by_id(obs_id).pauli_string
+            n_odd = int(odd_counts(outcomes, [pauli])[0])
+            direct_state.parity_counts[obs_id] = direct_state.parity_counts.get(obs_id, 0) + n_odd
 
         # Update budget tracking
-        total_new_shots = sum(len(bs) for bs in data_chunk.bitstrings.values())
+        total_new_shots = data_chunk.n_shots
         direct_state.remaining_budget -= total_new_shots
         direct_state.round_number += 1
 
@@ -185,10 +206,28 @@ class DirectNaiveProtocol(StaticProtocol):
 
         estimates = []
 
+        # Estimate every measured observable at once from its parity count
+        measured = [
+            obs
+            for obs in observable_set.observables
+            if direct_state.observable_shots.get(obs.observable_id, 0)
+        ]
+        results = dict(
+            zip(
+                [obs.observable_id for obs in measured],
+                mean_se_from_counts(
+                    [direct_state.parity_counts[obs.observable_id] for obs in measured],
+                    [direct_state.observable_shots[obs.observable_id] for obs in measured],
+                    [obs.coefficient for obs in measured],
+                ),
+                strict=True,
+            )
+        )
+
         for obs in observable_set.observables:
-            bitstrings = direct_state.observable_bitstrings.get(obs.observable_id, [])
+            n_shots = direct_state.observable_shots.get(obs.observable_id, 0)
 
-            if not bitstrings:
+            if not n_shots:
                 # No data collected
                 estimate = ObservableEstimate(
                     observable_id=obs.observable_id,
@@ -198,16 +237,13 @@ class DirectNaiveProtocol(StaticProtocol):
                     n_settings=0,
                 )
             else:
-                # Compute expectation value from bitstrings
-                expectation, se = self._estimate_from_bitstrings(
-                    bitstrings, obs.pauli_string, obs.coefficient
-                )
+                expectation, se = results[obs.observable_id]
 
                 estimate = ObservableEstimate(
                     observable_id=obs.observable_id,
                     estimate=expectation,
                     se=se,
-                    n_shots=len(bitstrings),
+                    n_shots=n_shots,
                     n_settings=1,
                 )
 
@@ -221,45 +257,25 @@ class DirectNaiveProtocol(StaticProtocol):
             metadata={"n_observables": len(observable_set)},
         )
 
-    def _estimate_from_bitstrings(
+    def _estimate_from_outcomes(
         self,
-        bitstrings: list[str],
+        outcomes: NDArray[np.uint64],
         pauli_string: str,
         coefficient: float,
     ) -> tuple[float, float]:
-        """Estimate expectation value from measurement bitstrings.
+        """Estimate expectation value from packed measurement outcomes.
 
         For a Pauli string P = P_1 ⊗ P_2 ⊗ ... ⊗ P_n, the expectation
         value is estimated as the mean of (-1)^(parity) where parity
-        counts the number of 1s on qubits where P_i ≠ I.
+        counts the number of 1s on qubits where P_i ≠ I, i.e. the
+        popcount of each shot's words masked by P's support.
 
         Args:
-            bitstrings: List of measurement outcome bitstrings.
+            outcomes: Packed (n_shots, n_words) uint64 outcomes.
             pauli_string: The Pauli operator being measured.
             coefficient: Observable coefficient.
 
         Returns:
             Tuple of (expectation value, standard error).
         """
-        if not bitstrings:
-            return 0.0, float("inf")
-
-        # Get positions where we have non-identity Paulis
-        support = [i for i, p in enumerate(pauli_string) if p != "I"]
-
-        # Vectorised eigenvalue computation:
-        # Convert bitstrings to a 2-D uint8 array, slice support columns,
-        # then compute parity and eigenvalues without a Python loop.
-        bs_array = np.frombuffer(
-            "".join(bitstrings).encode(), dtype=np.uint8
-        ).reshape(len(bitstrings), -1)[:, support]
-        # ASCII '1' = 49; subtract ord('0')=48 so '0'->0, '1'->1
-        parities = (bs_array - 48).sum(axis=1) % 2
-        eigenvalues_array = np.where(parities == 0, 1.0, -1.0)
-
-        # Compute mean and standard error
-        mean = float(np.mean(eigenvalues_array)) * coefficient
-        std = float(np.std(eigenvalues_array, ddof=1))
-        se = std / np.sqrt(len(eigenvalues_array)) * abs(coefficient)
-
-        return mean, se
+        return pauli_mean_se(outcomes, pauli_string, coefficient)
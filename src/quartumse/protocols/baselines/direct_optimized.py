@@ -7,7 +7,9 @@ Rather than uniform allocation, it allocates shots proportionally to group
 This represents the best achievable performance for direct measurement
 approaches without using advanced techniques like classical shadows.
 
-Shot allocation: Proportional to sqrt(group_size) * variance_estimate.
+Shot allocation: Proportional to sqrt(group_size) by default, or to the
+group's coefficient norm (sqrt(sum c_i^2) or sum |c_i|), the variance-optimal
+split for independent groups.
 Measurement basis: Shared basis for each commuting group.
 Expected scaling: O(G) measurement settings with optimal allocation.
 """
@@ -17,6 +19,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ...observables import (
     CommutingGroup,
@@ -29,10 +32,43 @@ from ..state import (
     Estimates,
     MeasurementPlan,
     MeasurementSetting,
-    ObservableEstimate,
     ProtocolState,
     RawDatasetChunk,
 )
+from ._estimate import grouped_estimates, odd_counts, pauli_mean_se
+
+
+def _allocate_shots(
+    weights: NDArray[np.float64],
+    total_budget: int,
+    min_shots: int = 1,
+) -> NDArray[np.int64]:
+    """Split a shot budget in proportion to non-negative weights.
+
+    Every group first receives ``min_shots``; the rest of the budget is
+    split proportionally and rounded by largest remainder, so the result
+    sums exactly to ``total_budget`` whenever it covers the minimums.
+
+    Args:
+        weights: Allocation weight per group.
+        total_budget: Total shots to distribute.
+        min_shots: Minimum shots per group.
+
+    Returns:
+        Integer shots per group.
+    """
+    shots = np.full(len(weights), min_shots, dtype=np.int64)
+    spare = total_budget - int(shots.sum())
+    if spare <= 0 or not len(weights):
+        return shots
+
+    ideal = spare * weights / weights.sum()
+    extra = np.floor(ideal).astype(np.int64)
+    # Hand the rounding residual to the largest fractional parts
+    residual = spare - int(extra.sum())
+    if residual:
+        extra[np.argsort(extra - ideal, kind="stable")[:residual]] += 1
+    return shots + extra
 
 
 @dataclass
@@ -42,13 +78,20 @@ class DirectOptimizedState(ProtocolState):
     Additional attributes:
         groups: List of CommutingGroup objects.
         shots_per_group: Optimally allocated shots per group.
-        group_bitstrings: Collected bitstrings for each group.
+        group_shots: Shots collected for each group. The outcomes themselves
+            stay in the chunks of accumulated_data.
+        parity_counts: Shots with odd parity on each observable's support,
+            accumulated by update() so finalize() needs no pass over outcomes.
+        observable_group_ids: Group measuring each observable_id, filled group
+            by group at initialize() so finalize() needs no regrouping.
         allocation_weights: Allocation weights for each group.
     """
 
     groups: list[CommutingGroup] = field(default_factory=list)
     shots_per_group: dict[str, int] = field(default_factory=dict)
-    group_bitstrings: dict[str, list[str]] = field(default_factory=dict)
+    group_shots: dict[str, int] = field(default_factory=dict)
+    parity_counts: dict[str, int] = field(default_factory=dict)
+    observable_group_ids: dict[str, str] = field(default_factory=dict)
     allocation_weights: dict[str, float] = field(default_factory=dict)
 
 
@@ -72,7 +115,7 @@ class DirectOptimizedProtocol(StaticProtocol):
 
     protocol_id: str = "direct_optimized"
     protocol_version: str = "1.0.0"
-    allocation_strategy: str = "proportional"  # or "equal_se", "max_min"
+    allocation_strategy: str = "proportional"  # or "equal_se", "max_min", "l2", "l1"
 
     def __init__(self, allocation_strategy: str = "proportional") -> None:
         """Initialize protocol.
@@ -82,6 +125,10 @@ class DirectOptimizedProtocol(StaticProtocol):
                 - "proportional": Proportional to sqrt(group_size)
                 - "equal_se": Aim for equal SE across observables
                 - "max_min": Maximize minimum shots per observable
+                - "l2": Proportional to sqrt(sum of squared coefficients),
+                  minimizing the variance of the summed estimate
+                - "l1": Proportional to sum of |coefficients| (worst-case
+                  covariance within a group)
         """
         super().__init__()
         self.allocation_strategy = allocation_strategy
@@ -108,9 +155,6 @@ class DirectOptimizedProtocol(StaticProtocol):
         # Compute optimal allocation
         shots_per_group, allocation_weights = self._compute_allocation(groups, total_budget)
 
-        # Initialize storage
-        group_bitstrings = {g.group_id: [] for g in groups}
-
         return DirectOptimizedState(
             observable_set=observable_set,
             total_budget=total_budget,
@@ -118,8 +162,10 @@ class DirectOptimizedProtocol(StaticProtocol):
             seed=seed,
             n_rounds=0,
             groups=groups,
+            observable_group_ids={
+                obs.observable_id: group.group_id for group in groups for obs in group.observables
+            },
             shots_per_group=shots_per_group,
-            group_bitstrings=group_bitstrings,
             allocation_weights=allocation_weights,
             metadata={
                 "protocol_id": self.protocol_id,
@@ -170,33 +216,34 @@ class DirectOptimizedProtocol(StaticProtocol):
             for group in groups:
                 weights[group.group_id] = float(group.size)
 
+        elif self.allocation_strategy == "l2":
+            # Var(sum_j H_j) = sum_j sigma_j^2 / N_j with sigma_j^2 <= sum_i c_i^2,
+            # minimized under sum_j N_j = N by N_j ~ sigma_j
+            for group in groups:
+                weights[group.group_id] = float(
+                    np.sqrt(sum(obs.coefficient**2 for obs in group.observables))
+                )
+
+        elif self.allocation_strategy == "l1":
+            # Worst-case (fully correlated) group variance is (sum_i |c_i|)^2
+            for group in groups:
+                weights[group.group_id] = float(
+                    sum(abs(obs.coefficient) for obs in group.observables)
+                )
+
         else:
             # Default to uniform
             for group in groups:
                 weights[group.group_id] = 1.0
 
-        # Normalize weights
+        # Normalize weights (uniform if every group has zero weight)
         total_weight = sum(weights.values())
         for gid in weights:
-            weights[gid] /= total_weight
+            weights[gid] = weights[gid] / total_weight if total_weight > 0 else 1.0 / len(groups)
 
         # Allocate shots (ensuring at least 1 shot per group)
-        shots_per_group = {}
-        allocated = 0
-        n_groups = len(groups)
-
-        for group in groups[:-1]:  # All but last
-            shots = int(weights[group.group_id] * total_budget)
-            # Ensure at least 1 shot per group
-            shots = max(1, shots) if total_budget >= n_groups else max(1, shots)
-            shots_per_group[group.group_id] = shots
-            allocated += shots
-
-        # Last group gets remainder to avoid rounding issues
-        if groups:
-            remaining = total_budget - allocated
-            # Ensure at least 1 shot for last group
-            shots_per_group[groups[-1].group_id] = max(1, remaining)
+        shots = _allocate_shots(np.array([weights[g.group_id] for g in groups]), total_budget)
+        shots_per_group = {group.group_id: int(n) for group, n in zip(groups, shots, strict=True)}
 
         return shots_per_group, weights
 
@@ -219,12 +266,14 @@ class DirectOptimizedProtocol(StaticProtocol):
         settings = []
         shots_per_setting = []
         observable_setting_map: dict[str, list[int]] = {}
+        # One read-only target tuple shared by every setting
+        target_qubits = tuple(range(opt_state.observable_set.n_qubits))
 
         for i, group in enumerate(opt_state.groups):
             setting = MeasurementSetting(
                 setting_id=group.group_id,
                 measurement_basis=group.measurement_basis,
-                target_qubits=list(range(opt_state.observable_set.n_qubits)),
+                target_qubits=target_qubits,
                 metadata={
                     "group_size": group.size,
                     "allocation_weight": opt_state.allocation_weights[group.group_id],
@@ -266,12 +315,25 @@ class DirectOptimizedProtocol(StaticProtocol):
         if not isinstance(opt_state, DirectOptimizedState):
             raise TypeError("Expected DirectOptimizedState")
 
-        # Store bitstrings for each group
-        for setting_id, bitstrings in data_chunk.bitstrings.items():
-            opt_state.group_bitstrings[setting_id].extend(bitstrings)
+        groups = {group.group_id: group for group in opt_state.groups}
+        parity_counts = opt_state.parity_counts
+
+        # Count shots and odd parities for each group as outcomes stream in
+        for setting_id in data_chunk.setting_ids:
+            outcomes = data_chunk.get_packed_words(setting_id)
+            if len(outcomes):
+                shots = opt_state.group_shots
+                shots[setting_id] = shots.get(setting_id, 0) + len(outcomes)
+
+                observables = groups[setting_id].observables
+                odd = odd_counts(outcomes, [obs.pauli_string for obs in observables])
+                for obs, n_odd in zip(observables, odd.tolist(), strict=True):
+                    parity_counts[obs.observable_id] = (
+                        parity_counts.get(obs.observable_id, 0) + n_odd
+                    )
 
         # Update budget tracking
-        total_new_shots = sum(len(bs) for bs in data_chunk.bitstrings.values())
+        total_new_shots = data_chunk.n_shots
         opt_state.remaining_budget -= total_new_shots
         opt_state.round_number += 1
 
@@ -295,58 +357,16 @@ class DirectOptimizedProtocol(StaticProtocol):
         if not isinstance(opt_state, DirectOptimizedState):
             raise TypeError("Expected DirectOptimizedState")
 
-        estimates = []
-
-        # Build mapping from observable_id to group
-        obs_to_group = {}
-        for group in opt_state.groups:
-            for obs in group.observables:
-                obs_to_group[obs.observable_id] = group
-
-        for obs in observable_set.observables:
-            group = obs_to_group.get(obs.observable_id)
-
-            if group is None:
-                estimate = ObservableEstimate(
-                    observable_id=obs.observable_id,
-                    estimate=0.0,
-                    se=float("inf"),
-                    n_shots=0,
-                    n_settings=0,
-                )
-            else:
-                bitstrings = opt_state.group_bitstrings.get(group.group_id, [])
-
-                if not bitstrings:
-                    estimate = ObservableEstimate(
-                        observable_id=obs.observable_id,
-                        estimate=0.0,
-                        se=float("inf"),
-                        n_shots=0,
-                        n_settings=1,
-                    )
-                else:
-                    # Compute expectation value from shared bitstrings
-                    expectation, se = self._estimate_from_bitstrings(
-                        bitstrings,
-                        obs.pauli_string,
-                        group.measurement_basis,
-                        obs.coefficient,
-                    )
-
-                    estimate = ObservableEstimate(
-                        observable_id=obs.observable_id,
-                        estimate=expectation,
-                        se=se,
-                        n_shots=len(bitstrings),
-                        n_settings=1,
-                        metadata={
-                            "group_id": group.group_id,
-                            "allocation_weight": opt_state.allocation_weights[group.group_id],
-                        },
-                    )
-
-            estimates.append(estimate)
+        estimates = grouped_estimates(
+            observable_set.observables,
+            opt_state.observable_group_ids,
+            opt_state.group_shots,
+            opt_state.parity_counts,
+            group_metadata={
+                group_id: {"allocation_weight": weight}
+                for group_id, weight in opt_state.allocation_weights.items()
+            },
+        )
 
         return Estimates(
             estimates=estimates,
@@ -359,17 +379,17 @@ class DirectOptimizedProtocol(StaticProtocol):
             },
         )
 
-    def _estimate_from_bitstrings(
+    def _estimate_from_outcomes(
         self,
-        bitstrings: list[str],
+        outcomes: NDArray[np.uint64],
         pauli_string: str,
         measurement_basis: str,
         coefficient: float,
     ) -> tuple[float, float]:
-        """Estimate expectation value from grouped measurement bitstrings.
+        """Estimate expectation value from grouped measurement outcomes.
 
         Args:
-            bitstrings: List of measurement outcome bitstrings.
+            outcomes: Packed (n_shots, n_words) uint64 outcomes.
             pauli_string: The Pauli observable being estimated.
             measurement_basis: The shared measurement basis.
             coefficient: Observable coefficient.
@@ -377,20 +397,4 @@ class DirectOptimizedProtocol(StaticProtocol):
         Returns:
             Tuple of (expectation value, standard error).
         """
-        if not bitstrings:
-            return 0.0, float("inf")
-
-        # Get positions where the observable has non-identity operators
-        support = [i for i, p in enumerate(pauli_string) if p != "I"]
-
-        # Vectorized eigenvalue computation (numpy, no Python loop)
-        bs_array = np.frombuffer(
-            "".join(bitstrings).encode(), dtype=np.uint8
-        ).reshape(len(bitstrings), -1)[:, support]
-        parities = (bs_array - 48).sum(axis=1) % 2
-        eigenvalues_array = np.where(parities == 0, 1.0, -1.0)
-        mean = float(np.mean(eigenvalues_array)) * coefficient
-        std = float(np.std(eigenvalues_array, ddof=1))
-        se = std / np.sqrt(len(eigenvalues_array)) * abs(coefficient)
-
-        return mean, se
+        return pauli_mean_se(outcomes, pauli_string, coefficient)
@@ -13,11 +13,10 @@ from __future__ import annotations
 
 import time as _time
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
 
 from ...observables import ObservableSet
 from ...shadows import NoiseAwareRandomLocalCliffordShadows, RandomLocalCliffordShadows
@@ -35,6 +34,9 @@ from ..state import (
     RawDatasetChunk,
 )
 
+if TYPE_CHECKING:
+    from qiskit_aer import AerSimulator
+
 
 @dataclass
 class ShadowsProtocolState(ProtocolState):
@@ -196,7 +198,7 @@ class ClassicalShadowsProtocol(StaticProtocol):
             plan: Measurement plan.
             backend: Quantum backend for execution.
             seed: Random seed.
-            deadline: Absolute time (time.time()) by which to stop.
+            deadline: Absolute time (time.monotonic()) by which to stop.
                 If None, no timeout.
 
         Returns:
@@ -211,11 +213,11 @@ class ClassicalShadowsProtocol(StaticProtocol):
 
         # Simulate measurements
         # In ideal case, sample from statevector probabilities
-        aer_start = _time.time()
+        aer_start = _time.perf_counter()
         measurement_outcomes, actual_shots = self._simulate_shadow_measurements(
             circuit, measurement_bases, rng, deadline=deadline,
         )
-        aer_elapsed = _time.time() - aer_start
+        aer_elapsed = _time.perf_counter() - aer_start
 
         hit_deadline = actual_shots < n_shots
 
@@ -224,18 +226,13 @@ class ClassicalShadowsProtocol(StaticProtocol):
             measurement_bases = measurement_bases[:actual_shots]
             measurement_outcomes = measurement_outcomes[:actual_shots]
 
-        # Store as bitstrings for compatibility with Protocol interface
-        bitstrings = {}
-        setting_bitstrings = []
-        for i in range(actual_shots):
-            # Convert outcome array to bitstring
-            bs = "".join(str(measurement_outcomes[i, q]) for q in range(n_qubits))
-            setting_bitstrings.append(bs)
-
-        bitstrings["shadows_random_local_clifford"] = setting_bitstrings
+        # Store the outcome array so update() needs no parsing; callers
+        # wanting strings use RawDatasetChunk.get_bitstrings()
+        outcome_array = np.asarray(measurement_outcomes, dtype=np.uint8)
+        outcome_array.setflags(write=False)
 
         return RawDatasetChunk(
-            bitstrings=bitstrings,
+            bitstring_arrays={"shadows_random_local_clifford": outcome_array},
             settings_executed=["shadows_random_local_clifford"],
             n_qubits=n_qubits,
             metadata={
@@ -263,7 +260,7 @@ class ClassicalShadowsProtocol(StaticProtocol):
             circuit: State preparation circuit.
             measurement_bases: Shape (n_shots, n_qubits), values in {0,1,2}.
             rng: Random number generator.
-            deadline: Absolute time (time.time()) by which to stop.
+            deadline: Absolute time (time.monotonic()) by which to stop.
                 If None, no timeout.
 
         Returns:
@@ -282,7 +279,7 @@ class ClassicalShadowsProtocol(StaticProtocol):
         for shot_idx in range(n_shots):
             # Check deadline every 100 shots
             if deadline is not None and shot_idx % 100 == 0 and shot_idx > 0:
-                if _time.time() >= deadline:
+                if _time.monotonic() >= deadline:
                     actual_shots = shot_idx
                     outcomes = outcomes[:actual_shots]
                     break
@@ -337,14 +334,14 @@ class ClassicalShadowsProtocol(StaticProtocol):
 
         # Extract measurement data
         n_qubits = data_chunk.n_qubits
-        bitstrings = data_chunk.bitstrings.get("shadows_random_local_clifford", [])
-        n_shots = len(bitstrings)
-
-        # Convert bitstrings back to array
-        outcomes = np.zeros((n_shots, n_qubits), dtype=int)
-        for i, bs in enumerate(bitstrings):
-            for q, c in enumerate(bs):
-                outcomes[i, q] = int(c)
+        setting_id = "shadows_random_local_clifford"
+
+        # Read the outcome array (or parse all bitstrings in one pass)
+        if setting_id in data_chunk.setting_ids:
+            outcomes = data_chunk.get_bitstring_array(setting_id).astype(int)
+        else:
+            outcomes = np.zeros((0, n_qubits), dtype=int)
+        n_shots = len(outcomes)
 
         # Get bases from metadata
         bases = data_chunk.metadata.get("measurement_bases")
@@ -11,13 +11,19 @@ This module defines the core data structures used by all measurement protocols:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.bitstrings import encode_rows
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class CIMethod(Enum):
     """Confidence interval construction method (§6.1)."""
@@ -28,6 +34,15 @@ class CIMethod(Enum):
     NONE = "none"
 
 
+def _bitstrings_to_array(bitstrings: list[str], n_qubits: int) -> NDArray[np.uint8]:
+    """Parse equal-length '0'/'1' strings into a (n_shots, n_qubits) uint8 array."""
+    if not bitstrings:
+        return np.zeros((0, n_qubits), dtype=np.uint8)
+    # ASCII '0'/'1' minus ord('0') gives 0/1
+    packed = np.frombuffer("".join(bitstrings).encode(), dtype=np.uint8)
+    return packed.reshape(len(bitstrings), -1) - ord("0")
+
+
 @dataclass
 class MeasurementSetting:
     """A single measurement setting specification (§3.3).
@@ -40,7 +55,8 @@ class MeasurementSetting:
         basis_choices: Per-qubit basis choices as array. For Pauli measurements:
             0 = Z (computational), 1 = X, 2 = Y.
             If not provided, computed from measurement_basis.
-        target_qubits: List of qubit indices this setting applies to.
+        target_qubits: Qubit indices this setting applies to. Plans may share
+            one sequence between settings, so treat it as read-only.
         pre_rotations: Optional pre-rotation specification (e.g., for global Clifford).
         metadata: Additional setting-specific metadata.
     """
@@ -48,7 +64,7 @@ class MeasurementSetting:
     setting_id: str
     measurement_basis: str = ""
     basis_choices: NDArray[np.int_] | None = None
-    target_qubits: list[int] | None = None
+    target_qubits: Sequence[int] | None = None
     pre_rotations: dict[str, Any] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
@@ -97,11 +113,24 @@ class RawDatasetChunk:
     """Raw measurement outcomes from one acquisition round (§5.2).
 
     Supports two data formats:
-    1. Dict-based: bitstrings mapping setting_id -> list[str]
+    1. Dict-based: outcomes per setting_id, held in one of three forms:
+       bitstrings (list[str]), bitstring_arrays (uint8 array) or
+       packed_outcomes (uint64 words). Protocols fill bitstring_arrays;
+       get_bitstrings() renders strings from it on demand.
     2. Array-based: setting_indices, outcomes, basis_choices as NDArrays
 
     Attributes:
-        bitstrings: Dict mapping setting_id to list of bitstring outcomes.
+        bitstrings: Dict mapping setting_id to list of bitstring outcomes,
+            for chunks built from string data. Use get_bitstrings() to read
+            any setting as strings.
+        bitstring_arrays: Dict mapping setting_id to outcomes as a uint8
+            array of 0/1 values. Shape: (n_shots, n_qubits). Use
+            get_bitstring_array() to read any form. Arrays filled by
+            StaticProtocol.acquire() are read-only, since chunks are
+            shared by reference; call .copy() before modifying one.
+        packed_outcomes: Dict mapping setting_id to outcomes already packed
+            by ``_kernels.pack_words``. Shape: (n_shots, n_words) uint64.
+            Read with get_packed_words().
         settings_executed: List of setting IDs that were executed.
         setting_indices: Which setting produced each shot. Shape: (n_shots,).
         outcomes: Measurement outcomes as array. Shape: (n_shots, n_qubits).
@@ -112,6 +141,8 @@ class RawDatasetChunk:
 
     # Dict-based format (used by baseline protocols)
     bitstrings: dict[str, list[str]] = field(default_factory=dict)
+    bitstring_arrays: dict[str, NDArray[np.uint8]] = field(default_factory=dict)
+    packed_outcomes: dict[str, NDArray[np.uint64]] = field(default_factory=dict)
     settings_executed: list[str] = field(default_factory=list)
 
     # Array-based format (optional, for advanced use)
@@ -121,15 +152,110 @@ class RawDatasetChunk:
     n_qubits: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Check that packed outcomes come with the register width to unpack them."""
+        if self.packed_outcomes and self.n_qubits <= 0:
+            raise ValueError("n_qubits must be positive when packed_outcomes is given")
+
+    @property
+    def setting_ids(self) -> list[str]:
+        """Settings with dict-format outcomes, in any of the three forms."""
+        return list(
+            dict.fromkeys([*self.bitstrings, *self.bitstring_arrays, *self.packed_outcomes])
+        )
+
     @property
     def n_shots(self) -> int:
         """Number of shots in this chunk."""
-        if self.bitstrings:
-            return sum(len(bs) for bs in self.bitstrings.values())
+        if self.bitstrings or self.bitstring_arrays or self.packed_outcomes:
+            return sum(self.setting_shots(setting_id) for setting_id in self.setting_ids)
         elif self.setting_indices is not None:
             return len(self.setting_indices)
         return 0
 
+    def setting_shots(self, setting_id: str) -> int:
+        """Number of shots of one setting, from whichever form holds it."""
+        for outcomes in (self.bitstrings, self.bitstring_arrays, self.packed_outcomes):
+            if setting_id in outcomes:
+                return len(outcomes[setting_id])
+        raise KeyError(setting_id)
+
+    def get_bitstrings(self, setting_id: str) -> list[str]:
+        """Outcomes of one setting as '0'/'1' strings, qubit 0 first.
+
+        Returns the stored strings when available, otherwise renders them
+        from the setting's outcome array.
+        """
+        bitstrings = self.bitstrings.get(setting_id)
+        if bitstrings is not None:
+            return bitstrings
+        return encode_rows(self.get_bitstring_array(setting_id) + ord("0"))
+
+    def get_bitstring_array(self, setting_id: str) -> NDArray[np.uint8]:
+        """Outcomes of one setting as a (n_shots, n_qubits) uint8 array.
+
+        Returns the stored array when available, otherwise parses the
+        setting's bitstrings or unpacks its packed words.
+        """
+        array = self.bitstring_arrays.get(setting_id)
+        if array is not None:
+            return array
+
+        if setting_id not in self.bitstrings and setting_id in self.packed_outcomes:
+            from ._kernels import unpack_words
+
+            return unpack_words(self.packed_outcomes[setting_id], self.n_qubits)
+        return _bitstrings_to_array(self.bitstrings[setting_id], self.n_qubits)
+
+    def get_packed_words(self, setting_id: str) -> NDArray[np.uint64]:
+        """Outcomes of one setting as (n_shots, n_words) uint64 words.
+
+        Returns the stored packed array when available; otherwise the uint8
+        array (or parsed bitstrings) is packed with ``_kernels.pack_words``.
+        """
+        words = self.packed_outcomes.get(setting_id)
+        if words is not None:
+            return words
+
+        from ._kernels import pack_words
+
+        return pack_words(self.get_bitstring_array(setting_id))
+
+    def to_arrow(self) -> pa.Table:
+        """Dict-format outcomes as an Arrow table with one row per shot.
+
+        Columns are ``setting_id`` (dictionary-encoded) and ``bitstring``
+        (large_string, qubit 0 first), covering every setting in whichever
+        form it is held. Strings are assembled from the uint8 outcome
+        arrays in a single buffer rather than as Python objects; tables
+        from several rounds combine with pyarrow.concat_tables() and spill
+        to disk with pyarrow.parquet.write_table().
+        """
+        import pyarrow as pa
+
+        setting_ids = self.setting_ids
+        arrays = [self.get_bitstring_array(setting_id) for setting_id in setting_ids]
+        lengths = np.array([len(array) for array in arrays], dtype=np.int64)
+        widths = np.array(
+            [array.shape[1] if array.ndim == 2 else 0 for array in arrays], dtype=np.int64
+        )
+
+        # Row r of a setting spans width bytes; offsets are their running sum
+        row_widths = np.repeat(widths, lengths)
+        offsets = np.zeros(len(row_widths) + 1, dtype=np.int64)
+        np.cumsum(row_widths, out=offsets[1:])
+        data = b"".join(
+            (np.ascontiguousarray(array, dtype=np.uint8) + ord("0")).tobytes() for array in arrays
+        )
+        bitstrings = pa.LargeStringArray.from_buffers(
+            len(row_widths), pa.py_buffer(offsets), pa.py_buffer(data)
+        )
+        setting_column = pa.DictionaryArray.from_arrays(
+            pa.array(np.repeat(np.arange(len(setting_ids), dtype=np.int32), lengths)),
+            pa.array(setting_ids, type=pa.string()),
+        )
+        return pa.table({"setting_id": setting_column, "bitstring": bitstrings})
+
 
 @dataclass
 class ProtocolState:
@@ -149,6 +275,13 @@ class ProtocolState:
         n_rounds: Number of acquisition rounds completed.
         round_number: Alias for n_rounds for backwards compatibility.
         round_metadata: Per-round metadata (classical time, settings used).
+        round_timings: Per-round record array written by Protocol.run()
+            (fields quantum_ns, classical_ns, shots, settings, meta_index),
+            or None before a run completes.
+        shot_pool: Per-setting contiguous (capacity, n_qubits) outcome
+            buffers filled by add_chunk() from each chunk's bitstring_arrays
+            and grown by doubling. Read them through get_setting_outcomes().
+        shot_counts: Number of filled rows of each shot_pool buffer.
         adaptive_state: Protocol-specific adaptive state (e.g., variance estimates).
         converged: Whether the protocol has determined convergence.
         early_stopped: Whether early stopping was triggered.
@@ -166,6 +299,9 @@ class ProtocolState:
     total_shots_used: int = 0
     n_rounds: int = 0
     round_metadata: list[dict[str, Any]] = field(default_factory=list)
+    round_timings: NDArray[np.void] | None = None
+    shot_pool: dict[str, NDArray[np.uint8]] = field(default_factory=dict, repr=False)
+    shot_counts: dict[str, int] = field(default_factory=dict)
 
     # Adaptive state
     adaptive_state: dict[str, Any] = field(default_factory=dict)
@@ -186,11 +322,53 @@ class ProtocolState:
         self.n_rounds = value
 
     def add_chunk(self, chunk: RawDatasetChunk, round_meta: dict[str, Any] | None = None) -> None:
-        """Add a data chunk and update counters."""
+        """Add a data chunk (by reference, not copied) and update counters.
+
+        Outcome arrays in ``chunk.bitstring_arrays`` are also appended to the
+        per-setting shot pool.
+        """
         self.accumulated_data.append(chunk)
         self.total_shots_used += chunk.n_shots
         self.n_rounds += 1
         self.round_metadata.append(round_meta or {})
+        for setting_id, outcomes in chunk.bitstring_arrays.items():
+            self._pool_outcomes(setting_id, outcomes)
+
+    def _pool_outcomes(self, setting_id: str, outcomes: NDArray[np.uint8]) -> None:
+        """Append outcomes to a setting's pool buffer, doubling its capacity when full.
+
+        Raises:
+            ValueError: If the outcome width differs from the pooled one.
+        """
+        count = self.shot_counts.get(setting_id, 0)
+        needed = count + len(outcomes)
+        pool = self.shot_pool.get(setting_id)
+        if pool is not None and pool.shape[1:] != outcomes.shape[1:]:
+            raise ValueError(
+                f"Outcomes for '{setting_id}' have shape {outcomes.shape[1:]}, "
+                f"pool holds {pool.shape[1:]}"
+            )
+        if pool is None or needed > len(pool):
+            capacity = needed if pool is None else max(needed, 2 * len(pool))
+            grown = np.empty((capacity, *outcomes.shape[1:]), dtype=np.uint8)
+            if pool is not None:
+                grown[:count] = pool[:count]
+            pool = self.shot_pool[setting_id] = grown
+        pool[count:needed] = outcomes
+        self.shot_counts[setting_id] = needed
+
+    def get_setting_outcomes(self, setting_id: str) -> NDArray[np.uint8]:
+        """All pooled outcomes of one setting, in acquisition order.
+
+        Returns a read-only (n_shots, n_qubits) view of the setting's pool
+        buffer; no data is copied.
+
+        Raises:
+            KeyError: If no chunk has contributed outcome arrays for the setting.
+        """
+        outcomes = self.shot_pool[setting_id][: self.shot_counts[setting_id]]
+        outcomes.flags.writeable = False
+        return outcomes
 
     def get_all_outcomes(self) -> NDArray[np.int_]:
         """Concatenate outcomes from all chunks."""
@@ -296,7 +474,9 @@ class TimingBreakdown:
     time_aer_simulate_s: float = 0.0
     time_post_process_s: float = 0.0
     est_quantum_hw_s: float | None = None
-    per_setting_aer_times_s: list[float] = field(default_factory=list)
+    per_setting_aer_times_s: NDArray[np.float64] = field(
+        default_factory=lambda: np.zeros(0, dtype=np.float64)
+    )
 
 
 @dataclass
@@ -3,11 +3,37 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
+
+from quartumse.utils.bitstrings import encode_rows
+
+# Index 0=Z, 1=X, 2=Y, as ASCII byte codes
+_BASIS_CODES = np.frombuffer(b"ZXY", dtype=np.uint8)
+_BASIS_VALUES = {"Z": 0, "X": 1, "Y": 2}
+_OUTCOME_VALUES = {"0": 0, "1": 1}
+
+
+def _decode_rows(strings: Sequence[str], values: dict[str, int]) -> NDArray[np.int_]:
+    """Parse equal-length strings into an int array through one byte buffer.
+
+    Raises:
+        ValueError: If a string holds a character missing from ``values``.
+    """
+    table = np.full(256, -1, dtype=int)
+    for char, value in values.items():
+        table[ord(char)] = value
+    codes = np.frombuffer("".join(strings).encode("ascii"), dtype=np.uint8)
+    decoded = table[codes.reshape(len(strings), -1)]
+    if (decoded < 0).any():
+        invalid = {chr(code) for code in np.unique(codes[table[codes] < 0])}
+        raise ValueError(f"Unexpected characters in shot data: {sorted(invalid)}")
+    return decoded
 
 
 @dataclass
@@ -84,18 +110,12 @@ class ShotDataWriter:
                 start_index = int(existing_df["shadow_index"].max()) + 1
 
         # Build dataframe for the new chunk using vectorized operations
-        # Pre-compute basis strings using numpy vectorization
-        basis_chars = np.array(["Z", "X", "Y"])  # Index 0=Z, 1=X, 2=Y
-        # Clip bases to valid range and convert to char array
+        # Clip bases to valid range and render each row from its ASCII codes
         clipped_bases = np.clip(measurement_bases, 0, 2)
-        bases_char_array = basis_chars[clipped_bases]  # Shape: (shadow_size, num_qubits)
-        # Join each row into a string
-        bases_strings = ["".join(row) for row in bases_char_array]
+        bases_strings = encode_rows(_BASIS_CODES[clipped_bases])
 
-        # Convert outcomes to bitstrings using vectorized approach
-        outcomes_strings = [
-            "".join(measurement_outcomes[i].astype(str)) for i in range(shadow_size)
-        ]
+        # Outcomes 0/1 become the ASCII codes of '0'/'1'
+        outcomes_strings = encode_rows(np.asarray(measurement_outcomes) + ord("0"))
 
         # Build records in batch
         current_time = time.time()
@@ -145,28 +165,16 @@ class ShotDataWriter:
         """
         df = self._load_dataframe(experiment_id)
 
-        # Decode bases using vectorized approach
-        basis_map_inv = {"Z": 0, "X": 1, "Y": 2}
-        # Convert strings to numpy arrays efficiently
+        # Decode bases and outcomes from one byte buffer per column
         bases_series = df["measurement_bases"].values
         num_rows = len(bases_series)
         if num_rows > 0:
-            str_len = len(bases_series[0])
-            # Pre-allocate array
-            measurement_bases_array = np.empty((num_rows, str_len), dtype=int)
-            for i, bases_str in enumerate(bases_series):
-                measurement_bases_array[i] = [basis_map_inv[b] for b in bases_str]
+            measurement_bases_array = _decode_rows(bases_series, _BASIS_VALUES)
+            measurement_outcomes_array = _decode_rows(
+                df["measurement_outcomes"].values, _OUTCOME_VALUES
+            )
         else:
             measurement_bases_array = np.empty((0, 0), dtype=int)
-
-        # Decode outcomes using vectorized approach
-        outcomes_series = df["measurement_outcomes"].values
-        if num_rows > 0:
-            outcome_len = len(outcomes_series[0])
-            measurement_outcomes_array = np.empty((num_rows, outcome_len), dtype=int)
-            for i, outcomes_str in enumerate(outcomes_series):
-                measurement_outcomes_array[i] = [int(o) for o in outcomes_str]
-        else:
             measurement_outcomes_array = np.empty((0, 0), dtype=int)
 
         num_qubits = int(df["num_qubits"].iloc[0])
@@ -219,11 +227,10 @@ def summarize_dataframe(
     outcomes_array = df["measurement_outcomes"].values
     total = len(outcomes_array)
     if total > 0 and num_qubits > 0:
-        # Decode all bitstrings to a numpy array for vectorized extraction
-        outcome_matrix = np.array([[int(c) for c in s] for s in outcomes_array], dtype=np.int8)
+        # Decode all bitstrings at once and count the 1s of every qubit
+        ones = _decode_rows(outcomes_array, _OUTCOME_VALUES).sum(axis=0)
         for qubit in range(num_qubits):
-            qubit_bits = outcome_matrix[:, qubit]
-            count_1 = np.sum(qubit_bits)
+            count_1 = ones[qubit]
             count_0 = total - count_1
             qubit_marginals[qubit] = {
                 "0": float(count_0 / total),
@@ -165,10 +165,10 @@ class RandomLocalCliffordShadows(ClassicalShadows):
         if self.measurement_bases is None or self.measurement_outcomes is None:
             raise ValueError("No measurement data available for expectation estimation.")
 
-        support = observable.support
+        support = observable.support_array
         num_shadows = len(self.measurement_outcomes)
 
-        if not support:
+        if not len(support):
             # All identity: expectation is coefficient for all shadows
             return np.full(num_shadows, observable.coefficient)
 
@@ -182,8 +182,8 @@ class RandomLocalCliffordShadows(ClassicalShadows):
         compatible = np.all(measured_bases == required_bases, axis=1)  # (num_shadows,)
 
         # Compute sign product for compatible measurements
-        # sign = product of (1 - 2*outcome) over support qubits
-        signs = np.prod(1 - 2 * outcomes, axis=1)  # (num_shadows,)
+        # sign = product of (1 - 2*outcome) over support qubits = 1 - 2*parity
+        signs = 1 - 2 * (np.count_nonzero(outcomes, axis=1) & 1)  # (num_shadows,)
 
         # Apply scaling factor and coefficient
         scaling_factor = 3 ** len(support)
@@ -21,6 +21,9 @@ from enum import Enum
 import numpy as np
 from numpy.typing import NDArray
 
+# Cap on resampled elements held at once when bootstrapping a mean
+_BOOTSTRAP_BLOCK_ELEMENTS = 1 << 22
+
 
 class CIMethodType(str, Enum):
     """Confidence interval construction method."""
@@ -131,6 +134,42 @@ def normal_ci(
     )
 
 
+def _bootstrap_statistics(
+    data: NDArray[np.floating],
+    statistic: Callable[[NDArray], float],
+    n_bootstrap: int,
+    rng: np.random.Generator,
+) -> NDArray[np.float64]:
+    """Bootstrap replicates of ``statistic`` over resamples of ``data``.
+
+    For the mean of two-valued data (e.g. ±1 Pauli eigenvalues) the count
+    of the larger value in a resample is Binomial(n, p̂), so replicates are
+    drawn directly without resampling. Other means are taken over blocks of
+    resampled indices; any other statistic is evaluated per resample.
+    """
+    data = np.asarray(data)
+    n = len(data)
+    if statistic is not np.mean:
+        return np.array(
+            [statistic(rng.choice(data, size=n, replace=True)) for _ in range(n_bootstrap)]
+        )
+
+    values = np.unique(data)
+    if len(values) <= 2:
+        low, high = float(values[0]), float(values[-1])
+        p_high = np.count_nonzero(data == values[-1]) / n
+        counts = rng.binomial(n, p_high, size=n_bootstrap)
+        return low + (high - low) * counts / n
+
+    replicates = np.empty(n_bootstrap, dtype=np.float64)
+    block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // n)
+    for start in range(0, n_bootstrap, block):
+        stop = min(start + block, n_bootstrap)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        replicates[start:stop] = data[indices].mean(axis=1)
+    return replicates
+
+
 def bootstrap_percentile_ci(
     data: NDArray[np.floating],
     statistic: Callable[[NDArray], float] | None = None,
@@ -160,12 +199,7 @@ def bootstrap_percentile_ci(
     n = len(data)
 
     # Generate bootstrap samples
-    bootstrap_stats = []
-    for _ in range(n_bootstrap):
-        resample = rng.choice(data, size=n, replace=True)
-        bootstrap_stats.append(statistic(resample))
-
-    bootstrap_stats = np.array(bootstrap_stats)
+    bootstrap_stats = _bootstrap_statistics(data, statistic, n_bootstrap, rng)
 
     # Compute percentile CI
     alpha = 1 - confidence_level
@@ -221,12 +255,7 @@ def bootstrap_bca_ci(
     original_stat = float(statistic(data))
 
     # Generate bootstrap samples
-    bootstrap_stats = []
-    for _ in range(n_bootstrap):
-        resample = rng.choice(data, size=n, replace=True)
-        bootstrap_stats.append(statistic(resample))
-
-    bootstrap_stats = np.array(bootstrap_stats)
+    bootstrap_stats = _bootstrap_statistics(data, statistic, n_bootstrap, rng)
 
     # Bias correction factor
     z0 = stats.norm.ppf(np.mean(bootstrap_stats < original_stat))
@@ -234,12 +263,12 @@ def bootstrap_bca_ci(
         z0 = 0.0
 
     # Acceleration factor (jackknife estimate)
-    jackknife_stats = []
-    for i in range(n):
-        jackknife_sample = np.delete(data, i)
-        jackknife_stats.append(statistic(jackknife_sample))
-
-    jackknife_stats = np.array(jackknife_stats)
+    if statistic is np.mean and n > 1:
+        # Leave-one-out means in closed form
+        data = np.asarray(data, dtype=np.float64)
+        jackknife_stats = (data.sum() - data) / (n - 1)
+    else:
+        jackknife_stats = np.array([statistic(np.delete(data, i)) for i in range(n)])
     jackknife_mean = np.mean(jackknife_stats)
 
     # Acceleration
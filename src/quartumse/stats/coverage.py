@@ -222,18 +222,20 @@ def simulate_coverage(
     adjustment = compute_fwer_adjustment(M, alpha, fwer_method)
 
     family_covered_count = 0
+    p_plus = (1 + np.asarray(true_expectations, dtype=float)) / 2
+    # For ±1 outcomes the sample variance (ddof=1) is n(1 - mean²)/(n - 1)
+    correction = n_shots / (n_shots - 1) if n_shots > 1 else np.nan
 
     for _ in range(n_simulations):
         all_covered = True
+        # The count of +1 outcomes is sufficient for mean and SE, so draw it
+        # directly instead of simulating and reducing every shot
+        estimates = 2 * rng.binomial(n_shots, p_plus) / n_shots - 1
+        ses = np.sqrt(np.clip(1 - estimates**2, 0, None) * correction / n_shots)
 
         for obs_idx, true_exp in enumerate(true_expectations):
-            # Simulate Bernoulli outcomes
-            p_plus = (1 + true_exp) / 2
-            outcomes = 2 * rng.binomial(1, p_plus, n_shots) - 1  # Map to ±1
-
-            # Compute estimate and SE
-            estimate = float(np.mean(outcomes))
-            se = float(np.std(outcomes, ddof=1) / np.sqrt(n_shots))
+            estimate = float(estimates[obs_idx])
+            se = float(ses[obs_idx])
 
             # Construct CI at adjusted confidence level
             ci = normal_ci(estimate, se, adjustment.confidence_individual[obs_idx], n_shots)
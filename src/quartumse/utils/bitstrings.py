@@ -0,0 +1,31 @@
+"""Conversions between per-shot code arrays and fixed-width strings.
+
+Measurement outcomes and bases are stored as (n_rows, width) arrays and
+rendered as one string per row (e.g. ``"0110"`` or ``"ZXYZ"``) for
+persistence and reporting.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def encode_rows(codes: NDArray[np.integer]) -> list[str]:
+    """Render each row of a (n_rows, width) array of ASCII codes as a string.
+
+    All rows are decoded from one contiguous byte buffer and then sliced,
+    so no per-character Python loop is involved.
+
+    Args:
+        codes: Array of ASCII codes, e.g. ``outcomes + ord("0")``.
+
+    Returns:
+        One string of length ``width`` per row.
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.uint8).reshape(len(codes), -1)
+    width = codes.shape[1]
+    if not width:
+        return [""] * len(codes)
+    text = codes.tobytes().decode("ascii")
+    return [text[start : start + width] for start in range(0, len(text), width)]
@@ -0,0 +1,44 @@
+"""Optional Numba JIT support.
+
+Numba is an optional dependency (``pip install quartumse[jit]``). Kernels are
+written as plain Python loops and decorated with :func:`njit`; without Numba
+the decorator returns the function unchanged, so callers should check
+``HAS_NUMBA`` and keep a vectorized NumPy path for the interpreted case.
+Parallel kernels (``@njit(parallel=True)``) loop with :data:`prange`, which is
+plain ``range`` without Numba.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Try to import numba, but provide fallback
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    # Loops written with prange run serially when interpreted
+    prange = range
+
+
+def njit(func: F | None = None, **options: Any) -> Any:
+    """Compile ``func`` with ``numba.njit`` when available.
+
+    Usable bare (``@njit``) or with options (``@njit(cache=True)``).
+    Without Numba the function is returned unchanged.
+    """
+
+    def decorate(f: F) -> F:
+        if not HAS_NUMBA:
+            return f
+        return _numba_njit(**options)(f)  # type: ignore[no-any-return]
+
+    if func is not None:
+        return decorate(func)
+    return decorate
@@ -214,33 +214,35 @@ def test_quick_comparison_3proto(perf_workload, perf_baseline):
 
 
 @pytest.mark.perf
-def test_eigenvalue_direct_naive(perf_workload, perf_baseline):
-    """Time DirectNaiveProtocol._estimate_from_bitstrings (inner hot loop)."""
+def test_packed_estimate_direct_naive(perf_workload, perf_baseline):
+    """Time DirectNaiveProtocol._estimate_from_outcomes on pre-packed outcomes."""
     from quartumse.protocols import DirectNaiveProtocol
+    from quartumse.protocols._kernels import pack_words
 
     proto = DirectNaiveProtocol()
-    # Generate representative bitstrings
+    # Generate representative packed outcomes
     rng = np.random.default_rng(99)
-    bitstrings = ["".join(str(b) for b in row) for row in rng.integers(0, 2, size=(N_SHOTS, 4))]
+    outcomes = pack_words(rng.integers(0, 2, size=(N_SHOTS, 4), dtype=np.uint8))
 
     def run():
-        proto._estimate_from_bitstrings(bitstrings, "ZIZI", 1.0)
+        proto._estimate_from_outcomes(outcomes, "ZIZI", 1.0)
 
     times = run_timed(run, n_runs=21)
-    assert_no_regression("eigenvalue_direct_naive", times, perf_baseline)
+    assert_no_regression("packed_estimate_direct_naive", times, perf_baseline)
 
 
 @pytest.mark.perf
-def test_eigenvalue_direct_grouped(perf_workload, perf_baseline):
-    """Time DirectGroupedProtocol._estimate_from_bitstrings (inner hot loop)."""
+def test_packed_estimate_direct_grouped(perf_workload, perf_baseline):
+    """Time DirectGroupedProtocol._estimate_from_outcomes on pre-packed outcomes."""
     from quartumse.protocols import DirectGroupedProtocol
+    from quartumse.protocols._kernels import pack_words
 
     proto = DirectGroupedProtocol()
     rng = np.random.default_rng(99)
-    bitstrings = ["".join(str(b) for b in row) for row in rng.integers(0, 2, size=(N_SHOTS, 4))]
+    outcomes = pack_words(rng.integers(0, 2, size=(N_SHOTS, 4), dtype=np.uint8))
 
     def run():
-        proto._estimate_from_bitstrings(bitstrings, "ZIZI", "ZZZZ", 1.0)
+        proto._estimate_from_outcomes(outcomes, "ZIZI", "ZZZZ", 1.0)
 
     times = run_timed(run, n_runs=21)
-    assert_no_regression("eigenvalue_direct_grouped", times, perf_baseline)
+    assert_no_regression("packed_estimate_direct_grouped", times, perf_baseline)
@@ -0,0 +1,17 @@
+"""Fixtures shared by the protocol unit tests."""
+
+import pytest
+
+from quartumse.observables import Observable, ObservableSet
+
+
+@pytest.fixture
+def bell_observables():
+    """Bell-state observables measured in three distinct bases."""
+    return ObservableSet(
+        observables=[
+            Observable(observable_id="xx", pauli_string="XX"),
+            Observable(observable_id="yy", pauli_string="YY"),
+            Observable(observable_id="zz", pauli_string="ZZ"),
+        ]
+    )
@@ -0,0 +1,25 @@
+"""Unit tests for quartumse.utils.bitstrings."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from quartumse.utils.bitstrings import encode_rows
+
+
+class TestEncodeRows:
+    """Tests for encode_rows()."""
+
+    def test_outcome_rows(self):
+        """0/1 outcomes offset by ord('0') render as bitstrings, column 0 first."""
+        outcomes = np.array([[0, 1, 1], [1, 0, 0]], dtype=np.uint8)
+        assert encode_rows(outcomes + ord("0")) == ["011", "100"]
+
+    def test_lookup_table_codes(self):
+        """Codes gathered from a byte table render through the same path."""
+        table = np.frombuffer(b"ZXY", dtype=np.uint8)
+        assert encode_rows(table[np.array([[2, 0], [1, 1]])]) == ["YZ", "XX"]
+
+    def test_zero_width_rows(self):
+        """Rows without columns become empty strings."""
+        assert encode_rows(np.zeros((3, 0), dtype=np.uint8)) == ["", "", ""]
@@ -0,0 +1,54 @@
+"""Unit tests for bootstrap confidence intervals (stats.confidence)."""
+
+import numpy as np
+import pytest
+
+from quartumse.stats import bootstrap_bca_ci, bootstrap_percentile_ci
+from quartumse.stats.confidence import _bootstrap_statistics
+
+
+@pytest.fixture
+def eigenvalues():
+    """±1 eigenvalues with mean 0.4."""
+    return np.array([1.0] * 70 + [-1.0] * 30)
+
+
+class TestBootstrapStatistics:
+    """Test the bootstrap replicate generator."""
+
+    def test_binary_means_match_resampling(self, eigenvalues):
+        """Binomial draws of two-valued means agree with explicit resampling."""
+        rng = np.random.default_rng(0)
+        direct = _bootstrap_statistics(eigenvalues, np.mean, 4000, rng)
+        resampled = np.array([rng.choice(eigenvalues, size=100).mean() for _ in range(4000)])
+
+        assert direct.mean() == pytest.approx(0.4, abs=0.01)
+        assert direct.std() == pytest.approx(resampled.std(), rel=0.1)
+        assert set(np.round((direct + 1) * 50).astype(int)) <= set(range(101))
+
+    def test_general_means_and_statistics(self):
+        """Many-valued data and custom statistics use resampling."""
+        data = np.arange(10, dtype=float)
+        means = _bootstrap_statistics(data, np.mean, 500, np.random.default_rng(1))
+        medians = _bootstrap_statistics(data, np.median, 50, np.random.default_rng(1))
+
+        assert means.shape == (500,)
+        assert means.mean() == pytest.approx(4.5, abs=0.2)
+        assert medians.shape == (50,)
+
+    def test_constant_data(self):
+        """Single-valued data has no bootstrap spread."""
+        replicates = _bootstrap_statistics(np.ones(20), np.mean, 10, np.random.default_rng(2))
+        np.testing.assert_array_equal(replicates, np.ones(10))
+
+
+class TestBootstrapCIs:
+    """Test the percentile and BCa interval constructors."""
+
+    @pytest.mark.parametrize("construct", [bootstrap_percentile_ci, bootstrap_bca_ci])
+    def test_interval_brackets_mean(self, eigenvalues, construct):
+        """Intervals are seeded, contain the sample mean and match the normal width."""
+        ci = construct(eigenvalues, seed=5)
+        assert ci.ci_low_raw < 0.4 < ci.ci_high_raw
+        assert ci.width_raw == pytest.approx(2 * 1.96 * 0.0917, rel=0.15)
+        assert construct(eigenvalues, seed=5) == ci
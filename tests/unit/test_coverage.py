@@ -0,0 +1,17 @@
+"""Unit tests for coverage simulation (stats.coverage)."""
+
+import pytest
+
+from quartumse.stats import simulate_coverage
+
+
+class TestSimulateCoverage:
+    """Test the Bernoulli-model coverage simulation."""
+
+    def test_family_coverage_near_nominal(self):
+        """Bonferroni-adjusted intervals cover the family at about the nominal rate."""
+        result = simulate_coverage([0.2, -0.5, 0.9], n_shots=500, n_simulations=2000, seed=1)
+
+        assert result.n_observables == 3
+        assert result.empirical_coverage == pytest.approx(0.95, abs=0.02)
+        assert simulate_coverage([0.2, -0.5, 0.9], 500, 2000, seed=1) == result
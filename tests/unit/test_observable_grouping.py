@@ -0,0 +1,281 @@
+"""Unit tests for commutation analysis and grouping (observables.grouping)."""
+
+import pytest
+
+from quartumse.observables import (
+    CommutingGroup,
+    Observable,
+    ObservableSet,
+    build_commutation_graph,
+    build_qubitwise_commutation_graph,
+    dsatur_grouping,
+    edge_coloring_grouping,
+    generate_all_k_local,
+    generate_edge_correlators,
+    greedy_grouping,
+    partition_observable_set,
+    pauli_commutes,
+    qubitwise_commutes,
+    sample_random_paulis,
+    shared_measurement_basis,
+    sorted_insertion_grouping,
+    verify_grouping,
+)
+
+
+@pytest.fixture
+def random_observables():
+    """Mixed-weight random observables on 6 qubits."""
+    paulis = sample_random_paulis(6, 80, strategy="uniform", seed=7)
+    return [Observable(p) for p in paulis]
+
+
+class TestGreedyGrouping:
+    """Test greedy_grouping."""
+
+    def test_basis_matches_shared_measurement_basis(self, random_observables):
+        """The tracked union basis equals the basis recomputed from scratch."""
+        groups = greedy_grouping(random_observables)
+        assert verify_grouping(groups)
+        for group in groups:
+            assert group.measurement_basis == shared_measurement_basis(group.observables)
+
+    def test_first_fit_in_index_order(self):
+        """Each group takes every later compatible observable in index order."""
+        observables = [Observable(p) for p in ["XI", "ZI", "IY", "XY", "ZZ"]]
+        groups = greedy_grouping(observables)
+        assert [g.observable_indices for g in groups] == [[0, 2, 3], [1, 4]]
+
+    def test_global_commutation_has_no_basis(self):
+        """Globally commuting groups carry no shared measurement basis."""
+        observables = [Observable(p) for p in ["XX", "ZZ", "YY"]]
+        groups = greedy_grouping(observables, use_qubitwise=False)
+        assert [g.observable_indices for g in groups] == [[0, 1, 2]]
+        assert groups[0].measurement_basis == ""
+
+
+class TestSortedInsertionGrouping:
+    """Test sorted_insertion_grouping."""
+
+    def test_groups_cover_all_observables(self, random_observables):
+        """Every observable lands in exactly one group."""
+        groups = sorted_insertion_grouping(random_observables)
+        indices = sorted(i for g in groups for i in g.observable_indices)
+        assert indices == list(range(len(random_observables)))
+
+    def test_groups_are_valid(self, random_observables):
+        """Each group shares a qubit-wise measurement basis."""
+        groups = sorted_insertion_grouping(random_observables)
+        assert verify_grouping(groups)
+
+    def test_basis_matches_shared_measurement_basis(self, random_observables):
+        """The tracked union basis equals the basis recomputed from scratch."""
+        for group in sorted_insertion_grouping(random_observables):
+            assert group.measurement_basis == shared_measurement_basis(group.observables)
+
+    def test_commuting_z_strings_form_one_group(self):
+        """All-Z observables collapse into a single group."""
+        observables = [Observable(p) for p in ["ZIII", "IZII", "ZZII", "ZZZZ", "IIIZ"]]
+        groups = sorted_insertion_grouping(observables)
+        assert len(groups) == 1
+        assert groups[0].measurement_basis == "ZZZZ"
+
+    def test_conflicting_strings_are_split(self):
+        """Different non-identity Paulis on one qubit cannot share a group."""
+        observables = [Observable(p) for p in ["XI", "ZI", "IY"]]
+        groups = sorted_insertion_grouping(observables)
+        assert len(groups) == 2
+        assert {g.measurement_basis for g in groups} == {"XY", "ZZ"}
+
+
+class TestDsaturGrouping:
+    """Test dsatur_grouping."""
+
+    def test_groups_cover_all_observables(self, random_observables):
+        """Every observable lands in exactly one valid group."""
+        groups = dsatur_grouping(random_observables)
+        indices = sorted(i for g in groups for i in g.observable_indices)
+        assert indices == list(range(len(random_observables)))
+        assert verify_grouping(groups)
+
+    def test_no_worse_than_greedy_on_two_local(self):
+        """On all 2-local strings DSATUR needs no more groups than first-fit."""
+        observables = [Observable(p) for p in generate_all_k_local(6, 2)]
+        assert len(dsatur_grouping(observables)) <= len(greedy_grouping(observables))
+
+    def test_pairwise_conflicts_need_separate_groups(self):
+        """X, Y and Z on the same qubit form three singleton groups."""
+        observables = [Observable(p) for p in ["XI", "YI", "ZI", "IZ"]]
+        groups = dsatur_grouping(observables)
+        assert len(groups) == 3
+        assert sorted(len(g.observable_indices) for g in groups) == [1, 1, 2]
+
+
+class TestEdgeColoringGrouping:
+    """Test edge_coloring_grouping."""
+
+    def test_two_local_suite_is_valid(self):
+        """Mixed 1- and 2-local strings are covered by valid groups."""
+        paulis = generate_all_k_local(5, 1) + generate_all_k_local(5, 2)
+        observables = [Observable(p) for p in paulis]
+        groups = edge_coloring_grouping(observables)
+        assert verify_grouping(groups)
+        indices = sorted(i for g in groups for i in g.observable_indices)
+        assert indices == list(range(len(observables)))
+
+    def test_same_letter_chain_merges(self):
+        """ZZ and XX correlators on a ring collapse to one group per letter."""
+        paulis = generate_edge_correlators(6, graph="ring", paulis=["ZZ", "XX"])
+        groups = edge_coloring_grouping([Observable(p) for p in paulis])
+        assert {g.measurement_basis for g in groups} == {"ZZZZZZ", "XXXXXX"}
+
+    def test_falls_back_above_weight_two(self, random_observables):
+        """Higher-weight observables use the greedy path."""
+        groups = edge_coloring_grouping(random_observables)
+        expected = greedy_grouping(random_observables)
+        assert [g.observable_indices for g in groups] == [g.observable_indices for g in expected]
+
+
+class TestPartitionObservableSet:
+    """Test partition_observable_set dispatch."""
+
+    @pytest.mark.parametrize("method", ["greedy", "sorted_insertion", "dsatur", "edge_coloring"])
+    def test_methods_produce_valid_groupings(self, random_observables, method):
+        """All supported methods return valid groupings and stats."""
+        obs_set = ObservableSet(observables=random_observables)
+        groups, stats = partition_observable_set(obs_set, method=method)
+        assert verify_grouping(groups)
+        assert stats["n_groups"] == len(groups)
+        assert stats["n_observables"] == len(random_observables)
+
+    def test_unknown_method_raises(self, random_observables):
+        """Unknown grouping methods are rejected."""
+        obs_set = ObservableSet(observables=random_observables)
+        with pytest.raises(ValueError, match="Unknown grouping method"):
+            partition_observable_set(obs_set, method="bogus")
+
+    def test_grouping_reused_across_sets_with_same_strings(self, random_observables):
+        """Sets with the same Pauli strings share the cached grouping but not observables."""
+        from quartumse.observables.grouping import _partition_indices
+
+        _partition_indices.cache_clear()
+        first = ObservableSet(observables=random_observables)
+        second = ObservableSet(
+            observables=[
+                Observable(obs.pauli_string, coefficient=2.0) for obs in random_observables
+            ]
+        )
+        groups_a, _ = partition_observable_set(first, method="sorted_insertion")
+        groups_b, _ = partition_observable_set(second, method="sorted_insertion")
+
+        assert _partition_indices.cache_info().hits == 1
+        assert [g.observable_indices for g in groups_a] == [g.observable_indices for g in groups_b]
+        assert groups_a[0].observable_indices is not groups_b[0].observable_indices
+        for group in groups_b:
+            assert all(obs.coefficient == 2.0 for obs in group.observables)
+            assert all(obs.group_id == group.group_id for obs in group.observables)
+
+
+class TestVerifyGrouping:
+    """Test verify_grouping."""
+
+    def test_rejects_conflicting_group(self):
+        """A group with clashing Paulis on one qubit is invalid."""
+        observables = [Observable("XZ"), Observable("ZZ")]
+        group = CommutingGroup(
+            group_id="group_0",
+            observable_indices=[0, 1],
+            measurement_basis="ZZ",
+            observables=observables,
+        )
+        assert not verify_grouping([group])
+
+    def test_accepts_identity_padding(self):
+        """Identity positions never cause conflicts."""
+        observables = [Observable("XI"), Observable("IY"), Observable("XY")]
+        group = CommutingGroup(
+            group_id="group_0",
+            observable_indices=[0, 1, 2],
+            measurement_basis="XY",
+            observables=observables,
+        )
+        assert verify_grouping([group])
+
+    def test_rejects_empty_group(self):
+        """Empty groups have no measurement basis."""
+        group = CommutingGroup(group_id="group_0", observable_indices=[], measurement_basis="")
+        assert not verify_grouping([group])
+
+
+class TestCommutationGraphs:
+    """Test the vectorized commutation graph builders."""
+
+    @pytest.mark.parametrize(
+        "builder,check",
+        [
+            (build_commutation_graph, pauli_commutes),
+            (build_qubitwise_commutation_graph, qubitwise_commutes),
+        ],
+    )
+    def test_matches_pairwise_check(self, random_observables, builder, check):
+        """Edges agree with the scalar pairwise commutation test."""
+        graph = builder(random_observables)
+        for i, obs_i in enumerate(random_observables):
+            expected = {
+                j
+                for j, obs_j in enumerate(random_observables)
+                if j != i and check(obs_i.pauli_string, obs_j.pauli_string)
+            }
+            assert graph[i] == expected
+
+    @pytest.mark.parametrize(
+        "builder,check",
+        [
+            (build_commutation_graph, pauli_commutes),
+            (build_qubitwise_commutation_graph, qubitwise_commutes),
+        ],
+    )
+    def test_multi_word_strings(self, builder, check):
+        """Strings wider than one 64-bit word are compared across all words."""
+        paulis = sample_random_paulis(70, 40, strategy="importance", seed=1)
+        paulis += ["X" * 70, "Y" * 70, "Z" * 69 + "X"]
+        observables = [Observable(p) for p in paulis]
+        graph = builder(observables)
+        for i, p_i in enumerate(paulis):
+            assert graph[i] == {j for j, p_j in enumerate(paulis) if j != i and check(p_i, p_j)}
+
+    def test_mismatched_lengths_raise(self):
+        """Observables on different qubit counts cannot be compared."""
+        with pytest.raises(ValueError, match="same length"):
+            build_qubitwise_commutation_graph([Observable("XI"), Observable("XII")])
+
+
+class TestCommutationShortCircuits:
+    """Test identity and equal-string fast paths."""
+
+    @pytest.mark.parametrize("check", [pauli_commutes, qubitwise_commutes])
+    def test_identity_and_equal_strings_commute(self, check):
+        """The identity and an operator with itself always commute."""
+        assert check("III", "XYZ")
+        assert check("XYZ", "III")
+        assert check("XYZ", "XYZ")
+        assert not check("XII", "ZII")
+
+    @pytest.mark.parametrize("check", [pauli_commutes, qubitwise_commutes])
+    def test_length_mismatch_still_raises(self, check):
+        """Short-circuits never hide a width mismatch."""
+        with pytest.raises(ValueError, match="same length"):
+            check("II", "III")
+
+    def test_observable_commutes_with(self):
+        """Observable.commutes_with shares the fast paths."""
+        assert Observable("II").commutes_with(Observable("XY"))
+        assert Observable("XY").commutes_with(Observable("XY"))
+        assert Observable("XY").commutes_with(Observable("YX"))
+        assert not Observable("XI").commutes_with(Observable("ZI"))
+
+    def test_observable_shared_basis(self):
+        """Observable.shared_basis fills identities with Z and rejects conflicts."""
+        assert Observable("XIY").shared_basis(Observable("XZI")) == "XZY"
+        assert Observable("XI").shared_basis(Observable("YI")) is None
+        assert Observable("XI").shared_basis(Observable("XII")) is None
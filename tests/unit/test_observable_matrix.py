@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.sparse import csr_matrix
 
-from quartumse.observables import Observable
+from quartumse.observables import Observable, pauli_product
 
 
 def test_observable_sparse_matrix_round_trip() -> None:
@@ -23,3 +23,11 @@ def test_observable_sparse_matrix_identity() -> None:
     expected = 2.0 * np.eye(2**len(observable.pauli_string), dtype=complex)
     np.testing.assert_allclose(dense, expected)
     np.testing.assert_allclose(sparse_mat.toarray(), expected)
+
+
+def test_pauli_product_matches_matrix_product() -> None:
+    for left, right in [("XY", "ZZ"), ("YIZX", "XZZY"), ("III", "XYZ"), ("Y", "Y")]:
+        phase, product = pauli_product(left, right)
+
+        expected = Observable(left).to_matrix() @ Observable(right).to_matrix()
+        np.testing.assert_allclose(phase * Observable(product).to_matrix(), expected)
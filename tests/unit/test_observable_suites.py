@@ -0,0 +1,445 @@
+"""Unit tests for observable suite generators (observables.suites)."""
+
+from math import comb
+
+import numpy as np
+import pytest
+
+from quartumse.observables import (
+    ObjectiveType,
+    Observable,
+    ObservableSet,
+    ObservableSuite,
+    SuiteBundle,
+    SuiteType,
+    generate_all_k_local,
+    generate_edge_correlators,
+    generate_single_qubit,
+    generate_zz_correlators,
+    make_bell_suites,
+    make_chemistry_suites,
+    make_commuting_suite,
+    make_ghz_suites,
+    make_ising_suites,
+    make_phase_sensing_suites,
+    make_qaoa_ring_suites,
+    sample_random_paulis,
+)
+from quartumse.observables.suites import (
+    _emit_edge_paulis,
+    _merge_weight_classes,
+    _paulis_soa,
+    _rows_to_strings,
+    _set_soa_sites,
+    _stratified_plan,
+)
+
+
+def _paulis(suite):
+    """Pauli strings of a suite, in order."""
+    return [obs.pauli_string for obs in suite.observables]
+
+
+class TestGenerateAllKLocal:
+    """Test generate_all_k_local."""
+
+    @pytest.mark.parametrize("n_qubits,k", [(1, 1), (4, 2), (5, 3), (3, 3)])
+    def test_count_and_weight(self, n_qubits, k):
+        """Produces C(n,k) * 3^k distinct strings of weight exactly k."""
+        paulis = generate_all_k_local(n_qubits, k)
+        assert len(paulis) == comb(n_qubits, k) * 3**k
+        assert len(set(paulis)) == len(paulis)
+        assert all(len(p) == n_qubits for p in paulis)
+        assert all(sum(c != "I" for c in p) == k for p in paulis)
+
+    def test_ordering(self):
+        """Positions vary slowest, operators fastest."""
+        assert generate_all_k_local(2, 1) == ["XI", "YI", "ZI", "IX", "IY", "IZ"]
+
+    def test_k_exceeds_n(self):
+        """No strings exist when k > n_qubits."""
+        assert generate_all_k_local(2, 3) == []
+
+    def test_k_zero(self):
+        """The only 0-local string is the identity."""
+        assert generate_all_k_local(3, 0) == ["III"]
+
+
+class TestGenerateEdgeCorrelators:
+    """Test generate_edge_correlators."""
+
+    def test_chain_ordering(self):
+        """Edges vary slowest, Pauli pairs fastest."""
+        assert generate_edge_correlators(3, graph="chain", paulis=["ZZ", "XY"]) == [
+            "ZZI",
+            "XYI",
+            "IZZ",
+            "IXY",
+        ]
+
+    def test_explicit_pairs_keep_orientation(self):
+        """The first Pauli lands on the first qubit of each pair."""
+        assert generate_edge_correlators(3, pairs=[(2, 0)], paulis=["XZ"]) == ["ZIX"]
+
+    def test_all_pairs_count(self):
+        """The complete graph yields C(n, 2) strings per Pauli pair."""
+        paulis = generate_edge_correlators(6, paulis=["XX", "YY", "ZZ"])
+        assert len(paulis) == comb(6, 2) * 3
+        assert len(set(paulis)) == len(paulis)
+
+    def test_invalid_pauli_pair_raises(self):
+        """Pauli pairs must have exactly two characters."""
+        with pytest.raises(ValueError, match="2 characters"):
+            generate_edge_correlators(3, paulis=["XYZ"])
+
+    def test_emit_kernel_matches_vectorized_path(self):
+        """The loop kernel writes the same rows as the fancy-indexed fallback."""
+        first = np.array([0, 3], dtype=np.intp)
+        second = np.array([2, 1], dtype=np.intp)
+        letters = [np.frombuffer(b"XZ", dtype=np.uint8), np.frombuffer(b"YZ", dtype=np.uint8)]
+        out = np.empty((4, 4), dtype=np.uint8)
+        _emit_edge_paulis(first, second, *letters, out)
+        assert _rows_to_strings(out) == generate_edge_correlators(
+            4, pairs=[(0, 2), (3, 1)], paulis=["XY", "ZZ"]
+        )
+
+
+class TestMemoizedGenerators:
+    """Test memoized string generators hand out independent lists."""
+
+    def test_zz_correlators_copy(self):
+        """Extending a returned list does not affect later calls."""
+        first = generate_zz_correlators(4, graph="chain")
+        first.append("ZZZZ")
+        assert generate_zz_correlators(4, graph="chain") == ["ZZII", "IZZI", "IIZZ"]
+
+    def test_single_qubit_copy(self):
+        """generate_single_qubit results are fresh lists."""
+        first = generate_single_qubit(2, paulis="Z")
+        first.extend(["XX"])
+        assert generate_single_qubit(2, paulis="Z") == ["ZI", "IZ"]
+
+    def test_unknown_graph_still_raises(self):
+        """Invalid graph names are not cached and keep raising."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unknown graph type"):
+                generate_zz_correlators(3, graph="star")
+
+
+class TestSoaConstruction:
+    """Test bit-packed structure-of-arrays Pauli construction."""
+
+    @pytest.mark.parametrize("n_qubits", [2, 5, 64, 65, 130])
+    def test_zz_all_matches_edge_correlators(self, n_qubits):
+        """The packed ZZ path matches the generic edge-correlator path."""
+        assert generate_zz_correlators(n_qubits) == generate_edge_correlators(
+            n_qubits, graph="all", paulis=["ZZ"]
+        )
+
+    def test_from_soa_round_trip(self):
+        """Suites built from packed words decode each letter correctly."""
+        x_words, z_words = _paulis_soa(70, 3)
+        rows = np.arange(3)
+        _set_soa_sites(x_words, z_words, rows, np.array([0, 64, 69]), "X")
+        _set_soa_sites(x_words, z_words, rows, np.array([1, 65, 3]), "Y")
+        _set_soa_sites(x_words, z_words, rows[:1], np.array([2]), "Z")
+        suite = ObservableSuite.from_soa("soa", SuiteType.STRESS, x_words, z_words, 70)
+        assert [obs.pauli_string for obs in suite.observables] == [
+            "XYZ" + "I" * 67,
+            "I" * 64 + "XY" + "I" * 4,
+            "IIIY" + "I" * 65 + "X",
+        ]
+
+
+class TestSampleRandomPaulis:
+    """Test sample_random_paulis."""
+
+    @pytest.mark.parametrize("strategy", ["stratified", "uniform", "importance", "uniform_weight"])
+    def test_unique_and_within_weight(self, strategy):
+        """Samples are unique, correctly sized and respect max_weight."""
+        paulis = sample_random_paulis(8, 80, strategy=strategy, max_weight=4, seed=3)
+        assert len(paulis) == 80
+        assert len(set(paulis)) == len(paulis)
+        assert all(len(p) == 8 for p in paulis)
+        assert all(1 <= sum(c != "I" for c in p) <= 4 for p in paulis)
+
+    @pytest.mark.parametrize("strategy", ["stratified", "uniform", "importance", "uniform_weight"])
+    def test_seeded_reproducibility(self, strategy):
+        """The same seed yields the same samples in the same order."""
+        first = sample_random_paulis(10, 150, strategy=strategy, seed=11)
+        second = sample_random_paulis(10, 150, strategy=strategy, seed=11)
+        assert first == second
+
+    def test_cached_results_are_independent_copies(self):
+        """Repeated calls are memoized but callers can mutate their copy."""
+        first = sample_random_paulis(6, 40, seed=9)
+        first.append("mutated")
+        second = sample_random_paulis(6, 40, seed=9)
+        assert "mutated" not in second
+        assert second == first[:-1]
+
+    def test_stratified_balances_weights(self):
+        """Stratified sampling draws equally from each weight class."""
+        paulis = sample_random_paulis(12, 120, strategy="stratified", max_weight=4, seed=5)
+        weights = [sum(c != "I" for c in p) for p in paulis]
+        assert [weights.count(k) for k in range(1, 5)] == [30, 30, 30, 30]
+
+    def test_stratified_enumerates_small_classes(self):
+        """Weight classes smaller than their quota are enumerated exhaustively."""
+        paulis = sample_random_paulis(2, 30, strategy="stratified", seed=0)
+        assert sorted(paulis) == sorted(generate_all_k_local(2, 1) + generate_all_k_local(2, 2))
+
+    def test_stratified_plan_apportionment(self):
+        """The remainder goes to the lowest weights; small classes are enumerated."""
+        strata, first_weights = _stratified_plan(4, 31, 2)
+        assert strata == ((1, 16, None), (2, 15, 30))
+        assert first_weights.tolist() == [2] * 30
+        assert not first_weights.flags.writeable
+        assert _stratified_plan(4, 31, 2) is _stratified_plan(4, 31, 2)
+
+    def test_unknown_strategy_raises(self):
+        """Unknown strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown sampling strategy"):
+            sample_random_paulis(4, 10, strategy="bogus")
+
+
+class TestSuiteCaching:
+    """Test fingerprint-keyed caching on ObservableSet and ObservableSuite."""
+
+    def test_fingerprint_depends_on_content(self):
+        """Equal Pauli content hashes equal; different content does not."""
+        a = ObservableSet.from_pauli_strings(["XI", "IZ"])
+        b = ObservableSet.from_pauli_strings(["XI", "IZ"])
+        c = ObservableSet.from_pauli_strings(["XI", "ZI"])
+        assert a.fingerprint == b.fingerprint
+        assert a.fingerprint != c.fingerprint
+
+    def test_fingerprint_invalidated_on_append(self):
+        """Appending an observable refreshes the fingerprint and locality cache."""
+        obs_set = ObservableSet.from_pauli_strings(["XI", "IZ"])
+        before = obs_set.fingerprint
+        assert obs_set.locality_distribution() == {1: 2}
+        obs_set.observables.append(Observable("XZ"))
+        assert obs_set.fingerprint != before
+        assert obs_set.locality_distribution() == {1: 2, 2: 1}
+
+    def test_fingerprint_tracks_in_place_edits(self):
+        """Replacing an observable without changing the count refreshes cached results."""
+        suite = ObservableSuite.from_pauli_strings("s", SuiteType.STRESS, ["ZZ", "IZ"])
+        before = suite.observable_set.fingerprint
+        assert suite.commutation_analysis()["n_commuting_groups"] == 1
+        suite.observables[1] = Observable("XI")
+        assert suite.observable_set.fingerprint != before
+        assert suite.locality_distribution() == {1: 1, 2: 1}
+        assert suite.commutation_analysis()["n_commuting_groups"] == 2
+
+    def test_commutation_analysis_is_cached(self, monkeypatch):
+        """Repeated analysis reuses the partition until the set changes."""
+        from quartumse.observables import grouping
+
+        calls = []
+        original = grouping.partition_observable_set
+
+        def counting(*args, **kwargs):
+            calls.append(kwargs.get("method"))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(grouping, "partition_observable_set", counting)
+        suite = ObservableSuite.from_pauli_strings("s", SuiteType.STRESS, ["XI", "ZI", "IZ"])
+        first = suite.commutation_analysis()
+        assert suite.commutation_analysis() == first
+        assert len(calls) == 1
+
+        suite.commutation_analysis(method="sorted_insertion")
+        assert len(calls) == 2
+
+        suite.observables.append(Observable("XX"))
+        assert suite.commutation_analysis()["n_commuting_groups"] >= first["n_commuting_groups"]
+        assert len(calls) == 3
+
+    def test_equal_terms_share_string_objects(self):
+        """Pauli strings are interned when suites are built."""
+        first = ObservableSuite.from_pauli_strings("a", SuiteType.WORKLOAD, ["".join(["Z", "Z"])])
+        second = ObservableSuite.from_pauli_strings("b", SuiteType.WORKLOAD, ["".join(["Z", "Z"])])
+        assert first.observables[0].pauli_string is second.observables[0].pauli_string
+
+
+class TestComputeObjective:
+    """Test ObservableSuite.compute_objective specializations."""
+
+    def test_weighted_sum(self):
+        """Weighted sum ignores estimates without weights and missing estimates."""
+        suite = ObservableSuite.from_pauli_strings(
+            "w", SuiteType.WORKLOAD, ["ZZ", "XX", "IZ"], weights={"ZZ": 0.5, "XX": -1.0}
+        )
+        ids = {obs.pauli_string: obs.observable_id for obs in suite.observables}
+        assert suite.compute_objective({ids["ZZ"]: 1.0, ids["XX"]: 0.25, ids["IZ"]: 3.0}) == 0.25
+        assert suite.compute_objective({ids["ZZ"]: 1.0}) == 0.5
+
+    def test_array_weights_and_estimates(self):
+        """Row-aligned weights match dict weights; array estimates use the same rows."""
+        suite = ObservableSuite.from_pauli_strings(
+            "w", SuiteType.WORKLOAD, ["ZZ", "XX", "IZ"], weights=np.array([0.5, -1.0, 2.0])
+        )
+        ids = [obs.observable_id for obs in suite.observables]
+        assert suite.weights == {ids[0]: 0.5, ids[1]: -1.0, ids[2]: 2.0}
+        estimates = np.array([1.0, 0.25, -0.5])
+        assert suite.compute_objective(estimates) == pytest.approx(-0.75)
+        assert suite.compute_objective(dict(zip(ids, estimates, strict=True))) == pytest.approx(
+            -0.75
+        )
+
+    def test_array_weights_length_mismatch_raises(self):
+        """Array weights need exactly one coefficient per Pauli string."""
+        with pytest.raises(ValueError, match="Expected 2 weights"):
+            ObservableSuite.from_pauli_strings("w", SuiteType.WORKLOAD, ["ZZ", "XX"], np.ones(3))
+
+    def test_per_observable_mean(self):
+        """Unweighted suites report the mean estimate."""
+        suite = ObservableSuite.from_pauli_strings("p", SuiteType.WORKLOAD, ["ZZ", "XX"])
+        assert suite.compute_objective({"a": 1.0, "b": 2.0}) == pytest.approx(1.5)
+
+    def test_weighted_sum_without_weights_raises(self):
+        """WEIGHTED_SUM without weights is rejected at evaluation time."""
+        suite = ObservableSuite.from_pauli_strings(
+            "e", SuiteType.WORKLOAD, ["ZZ"], objective=ObjectiveType.WEIGHTED_SUM
+        )
+        with pytest.raises(ValueError, match="requires weights"):
+            suite.compute_objective({})
+
+
+class TestSuiteMakers:
+    """Test deduplicated workload suites from the circuit-specific makers."""
+
+    def test_ghz_commuting_suite_is_deduplicated(self):
+        """ZZ pairs, single Z and global Z appear once each, in generation order."""
+        paulis = [obs.pauli_string for obs in make_ghz_suites(2)["commuting_z_only"].observables]
+        assert paulis == ["ZZ", "ZI", "IZ"]
+
+    def test_merge_weight_classes_only_dedups_equal_weights(self):
+        """Same-weight lists are filtered against each other, first occurrence wins."""
+        merged = _merge_weight_classes((2, ["ZZ", "XX"]), (1, ["ZI"]), (2, ["XX", "YY"]))
+        assert merged == ["ZZ", "XX", "ZI", "YY"]
+
+    @pytest.mark.parametrize("n_qubits", [1, 2, 3])
+    def test_commuting_suite_global_term_deduplicated(self, n_qubits):
+        """The global string is not repeated when it coincides with a 1- or 2-local term."""
+        paulis = [obs.pauli_string for obs in make_commuting_suite(n_qubits, "X").observables]
+        assert len(paulis) == len(set(paulis)) == len({*paulis, "X" * n_qubits})
+
+    def test_phase_sensing_stabilizers_order(self):
+        """Phase observables come first, followed by the ZZ chain."""
+        suite = make_phase_sensing_suites(3)["workload_stabilizers"]
+        assert [obs.pauli_string for obs in suite.observables] == ["XXX", "YYY", "ZZI", "IZZ"]
+
+    def test_bell_pair_and_cross_pair_terms(self):
+        """Pair correlators and cross-pair ZZ terms are laid out per pair."""
+        suites = make_bell_suites(3)
+        pairs = [obs.pauli_string for obs in suites["workload_pair_correlations"].observables]
+        assert pairs[:3] == ["XXIIII", "YYIIII", "ZZIIII"]
+        assert pairs[-1] == "IIIIZZ"
+        cross = [obs.pauli_string for obs in suites["diagnostics_cross_pair"].observables]
+        assert cross == ["ZIZIII", "ZIIIZI", "IIZIZI"]
+
+    def test_ising_energy_weights(self):
+        """ZZ chain terms carry -J and transverse X terms carry -h."""
+        suite = make_ising_suites(3)["workload_energy"]
+        by_string = {
+            obs.pauli_string: suite.weights[obs.observable_id] for obs in suite.observables
+        }
+        assert by_string == {"ZZI": -1.0, "IZZ": -1.0, "XII": -0.5, "IXI": -0.5, "IIX": -0.5}
+
+    def test_ising_correlations_cover_distances(self):
+        """Z_i Z_{i+r} terms for r = 1..4, ordered by distance then site."""
+        suite = make_ising_suites(6)["workload_correlations"]
+        paulis = [obs.pauli_string for obs in suite.observables]
+        assert len(paulis) == 5 + 4 + 3 + 2
+        assert paulis[:2] == ["ZZIIII", "IZZIII"]
+        assert paulis[-1] == "IZIIIZ"
+
+    def test_repeated_calls_share_cached_suites(self, monkeypatch):
+        """Repeated calls reuse the cached build but return private copies."""
+        from quartumse.observables import suites as suites_module
+
+        first = make_ghz_suites(6, seed=7)
+        del first["posthoc_library"]
+        stress = first["stress_random_1000"]
+        second = make_ghz_suites(6, seed=7)
+        assert "posthoc_library" in second
+        # The stress suite is not sampled again for the second bundle
+        monkeypatch.setattr(suites_module, "sample_random_paulis", None)
+        assert second["stress_random_1000"] is not stress
+        assert _paulis(second["stress_random_1000"]) == _paulis(stress)
+        monkeypatch.undo()
+        assert _paulis(make_ghz_suites(6, seed=8)["stress_random_1000"]) != _paulis(stress)
+
+    def test_seed_independent_suites_shared_across_seeds(self):
+        """Workload suites depend only on the qubit count, not the seed."""
+        first = make_bell_suites(3, seed=1)
+        second = make_bell_suites(3, seed=2)
+        for name in ("workload_pair_correlations", "diagnostics_cross_pair"):
+            assert second[name] is not first[name]
+            assert _paulis(second[name]) == _paulis(first[name])
+        assert _paulis(make_bell_suites(4, seed=1)["workload_pair_correlations"]) != _paulis(
+            first["workload_pair_correlations"]
+        )
+
+    def test_bundle_builds_suites_lazily(self, monkeypatch):
+        """Only the suites a caller touches are sampled."""
+        from quartumse.observables import suites as suites_module
+
+        calls = []
+        original = suites_module.sample_random_paulis
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(suites_module, "sample_random_paulis", counting)
+        bundle = make_ising_suites(5, seed=123)
+        assert list(bundle) == ["workload_energy", "workload_correlations", "stress_random_1000"]
+        assert isinstance(bundle, SuiteBundle)
+        assert bundle["workload_energy"].n_observables == 9
+        assert calls == []
+        bundle["stress_random_1000"]
+        assert len(calls) == 1
+        plain = dict(bundle)
+        assert list(plain) == list(bundle)
+        assert plain["stress_random_1000"] is bundle["stress_random_1000"]
+
+    def test_parallel_build_matches_sequential(self):
+        """build_all on a thread pool samples each suite with its own seed."""
+        bundle = make_qaoa_ring_suites(5, seed=321).build_all(max_workers=4)
+        assert "built=[]" not in repr(bundle)
+        expected = {
+            "workload_cost": generate_zz_correlators(5, graph="ring"),
+            "commuting_cost": generate_zz_correlators(5, graph="ring"),
+            "stress_random_1000": sample_random_paulis(5, 1000, seed=321),
+            "posthoc_library": sample_random_paulis(5, 2000, seed=1321),
+        }
+        assert {
+            name: [obs.pauli_string for obs in suite.observables] for name, suite in bundle.items()
+        } == expected
+
+    def test_cached_bundles_hand_out_private_suites(self):
+        """Mutating a returned suite does not leak into later calls."""
+        first = make_ghz_suites(4, seed=5)
+        suite = first["workload_stabilizers"]
+        assert first["workload_stabilizers"] is suite
+        suite.metadata["tag"] = "mine"
+        suite.observables[0].group_id = "mutated"
+
+        fresh = make_ghz_suites(4, seed=5)["workload_stabilizers"]
+        assert "tag" not in fresh.metadata
+        assert fresh.observables[0].group_id != "mutated"
+        assert _paulis(fresh) == _paulis(suite)
+
+    def test_chemistry_cache_keys_on_hamiltonian(self):
+        """Explicit Hamiltonians are cached by value; list inputs are accepted."""
+        first = make_chemistry_suites(2, ["ZZ", "XX"], [0.5, -1.0])
+        second = make_chemistry_suites(2, ["ZZ", "XX"], [0.5, -1.0])
+        assert second["workload_energy"] is not first["workload_energy"]
+        assert second["workload_energy"].weights == first["workload_energy"].weights
+        assert sorted(first["workload_energy"].weights.values()) == [-1.0, 0.5]
+        placeholder = make_chemistry_suites(2)
+        assert "workload_energy_placeholder" in placeholder
@@ -0,0 +1,750 @@
+"""Unit tests for the protocol base classes, acquisition and run loop (protocols.base)."""
+
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import XGate
+
+from quartumse.observables import Observable, ObservableSet
+from quartumse.protocols import (
+    AdaptiveProtocol,
+    DirectNaiveProtocol,
+    Estimates,
+    MeasurementPlan,
+    MeasurementSetting,
+    ObservableEstimate,
+    ProtocolConfig,
+    ProtocolState,
+    RawDatasetChunk,
+    configure_backend_for_batching,
+)
+
+
+def chunk_bitstrings(chunk):
+    """Dict-format outcomes of a chunk as bitstrings, keyed by setting."""
+    return {setting_id: chunk.get_bitstrings(setting_id) for setting_id in chunk.setting_ids}
+
+
+def record_submissions(backend, monkeypatch):
+    """Record the circuit list passed to each backend.run() call."""
+    submissions = []
+    original = backend.run
+
+    def run(circuits, **kwargs):
+        submissions.append(list(circuits))
+        return original(circuits, **kwargs)
+
+    monkeypatch.setattr(backend, "run", run)
+    return submissions
+
+
+class TestStaticAcquire:
+    """Test StaticProtocol.acquire batching."""
+
+    def test_settings_share_one_job(self, bell_circuit, bell_observables, backend, monkeypatch):
+        """Settings with equal shot counts are submitted in a single job."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=300, seed=1)
+        submissions = record_submissions(backend, monkeypatch)
+
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+
+        assert [len(circuits) for circuits in submissions] == [3]
+        assert chunk.settings_executed == ["setting_0", "setting_1", "setting_2"]
+        assert all(len(bs) == 100 for bs in chunk_bitstrings(chunk).values())
+        assert len(chunk.metadata["per_setting_aer_times_s"]) == 3
+
+    def test_settings_grouped_by_shot_count(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """Distinct shot counts map to one job each and keep setting order."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=300, seed=1)
+        plan = protocol.plan(state)
+        plan.shots_per_setting = [50, 80, 50]
+        submissions = record_submissions(backend, monkeypatch)
+
+        chunk = protocol.acquire(bell_circuit, plan, backend, seed=1)
+
+        assert sorted(len(circuits) for circuits in submissions) == [1, 2]
+        assert [chunk.setting_shots(sid) for sid in chunk.settings_executed] == [50, 80, 50]
+
+    def test_shared_basis_settings_merged(self, bell_circuit, backend, monkeypatch):
+        """Settings measuring in the same basis run as one experiment, then split."""
+        observables = ObservableSet(
+            observables=[
+                Observable(observable_id="zi", pauli_string="ZI"),
+                Observable(observable_id="iz", pauli_string="IZ"),
+                Observable(observable_id="zz", pauli_string="ZZ"),
+            ]
+        )
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(observables, total_budget=300, seed=1)
+        plan = protocol.plan(state)
+        plan.shots_per_setting = [50, 120, 130]
+        submissions = record_submissions(backend, monkeypatch)
+
+        chunk = protocol.acquire(bell_circuit, plan, backend, seed=1)
+
+        assert [len(circuits) for circuits in submissions] == [1]
+        assert [chunk.setting_shots(sid) for sid in chunk.settings_executed] == [50, 120, 130]
+        for bitstrings in chunk_bitstrings(chunk).values():
+            assert all(bs in ("00", "11") for bs in bitstrings)
+        times = chunk.metadata["per_setting_aer_times_s"]
+        assert times[1] == pytest.approx(times[0] * 120 / 50)
+
+    def test_equivalent_bases_share_a_circuit(self, backend, monkeypatch):
+        """Bases equal after I->Z and target padding compile to one circuit."""
+        prep = QuantumCircuit(3)
+        prep.h(1)
+        settings = [
+            MeasurementSetting(setting_id="a", measurement_basis="IZI"),
+            MeasurementSetting(setting_id="b", measurement_basis="ZZI"),
+            MeasurementSetting(setting_id="c", measurement_basis="X", target_qubits=[1]),
+            MeasurementSetting(setting_id="d", measurement_basis="ZXZ"),
+        ]
+        plan = MeasurementPlan(
+            settings=settings, shots_per_setting=[40, 60, 30, 70], observable_setting_map={}
+        )
+        submissions = record_submissions(backend, monkeypatch)
+
+        chunk = DirectNaiveProtocol().acquire(prep, plan, backend, seed=2)
+
+        assert sum(len(circuits) for circuits in submissions) == 2
+        assert [chunk.setting_shots(sid) for sid in "abcd"] == [40, 60, 30, 70]
+        # H then a measurement in X: qubit 1 always reads 0
+        assert all(bs[1] == "0" for sid in "cd" for bs in chunk_bitstrings(chunk)[sid])
+
+    def test_process_pool_is_reproducible(self, bell_circuit, bell_observables, backend):
+        """Splitting settings across processes is seeded and keeps each basis."""
+        protocol = DirectNaiveProtocol(ProtocolConfig(parallel_settings=2))
+        state = protocol.initialize(bell_observables, total_budget=300, seed=1)
+        plan = protocol.plan(state)
+
+        chunk = protocol.acquire(bell_circuit, plan, backend, seed=4)
+        repeat = protocol.acquire(bell_circuit, plan, backend, seed=4)
+
+        assert chunk_bitstrings(chunk) == chunk_bitstrings(repeat)
+        assert len(chunk.metadata["per_setting_aer_times_s"]) == 3
+        # ZZ on a Bell state: both qubits always agree
+        assert all(bs[0] == bs[1] for bs in chunk_bitstrings(chunk)["setting_2"])
+
+    def test_large_settings_split_into_sub_jobs(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """Settings above shots_per_job run as seeded sub-jobs whose counts merge."""
+        protocol = DirectNaiveProtocol(ProtocolConfig(shots_per_job=40))
+        plan = protocol.plan(protocol.initialize(bell_observables, total_budget=300, seed=1))
+        plan.shots_per_setting = [100, 30, 100]
+        shots = []
+        original = backend.run
+
+        def run(circuits, **kwargs):
+            shots.append((len(circuits), kwargs["shots"], kwargs["seed_simulator"]))
+            return original(circuits, **kwargs)
+
+        monkeypatch.setattr(backend, "run", run)
+
+        chunk = protocol.acquire(bell_circuit, plan, backend, seed=6)
+        repeat = protocol.acquire(bell_circuit, plan, backend, seed=6)
+
+        # Largest group first: 100 = 40 + 40 + 20 on seeds 6, 7, 8
+        assert shots[:4] == [(2, 40, 6), (2, 40, 7), (2, 20, 8), (1, 30, 6)]
+        assert [chunk.setting_shots(sid) for sid in chunk.settings_executed] == [100, 30, 100]
+        assert all(bs[0] == bs[1] for bs in chunk_bitstrings(chunk)["setting_2"])
+        assert chunk_bitstrings(chunk) == chunk_bitstrings(repeat)
+
+    def test_single_circuit_path_uses_batch_helper(self, bell_circuit, backend, monkeypatch):
+        """The legacy one-circuit helper submits a one-element batch."""
+        measured = bell_circuit.copy()
+        measured.measure_all()
+        submissions = record_submissions(backend, monkeypatch)
+
+        bitstrings = DirectNaiveProtocol()._execute_measurement_circuit(
+            measured, backend, n_shots=50, seed=2
+        )
+
+        assert [len(circuits) for circuits in submissions] == [1]
+        assert len(bitstrings) == 50
+        assert set(bitstrings) <= {"00", "11"}
+
+    def test_bell_correlations(self, bell_circuit, bell_observables, backend):
+        """Demultiplexed outcomes keep each setting's basis."""
+        protocol = DirectNaiveProtocol()
+        estimates = protocol.run(bell_circuit, bell_observables, 3000, backend, seed=3)
+        values = {e.observable_id: e.estimate for e in estimates.estimates}
+        assert values["xx"] == pytest.approx(1.0)
+        assert values["yy"] == pytest.approx(-1.0)
+        assert values["zz"] == pytest.approx(1.0)
+
+    def test_run_batch_shares_one_job(self, bell_circuit, bell_observables, backend, monkeypatch):
+        """Workloads are submitted together and estimated separately."""
+        flipped = QuantumCircuit(2)
+        flipped.x([0, 1])
+        z_observables = ObservableSet(
+            observables=[
+                Observable(observable_id="zi", pauli_string="ZI"),
+                Observable(observable_id="zz", pauli_string="ZZ"),
+            ]
+        )
+        protocol = DirectNaiveProtocol()
+        submissions = record_submissions(backend, monkeypatch)
+
+        bell, flip = protocol.run_batch(
+            [(bell_circuit, bell_observables), (flipped, z_observables)],
+            total_budget=600,
+            backend=backend,
+            seed=3,
+        )
+
+        # One job per distinct shot count: 3 x 200 (Bell) and 1 x 600 (merged Z basis)
+        assert sorted(len(circuits) for circuits in submissions) == [1, 3]
+        bell_values = {e.observable_id: e.estimate for e in bell.estimates}
+        flip_values = {e.observable_id: e.estimate for e in flip.estimates}
+        assert bell_values == pytest.approx({"xx": 1.0, "yy": -1.0, "zz": 1.0})
+        assert flip_values == pytest.approx({"zi": -1.0, "zz": 1.0})
+        assert bell.total_shots == 600 and flip.total_shots == 600
+
+    def test_expired_deadline_runs_nothing(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """A deadline in the past stops before any submission."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=300, seed=1)
+        submissions = record_submissions(backend, monkeypatch)
+
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1, deadline=0.0)
+
+        assert submissions == []
+        assert chunk_bitstrings(chunk) == {}
+        assert chunk.metadata["timed_out"]
+
+
+class TestDefaultBackend:
+    """Test the shared default simulator."""
+
+    def test_default_backend_is_reused(self, bell_circuit, bell_observables):
+        """acquire() without a backend reuses one batching-configured simulator."""
+        from quartumse.protocols import base
+
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), None, seed=1)
+
+        assert chunk.n_shots == 30
+        default = base._get_default_backend()
+        assert default is base._get_default_backend()
+        assert default.options.max_parallel_experiments == (os.cpu_count() or 1)
+
+    def test_configure_backend_for_batching(self, backend):
+        """The helper configures the backend in place and returns it."""
+        assert configure_backend_for_batching(backend) is backend
+        assert backend.options.max_parallel_threads == 0
+        assert backend.options.max_parallel_shots == 1
+
+
+class TestCompiledCircuitCache:
+    """Test reuse of transpiled measurement circuits."""
+
+    def test_compiled_circuits_reused_across_calls(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """Repeated acquisitions on one circuit transpile each basis once."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+        plan = protocol.plan(state)
+
+        calls = []
+        original = protocol._transpile_circuits
+
+        def counting(circuits, backend):
+            calls.append(len(circuits))
+            return original(circuits, backend)
+
+        monkeypatch.setattr(protocol, "_transpile_circuits", counting)
+        protocol.acquire(bell_circuit, plan, backend, seed=1)
+        protocol.acquire(bell_circuit, plan, backend, seed=2)
+        # All three bases are compiled together on first use
+        assert calls == [3]
+
+        # A different state-preparation circuit is compiled separately
+        other = bell_circuit.copy()
+        other.x(0)
+        protocol.acquire(other, plan, backend, seed=1)
+        assert calls == [3, 3]
+
+        # Clearing the cache forces recompilation
+        protocol.clear_circuit_cache()
+        protocol.acquire(bell_circuit, plan, backend, seed=3)
+        assert calls == [3, 3, 3]
+
+    def test_cache_keyed_on_circuit_contents(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """Equal copies share entries; in-place edits miss the cache."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+        plan = protocol.plan(state)
+
+        calls = []
+        original = protocol._transpile_circuits
+
+        def counting(circuits, backend):
+            calls.append(len(circuits))
+            return original(circuits, backend)
+
+        monkeypatch.setattr(protocol, "_transpile_circuits", counting)
+        circuit = bell_circuit.copy()
+        protocol.acquire(circuit, plan, backend, seed=1)
+        protocol.acquire(circuit.copy(), plan, backend, seed=2)
+        assert calls == [3]
+
+        # Replacing a gate keeps the length but changes the circuit
+        circuit.data[0] = circuit.data[0].replace(operation=XGate())
+        chunk = protocol.acquire(circuit, plan, backend, seed=3)
+        assert calls == [3, 3]
+        # X then CX prepares |11>, so every ZZ-basis shot reads 11
+        zz = next(s for s in plan.settings if s.measurement_basis == "ZZ")
+        assert np.all(chunk.get_bitstring_array(zz.setting_id) == 1)
+
+    def test_base_circuit_stripped_once_per_batch(
+        self, bell_circuit, bell_observables, backend, monkeypatch
+    ):
+        """All uncached settings of a plan share one base-circuit lookup."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+
+        calls = []
+        original = protocol._base_circuit
+
+        def counting(circuit, key=None):
+            calls.append(circuit)
+            return original(circuit, key)
+
+        monkeypatch.setattr(protocol, "_base_circuit", counting)
+        protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+        assert len(calls) == 1
+
+
+class TestTranspileSkip:
+    """Test that circuits Aer runs natively bypass qiskit.transpile."""
+
+    @pytest.fixture
+    def transpile_calls(self, monkeypatch):
+        from quartumse.protocols import base
+
+        calls = []
+        original = base.transpile
+
+        def counting(circuits, backend=None, **kwargs):
+            calls.append(kwargs)
+            return original(circuits, backend, **kwargs)
+
+        monkeypatch.setattr(base, "transpile", counting)
+        return calls
+
+    def test_native_gates_not_transpiled(
+        self, bell_circuit, bell_observables, backend, transpile_calls
+    ):
+        """Bell preparation plus basis rotations run on Aer as built."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+        protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+        assert transpile_calls == []
+
+    def test_custom_gates_transpiled(
+        self, bell_circuit, bell_observables, backend, transpile_calls
+    ):
+        """Composite instructions Aer cannot run go through transpile."""
+        prep = bell_circuit.copy()
+        prep.append(bell_circuit.to_gate(label="bell"), [0, 1])
+
+        protocol = DirectNaiveProtocol(ProtocolConfig(transpile_optimization_level=1))
+        state = protocol.initialize(bell_observables, total_budget=30, seed=1)
+        protocol.acquire(prep, protocol.plan(state), backend, seed=1)
+        # One batched transpile() call covers all three settings
+        assert [call["optimization_level"] for call in transpile_calls] == [1]
+
+    def test_verbatim_skips_transpile(self, bell_circuit, backend, transpile_calls):
+        """config.extra["verbatim"] passes circuits through for any backend."""
+        prep = bell_circuit.copy()
+        prep.append(bell_circuit.to_gate(label="bell"), [0, 1])
+        prep.measure_all()
+
+        protocol = DirectNaiveProtocol(ProtocolConfig(extra={"verbatim": True}))
+        (compiled,) = protocol._transpile_circuits([prep], backend)
+
+        assert compiled is prep
+        assert transpile_calls == []
+
+    def test_unmeasured_circuit_rejected(self, bell_circuit, backend):
+        """Hand-made circuits without classical bits fail before submission."""
+        with pytest.raises(ValueError, match="no classical bits"):
+            DirectNaiveProtocol()._transpile_circuits([bell_circuit], backend)
+
+
+class TestCountsExpansion:
+    """Test StaticProtocol._counts_to_bitstrings."""
+
+    def test_outcomes_reversed_into_qubit_order(self):
+        """Qiskit's little-endian keys become qubit-ordered shots, sorted by key."""
+        counts = {"10": 2, "0 1": 1, "00": 1}
+        bitstrings = DirectNaiveProtocol._counts_to_bitstrings(counts)
+        assert bitstrings == ["10", "00", "01", "01"]
+
+    def test_bit_array_matches_bitstrings(self):
+        """The array expansion has the same shots, in the same order."""
+        counts = {"110": 3, "0 01": 2, "000": 1}
+        bitstrings = DirectNaiveProtocol._counts_to_bitstrings(counts)
+        array = DirectNaiveProtocol._counts_to_bit_array(counts, 3)
+        assert array.dtype == np.uint8
+        assert ["".join(map(str, row)) for row in array] == bitstrings
+
+    def test_split_merged_counts_conserves_outcomes(self):
+        """Merged counts are partitioned exactly, per experiment."""
+        from quartumse.protocols.base import _split_merged_counts
+
+        unique_counts = [{"00": 70, "11": 30}, {"01": 5}]
+        counts_list, times = _split_merged_counts(
+            unique_counts, np.array([1.0, 0.5]), [0, 1, 0], [40, 5, 60], seed=3
+        )
+
+        assert [sum(c.values()) for c in counts_list] == [40, 5, 60]
+        assert counts_list[0].get("00", 0) + counts_list[2].get("00", 0) == 70
+        assert counts_list[1] == {"01": 5}
+        np.testing.assert_allclose(times, [0.4, 0.5, 0.6])
+
+    def test_chunk_carries_bit_arrays(self, bell_circuit, bell_observables, backend):
+        """acquire() stores read-only bit arrays that match their bitstrings."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=60, seed=1)
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+
+        # Strings are rendered on demand rather than stored
+        assert chunk.bitstrings == {}
+        for setting_id in chunk.setting_ids:
+            array = chunk.get_bitstring_array(setting_id)
+            assert array.shape == (20, 2)
+            assert not array.flags.writeable
+            np.testing.assert_array_equal(
+                array,
+                RawDatasetChunk(bitstrings=chunk_bitstrings(chunk)).get_bitstring_array(setting_id),
+            )
+
+    def test_plain_sampler_outcomes_reversed(self, bell_circuit):
+        """Samplers returning bare bitstrings get them reversed into qubit order."""
+
+        class ListSampler:
+            def sample(self, circuit, n_shots, seed=None):
+                class Result:
+                    bitstrings = ["01", "11", "01"]
+
+                return Result()
+
+        outcomes = DirectNaiveProtocol()._run_compiled_circuit(bell_circuit, ListSampler(), 3, 0)
+        assert outcomes == ["10", "11", "10"]
+        assert outcomes[0] is outcomes[2]
+
+    def test_sampler_backend_outcomes(self, bell_circuit, bell_observables):
+        """Sampler backends go through the same counts expansion."""
+        from quartumse.backends.sampler import IdealSampler
+
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=60, seed=1)
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), IdealSampler(), seed=1)
+
+        zz = chunk.get_bitstring_array("setting_2")
+        assert zz.shape == (20, 2)
+        assert np.all(zz[:, 0] == zz[:, 1])
+        assert chunk_bitstrings(chunk)["setting_2"] == ["".join(map(str, row)) for row in zz]
+
+
+class TestExpandBasis:
+    """Test StaticProtocol._expand_basis."""
+
+    @pytest.mark.parametrize(
+        "basis,n_qubits,targets,expected",
+        [
+            ("", 3, None, "ZZZ"),
+            ("XIY", 3, None, "XZY"),
+            ("XY", 4, [1, 3], "ZXZY"),
+            ("XYZ", 4, [0, 2], "XZZZ"),
+            ("XY", 3, None, "ZZZ"),
+            ("IX", 3, [0, 2], "ZZX"),
+        ],
+    )
+    def test_expansion(self, basis, n_qubits, targets, expected):
+        """Bases are padded with Z on untargeted qubits and I becomes Z."""
+        protocol = DirectNaiveProtocol()
+        assert protocol._expand_basis(basis, n_qubits, targets) == expected
+        # Repeated calls hit the memoized result
+        assert protocol._expand_basis(basis, n_qubits, targets) == expected
+
+    def test_rotation_layer(self):
+        """X and Y qubits get H and Sdg-H before measurement; Z gets nothing."""
+        protocol = DirectNaiveProtocol()
+        prep = QuantumCircuit(3)
+        prep.h(0)
+        built = protocol._build_measurement_circuit(prep, "XZY", None)
+
+        rotations = [
+            (inst.operation.name, built.find_bit(inst.qubits[0]).index)
+            for inst in built.data[1:]
+            if inst.operation.name not in ("barrier", "measure")
+        ]
+        assert rotations == [("h", 0), ("sdg", 2), ("h", 2)]
+        assert built.num_clbits == 3
+        # The prepared circuit is left untouched
+        assert len(prep.data) == 1
+
+
+class TestProtocolConfig:
+    """Test ProtocolConfig immutability and max_rounds defaults."""
+
+    def test_shared_config_resolves_per_protocol(self):
+        """One config gives static and adaptive protocols their own round limits."""
+        config = ProtocolConfig(random_seed=3)
+        assert DirectNaiveProtocol(config).config.max_rounds == 1
+        assert PlateauProtocol(config).config.max_rounds == 10
+        assert PlateauProtocol().config.max_rounds == 10
+        assert config.max_rounds is None
+
+    def test_explicit_max_rounds_kept(self):
+        """An explicit max_rounds is used as given, even for adaptive protocols."""
+        assert PlateauProtocol(ProtocolConfig(max_rounds=1)).config.max_rounds == 1
+
+    def test_frozen_and_hashable(self):
+        """Configs cannot be mutated and can key caches."""
+        import dataclasses
+
+        config = ProtocolConfig(extra={"note": "x"})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_rounds = 5
+        with pytest.raises(TypeError):
+            config.extra["note"] = "y"
+        assert hash(config) == hash(ProtocolConfig(extra={"note": "y"}))
+        assert config.to_dict()["note"] == "x"
+        assert "extra" not in config.to_dict()
+
+    def test_config_key_covers_extra(self):
+        """_config_key tells apart configs that differ only in extra."""
+        config = ProtocolConfig(extra={"note": "x"})
+        keys = {config._config_key(), ProtocolConfig(extra={"note": "y"})._config_key()}
+        assert len(keys) == 2
+        assert replace(config, max_rounds=3).extra == {"note": "x"}
+
+    def test_from_kwargs_folds_unknown_keys_into_extra(self):
+        """from_kwargs accepts protocol-specific keywords and inverts to_dict."""
+        config = ProtocolConfig.from_kwargs(random_seed=2, verbatim=True, extra={"note": "x"})
+        assert config.random_seed == 2
+        assert config.extra == {"note": "x", "verbatim": True}
+
+        restored = ProtocolConfig.from_kwargs(**config.to_dict())
+        assert restored == config
+        assert restored._config_key() == config._config_key()
+
+    def test_pickle_round_trip(self):
+        """Configs pickle with their extra mapping intact."""
+        import pickle
+
+        config = ProtocolConfig(random_seed=4, extra={"note": "x"})
+        restored = pickle.loads(pickle.dumps(config))
+        assert restored == config
+        assert restored._config_key() == config._config_key()
+
+
+class TestRunBookkeeping:
+    """Test the timing and round records produced by Protocol.run."""
+
+    def test_round_metadata_and_timing(self, bell_circuit, bell_observables, backend, monkeypatch):
+        """Each round records its shots, settings and times; totals are consistent."""
+        protocol = DirectNaiveProtocol()
+        seen_states = []
+        original = protocol.finalize
+
+        def capturing(state, observable_set):
+            seen_states.append(state)
+            return original(state, observable_set)
+
+        monkeypatch.setattr(protocol, "finalize", capturing)
+        estimates = protocol.run(bell_circuit, bell_observables, 300, backend, seed=5)
+
+        records = [m for m in seen_states[0].round_metadata if m]
+        assert len(records) == 1
+        timings = seen_states[0].round_timings
+        assert timings["shots"].tolist() == [300]
+        assert timings["settings"].tolist() == [3]
+        assert records[0]["shots_this_round"] == 300
+        assert records[0]["settings_this_round"] == 3
+        assert records[0]["quantum_time_s"] == pytest.approx(estimates.time_quantum_s)
+
+        timing = estimates.timing_breakdown
+        assert timing.time_acquire_wall_s == pytest.approx(estimates.time_quantum_s)
+        assert timing.time_pre_compute_s >= 0
+        assert len(timing.per_setting_aer_times_s) == 3
+
+        assert isinstance(timing.per_setting_aer_times_s, np.ndarray)
+
+    def test_single_round_static_path_matches_loop(self, bell_circuit, bell_observables, backend):
+        """The loop-free single-round path gives the same result as the round loop."""
+        fast = DirectNaiveProtocol().run(bell_circuit, bell_observables, 300, backend, seed=5)
+        looped = DirectNaiveProtocol(ProtocolConfig(max_rounds=2)).run(
+            bell_circuit, bell_observables, 300, backend, seed=5
+        )
+
+        assert [e.estimate for e in fast.estimates] == [e.estimate for e in looped.estimates]
+        assert [chunk_bitstrings(c) for c in fast.raw_chunks] == [
+            chunk_bitstrings(c) for c in looped.raw_chunks
+        ]
+        assert fast.timing_breakdown.time_aer_simulate_s > 0
+
+    def test_single_round_static_timeout(self, bell_circuit, bell_observables, backend):
+        """A zero timeout stops the single-round path before acquiring."""
+        estimates = DirectNaiveProtocol().run(
+            bell_circuit, bell_observables, 300, backend, timeout_s=0.0
+        )
+        assert estimates.timed_out
+        assert estimates.raw_chunks == []
+
+    def test_zero_timeout_stops_before_first_round(self, bell_circuit, bell_observables):
+        """The monotonic deadline from timeout_s is checked before planning."""
+        estimates = PlateauProtocol(ProtocolConfig(max_rounds=5)).run(
+            bell_circuit, bell_observables, 1000, None, timeout_s=0.0
+        )
+        assert estimates.timed_out
+        assert estimates.raw_chunks == []
+
+    def test_setting_times_accumulate_across_rounds(self, bell_circuit, bell_observables):
+        """Per-setting times from every round are kept, past the initial buffer."""
+        estimates = PlateauProtocol(ProtocolConfig(max_rounds=5)).run(
+            bell_circuit, bell_observables, 1000, None
+        )
+        np.testing.assert_array_equal(
+            estimates.timing_breakdown.per_setting_aer_times_s, np.full(200, 0.25)
+        )
+
+
+class PlateauProtocol(AdaptiveProtocol):
+    """Adaptive protocol whose estimate plateaus after the second round."""
+
+    protocol_id = "test_plateau"
+
+    def initialize(self, observable_set, total_budget, seed):
+        return ProtocolState(
+            observable_set=observable_set, total_budget=total_budget, remaining_budget=total_budget
+        )
+
+    def next_plan(self, state, remaining_budget):
+        setting = MeasurementSetting(setting_id=f"round_{state.n_rounds}", measurement_basis="ZZ")
+        return MeasurementPlan(
+            settings=[setting], shots_per_setting=[10], observable_setting_map={}
+        )
+
+    def acquire(self, circuit, plan, backend, seed, deadline=None):
+        return RawDatasetChunk(
+            bitstrings={plan.settings[0].setting_id: ["00"] * 10},
+            metadata={"per_setting_aer_times_s": np.full(40, 0.25)},
+        )
+
+    def update(self, state, data_chunk):
+        return state
+
+    def finalize(self, state, observable_set):
+        value = min(state.n_rounds, 2) / 2
+        return Estimates(estimates=[ObservableEstimate(observable_id="zz", estimate=value, se=0.1)])
+
+    def check_convergence(self, state, observable_set, target_precision=None):
+        return state.converged
+
+
+class TestStabilityStopping:
+    """Test stability-based early stopping in Protocol.run."""
+
+    def test_stops_after_patience_stable_rounds(self, bell_circuit, bell_observables):
+        """Estimates 0.5, 1, 1, 1 stop after two stable rounds."""
+        config = ProtocolConfig(max_rounds=10, convergence_epsilon=1e-3, convergence_patience=2)
+        estimates = PlateauProtocol(config).run(bell_circuit, bell_observables, 1000, None)
+        assert len(estimates.raw_chunks) == 4
+
+    def test_disabled_by_default(self, bell_circuit, bell_observables):
+        """Without an epsilon the protocol runs to max_rounds."""
+        estimates = PlateauProtocol(ProtocolConfig(max_rounds=6)).run(
+            bell_circuit, bell_observables, 1000, None
+        )
+        assert len(estimates.raw_chunks) == 6
+
+
+class LookaheadProtocol(AdaptiveProtocol):
+    """Adaptive protocol that plans three rounds ahead and converges after four."""
+
+    protocol_id = "test_lookahead"
+    lookahead = 3
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.acquired_plans = []
+
+    def initialize(self, observable_set, total_budget, seed):
+        return ProtocolState(
+            observable_set=observable_set, total_budget=total_budget, remaining_budget=total_budget
+        )
+
+    def next_plan(self, state, remaining_budget):
+        setting = MeasurementSetting(setting_id="s0", measurement_basis="ZZ")
+        return MeasurementPlan(
+            settings=[setting], shots_per_setting=[10], observable_setting_map={"zz": [0]}
+        )
+
+    def next_plans(self, state, remaining_budget, k):
+        return [self.next_plan(state, remaining_budget) for _ in range(k)]
+
+    def acquire(self, circuit, plan, backend, seed, deadline=None):
+        self.acquired_plans.append(plan)
+        ids = [setting.setting_id for setting in plan.settings]
+        return RawDatasetChunk(
+            bitstrings={
+                sid: ["00"] * shots for sid, shots in zip(ids, plan.shots_per_setting, strict=True)
+            },
+            settings_executed=ids,
+            metadata={"per_setting_aer_times_s": np.full(len(ids), 0.5)},
+        )
+
+    def update(self, state, data_chunk):
+        state.converged = state.n_rounds >= 4
+        return state
+
+    def finalize(self, state, observable_set):
+        return Estimates(estimates=[ObservableEstimate(observable_id="zz", estimate=1.0, se=0.1)])
+
+    def check_convergence(self, state, observable_set, target_precision=None):
+        return state.converged
+
+
+class TestLookahead:
+    """Test batched lookahead rounds in Protocol.run."""
+
+    def test_rounds_batched_and_discarded_on_convergence(self, bell_circuit, bell_observables):
+        """Six rounds are acquired in two calls; the two after convergence are dropped."""
+        protocol = LookaheadProtocol()
+        estimates = protocol.run(bell_circuit, bell_observables, 1000, None)
+
+        merged = protocol.acquired_plans[0]
+        assert len(protocol.acquired_plans) == 2
+        assert [s.setting_id for s in merged.settings] == ["0/s0", "1/s0", "2/s0"]
+        assert merged.observable_setting_map == {"zz": [0, 1, 2]}
+        assert len(estimates.raw_chunks) == 4
+        for chunk in estimates.raw_chunks:
+            assert chunk.settings_executed == ["s0"]
+            assert chunk_bitstrings(chunk) == {"s0": ["00"] * 10}
+            assert chunk.metadata["aer_simulate_s"] == pytest.approx(0.5)
+            assert not chunk.metadata["timed_out"]
+
+    def test_lookahead_capped_by_max_rounds(self, bell_circuit, bell_observables):
+        """Planning never runs past max_rounds."""
+        protocol = LookaheadProtocol(ProtocolConfig(max_rounds=2))
+        estimates = protocol.run(bell_circuit, bell_observables, 1000, None)
+        assert [len(plan.settings) for plan in protocol.acquired_plans] == [2]
+        assert len(estimates.raw_chunks) == 2
@@ -0,0 +1,253 @@
+"""Unit tests for the direct measurement baselines (protocols.baselines)."""
+
+import numpy as np
+import pytest
+
+from quartumse.observables import Observable, ObservableSet
+from quartumse.protocols import (
+    DirectGroupedProtocol,
+    DirectNaiveProtocol,
+    DirectOptimizedProtocol,
+    RawDatasetChunk,
+)
+
+
+class TestBaselineEstimates:
+    """Test the packed-outcome estimators of the direct baselines."""
+
+    @pytest.mark.parametrize("n_qubits", [3, 70])
+    def test_matches_per_shot_parity(self, n_qubits):
+        """Mean and standard error match an explicit per-shot parity count."""
+        from quartumse.protocols import _kernels
+
+        rng = np.random.default_rng(3)
+        bits = rng.integers(0, 2, size=(100, n_qubits), dtype=np.uint8)
+        outcomes = _kernels.pack_words(bits)
+        assert outcomes.shape == (100, _kernels.n_words(n_qubits))
+
+        for pauli in ["Z" * n_qubits, "XY" + "I" * (n_qubits - 3) + "Z", "I" * n_qubits]:
+            support = [i for i, p in enumerate(pauli) if p != "I"]
+            eigenvalues = 1.0 - 2.0 * (bits[:, support].sum(axis=1, dtype=int) % 2)
+            expected_se = eigenvalues.std(ddof=1) / np.sqrt(len(eigenvalues)) * 0.5
+
+            naive = DirectNaiveProtocol()._estimate_from_outcomes(outcomes, pauli, -0.5)
+            grouped = DirectGroupedProtocol()._estimate_from_outcomes(
+                outcomes, pauli, "Z" * n_qubits, -0.5
+            )
+            for mean, se in (naive, grouped):
+                assert mean == pytest.approx(-0.5 * eigenvalues.mean())
+                assert se == pytest.approx(expected_se)
+
+    def test_group_estimate_matches_single(self, monkeypatch):
+        """One broadcast pass over a group reproduces per-observable estimates."""
+        from quartumse.protocols import _kernels
+        from quartumse.protocols.baselines._estimate import group_mean_se
+
+        # Force several shot blocks so block boundaries are exercised
+        monkeypatch.setattr(_kernels, "_BLOCK_ELEMENTS", 16)
+        rng = np.random.default_rng(5)
+        outcomes = _kernels.pack_words(rng.integers(0, 2, size=(50, 4), dtype=np.uint8))
+        paulis = ["ZIZI", "IZZZ", "ZZII", "IIII"]
+        coefficients = [1.0, -0.25, 2.0, 0.5]
+
+        grouped = group_mean_se(outcomes, paulis, coefficients)
+        for (mean, se), pauli, coefficient in zip(grouped, paulis, coefficients, strict=True):
+            naive_mean, naive_se = DirectNaiveProtocol()._estimate_from_outcomes(
+                outcomes, pauli, coefficient
+            )
+            assert mean == pytest.approx(naive_mean)
+            assert se == pytest.approx(naive_se, abs=1e-12)
+
+    def test_plan_shares_targets_and_native_basis(self):
+        """Naive settings reuse one target tuple and the cached native basis."""
+        observables = ObservableSet(
+            observables=[
+                Observable(observable_id="a", pauli_string="XIZ"),
+                Observable(observable_id="b", pauli_string="IYI"),
+            ]
+        )
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(observables, total_budget=10, seed=0)
+        plan = protocol.plan(state)
+
+        assert [s.setting_id for s in plan.settings] == list(state.setting_observable_ids)
+        assert state.setting_observable_ids == {"setting_0": "a", "setting_1": "b"}
+        assert [s.measurement_basis for s in plan.settings] == ["XZZ", "ZYZ"]
+        assert plan.settings[0].target_qubits == (0, 1, 2)
+        assert plan.settings[0].target_qubits is plan.settings[1].target_qubits
+        assert observables.observables[0].native_basis is plan.settings[0].measurement_basis
+
+    def test_update_counts_chunk_outcomes(self, bell_circuit, bell_observables, backend):
+        """update() keeps shot and parity counts that finalize() turns into estimates."""
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=90, seed=1)
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+        state = protocol.update(state, chunk)
+
+        assert state.observable_shots == {"xx": 30, "yy": 30, "zz": 30}
+        assert state.parity_counts["zz"] == 0
+        estimates = protocol.finalize(state, bell_observables)
+        for setting_id, obs_id in state.setting_observable_ids.items():
+            obs = bell_observables.get_by_id(obs_id)
+            expected = protocol._estimate_from_outcomes(
+                chunk.get_packed_words(setting_id), obs.pauli_string, obs.coefficient
+            )
+            estimate = estimates.get_estimate(obs_id)
+            assert (estimate.estimate, estimate.se) == pytest.approx(expected)
+
+    def test_update_accepts_array_only_chunks(self, bell_observables):
+        """uint8 and pre-packed uint64 payloads give the same state as bitstrings."""
+        from quartumse.protocols import _kernels
+
+        protocol = DirectGroupedProtocol()
+        bitstrings = ["00", "11", "01"]
+        bits = np.array([[0, 0], [1, 1], [0, 1]], dtype=np.uint8)
+        states = []
+        for payload in (
+            {"bitstrings": bitstrings},
+            {"bitstring_arrays": bits},
+            {"packed_outcomes": _kernels.pack_words(bits)},
+        ):
+            state = protocol.initialize(bell_observables, total_budget=100, seed=0)
+            group_id = state.groups[0].group_id
+            field_name, outcomes = next(iter(payload.items()))
+            chunk = RawDatasetChunk(**{field_name: {group_id: outcomes}}, n_qubits=2)
+            assert chunk.n_shots == 3
+            np.testing.assert_array_equal(chunk.get_bitstring_array(group_id), bits)
+            states.append(protocol.update(state, chunk))
+
+        for state in states:
+            group_id = state.groups[0].group_id
+            assert state.remaining_budget == 97
+            assert state.group_shots == {group_id: 3}
+            assert state.parity_counts == states[0].parity_counts
+
+    def test_threaded_group_counts_match_serial(self, monkeypatch):
+        """Threads count groups like the serial path and avoid the parallel kernel."""
+        from quartumse.protocols import _kernels
+
+        observables = ObservableSet(
+            observables=[
+                Observable(observable_id=obs_id, pauli_string=pauli)
+                for obs_id, pauli in [("zi", "ZI"), ("zz", "ZZ"), ("xx", "XX"), ("xi", "XI")]
+            ]
+        )
+        bits = np.random.default_rng(8).integers(0, 2, size=(2, 50, 2), dtype=np.uint8)
+        counts = []
+        for protocol in (DirectGroupedProtocol(), DirectGroupedProtocol(max_workers=3)):
+            state = protocol.initialize(observables, total_budget=300, seed=0)
+            arrays = {group.group_id: bits[i] for i, group in enumerate(state.groups)}
+            if protocol.max_workers:
+                # Take the compiled-kernel branch; threads must not enter the parallel one
+                monkeypatch.setattr(_kernels, "HAS_NUMBA", True)
+                monkeypatch.setattr(_kernels, "_group_odd_counts", None)
+            protocol.update(state, RawDatasetChunk(bitstring_arrays=arrays, n_qubits=2))
+            counts.append(state.parity_counts)
+
+        assert [len(group.observables) for group in state.groups] == [2, 2]
+        assert len(counts[1]) == 4
+        assert counts[1] == counts[0]
+
+    @pytest.mark.parametrize("protocol_cls", [DirectGroupedProtocol, DirectOptimizedProtocol])
+    def test_observable_groups_fixed_at_initialize(self, protocol_cls):
+        """Observables map to their groups group by group; finalize keeps set order."""
+        observables = ObservableSet(
+            observables=[
+                Observable(observable_id=obs_id, pauli_string=pauli)
+                for obs_id, pauli in [("zi", "ZI"), ("xx", "XX"), ("zz", "ZZ"), ("xi", "XI")]
+            ]
+        )
+        protocol = protocol_cls()
+        state = protocol.initialize(observables, total_budget=40, seed=0)
+
+        expected = [
+            (obs.observable_id, group.group_id)
+            for group in state.groups
+            for obs in group.observables
+        ]
+        assert list(state.observable_group_ids.items()) == expected
+        for group in state.groups:
+            protocol.update(state, RawDatasetChunk(bitstrings={group.group_id: ["00", "11"]}))
+        estimates = protocol.finalize(state, observables)
+        assert [e.observable_id for e in estimates.estimates] == ["zi", "xx", "zz", "xi"]
+        assert estimates.estimates[2].estimate == pytest.approx(1.0)
+        assert estimates.estimates[0].estimate == pytest.approx(0.0)
+
+    def test_grouped_estimates_cover_unmeasured_observables(self):
+        """Ungrouped and unmeasured observables get (0, inf); measured ones carry metadata."""
+        from quartumse.protocols.baselines._estimate import grouped_estimates
+
+        observables = [
+            Observable(observable_id=obs_id, pauli_string="ZZ", coefficient=2.0)
+            for obs_id in ("a", "b", "c")
+        ]
+        estimates = grouped_estimates(
+            observables,
+            group_ids={"a": "g0", "b": "g1"},
+            group_shots={"g0": 4},
+            parity_counts={"a": 1},
+            group_metadata={"g0": {"allocation_weight": 0.5}},
+        )
+
+        measured, unmeasured, ungrouped = estimates
+        assert measured.estimate == pytest.approx(2.0 * 0.5)
+        assert measured.n_shots == 4 and measured.n_settings == 1
+        assert measured.metadata == {"group_id": "g0", "allocation_weight": 0.5}
+        assert (unmeasured.se, unmeasured.n_shots, unmeasured.n_settings) == (float("inf"), 0, 1)
+        assert (ungrouped.se, ungrouped.n_shots, ungrouped.n_settings) == (float("inf"), 0, 0)
+
+    def test_update_accumulates_counts_across_chunks(self, bell_observables):
+        """Counts from successive chunks give the estimate of all their outcomes at once."""
+        from quartumse.protocols import _kernels
+
+        protocol = DirectGroupedProtocol()
+        state = protocol.initialize(bell_observables, total_budget=100, seed=0)
+        group_id = state.groups[0].group_id
+        rounds = (["00", "11"], ["01"], ["10", "11", "00"])
+        for bitstrings in rounds:
+            protocol.update(state, RawDatasetChunk(bitstrings={group_id: bitstrings}))
+
+        assert state.group_shots[group_id] == 6
+        obs = state.groups[0].observables[0]
+        assert state.parity_counts[obs.observable_id] == 2
+
+        # Matches a single pass over every shot of the three rounds
+        bits = RawDatasetChunk(bitstrings={"s": sum(rounds, [])}).get_bitstring_array("s")
+        expected = protocol._estimate_from_outcomes(
+            _kernels.pack_words(bits), obs.pauli_string, "ZZ", 1.0
+        )
+        estimate = protocol.finalize(state, bell_observables).get_estimate(obs.observable_id)
+        assert (estimate.estimate, estimate.se) == pytest.approx(expected)
+
+
+class TestOptimizedAllocation:
+    """Test DirectOptimizedProtocol's shot allocation across groups."""
+
+    def test_largest_remainder_split(self):
+        """Budgets are split exactly, with the minimum guaranteed per group."""
+        from quartumse.protocols.baselines.direct_optimized import _allocate_shots
+
+        shots = _allocate_shots(np.array([0.5, 0.3, 0.2, 0.0]), 100)
+        assert shots.tolist() == [49, 30, 20, 1]
+        assert _allocate_shots(np.array([1.0, 1.0, 1.0]), 2).tolist() == [1, 1, 1]
+
+    def test_l2_weights_follow_coefficients(self):
+        """Groups get shots in proportion to their coefficient norm."""
+        observables = ObservableSet(
+            observables=[
+                Observable(observable_id="big", pauli_string="ZZ", coefficient=3.0),
+                Observable(observable_id="x", pauli_string="XX", coefficient=0.6),
+                Observable(observable_id="x2", pauli_string="XI", coefficient=0.8),
+            ]
+        )
+        protocol = DirectOptimizedProtocol(allocation_strategy="l2")
+        state = protocol.initialize(observables, total_budget=400, seed=0)
+
+        by_member = {
+            obs.observable_id: state.shots_per_group[g.group_id]
+            for g in state.groups
+            for obs in g.observables
+        }
+        assert sum(state.shots_per_group.values()) == 400
+        assert by_member["big"] == 300
+        assert by_member["x"] == 100
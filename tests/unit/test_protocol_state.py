@@ -0,0 +1,95 @@
+"""Unit tests for protocol state and outcome chunks (protocols.state)."""
+
+import numpy as np
+import pytest
+
+from quartumse.protocols import DirectNaiveProtocol, ProtocolState, RawDatasetChunk
+
+
+class TestShotPool:
+    """Test pooled outcome storage: ProtocolState's shot pool and chunk.to_arrow()."""
+
+    def test_pool_grows_by_doubling(self):
+        """Pooled outcomes are copied into one buffer that doubles when full."""
+        rng = np.random.default_rng(0)
+        chunks = [rng.integers(0, 2, (n, 2), dtype=np.uint8) for n in (3, 2, 5)]
+        state = ProtocolState()
+        state.add_chunk(RawDatasetChunk(bitstring_arrays={"s": chunks[0]}, n_qubits=2))
+        assert state.shot_pool["s"].shape == (3, 2)
+
+        state.add_chunk(RawDatasetChunk(bitstring_arrays={"s": chunks[1]}, n_qubits=2))
+        pool = state.shot_pool["s"]
+        assert pool.shape == (6, 2)
+        state.add_chunk(RawDatasetChunk(bitstring_arrays={"s": chunks[2]}, n_qubits=2))
+        assert state.shot_pool["s"].shape == (12, 2)
+        assert state.shot_counts["s"] == 10
+
+        outcomes = state.get_setting_outcomes("s")
+        np.testing.assert_array_equal(outcomes, np.vstack(chunks))
+        assert np.shares_memory(outcomes, state.shot_pool["s"])
+        assert not outcomes.flags.writeable
+        assert not np.shares_memory(outcomes, chunks[0])
+        assert chunks[0].flags.writeable
+
+    def test_pool_rejects_width_change(self):
+        """A setting's pooled outcomes keep one register width."""
+        state = ProtocolState()
+        state.add_chunk(
+            RawDatasetChunk(bitstring_arrays={"s": np.zeros((1, 2), dtype=np.uint8)}, n_qubits=2)
+        )
+        with pytest.raises(ValueError, match="shape"):
+            state.add_chunk(
+                RawDatasetChunk(
+                    bitstring_arrays={"s": np.zeros((1, 3), dtype=np.uint8)}, n_qubits=3
+                )
+            )
+
+    def test_chunk_to_arrow(self, bell_circuit, bell_observables, backend, tmp_path):
+        """Arrow tables hold every shot and survive a Parquet round trip."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        protocol = DirectNaiveProtocol()
+        state = protocol.initialize(bell_observables, total_budget=90, seed=1)
+        chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=1)
+
+        table = pa.concat_tables([chunk.to_arrow(), chunk.to_arrow()])
+        pq.write_table(table, tmp_path / "shots.parquet")
+        restored = pq.read_table(tmp_path / "shots.parquet")
+
+        expected = [bs for sid in chunk.setting_ids for bs in chunk.get_bitstrings(sid)]
+        assert restored.column("bitstring").to_pylist() == expected * 2
+        assert restored.column("setting_id").to_pylist()[:31] == ["setting_0"] * 30 + ["setting_1"]
+
+    def test_to_arrow_covers_every_outcome_form(self):
+        """Packed-only and mixed chunks export one row per shot."""
+        from quartumse.protocols import _kernels
+
+        bits = np.array([[1, 0, 1], [0, 1, 1]], dtype=np.uint8)
+        packed = RawDatasetChunk(packed_outcomes={"p": _kernels.pack_words(bits)}, n_qubits=3)
+        table = packed.to_arrow()
+        assert table.num_rows == packed.n_shots == 2
+        assert table.column("bitstring").to_pylist() == ["101", "011"]
+
+        mixed = RawDatasetChunk(
+            bitstrings={"a": ["01"]},
+            bitstring_arrays={"b": np.array([[1, 1], [0, 0]], dtype=np.uint8)},
+            n_qubits=2,
+        )
+        table = mixed.to_arrow()
+        assert table.num_rows == mixed.n_shots == 3
+        assert table.column("setting_id").to_pylist() == ["a", "b", "b"]
+        assert table.column("bitstring").to_pylist() == ["01", "11", "00"]
+
+    def test_packed_outcomes_require_n_qubits(self):
+        """Packed words cannot be unpacked without the register width."""
+        words = np.zeros((2, 1), dtype=np.uint64)
+        with pytest.raises(ValueError, match="n_qubits"):
+            RawDatasetChunk(packed_outcomes={"p": words})
+
+    def test_unpooled_setting(self):
+        """Settings without outcome arrays are not pooled."""
+        state = ProtocolState()
+        state.add_chunk(RawDatasetChunk(bitstrings={"s": ["01"]}, n_qubits=2))
+        with pytest.raises(KeyError):
+            state.get_setting_outcomes("s")
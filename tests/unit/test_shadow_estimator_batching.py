@@ -68,3 +68,22 @@ def test_shadow_estimator_batches_by_backend_limit(monkeypatch, tmp_path):
     assert measurement_bases.shape[0] == shadow_config.shadow_size
     assert measurement_outcomes.shape[0] == shadow_config.shadow_size
     assert result.shots_used == shadow_config.shadow_size
+
+
+def test_shadow_outcomes_in_qubit_order(tmp_path):
+    """Decoded outcomes put qubit 0 in column 0."""
+    backend = AerSimulator(seed_simulator=7)
+    estimator = ShadowEstimator(
+        backend=backend,
+        shadow_config=ShadowConfig(shadow_size=40, random_seed=3),
+        data_dir=tmp_path,
+    )
+
+    circuit = QuantumCircuit(2)
+    circuit.x(0)
+    result = estimator.estimate(circuit, [Observable("ZI")], save_manifest=False)
+
+    bases, outcomes, _ = estimator.shot_data_writer.load_shadow_measurements(result.experiment_id)
+    z_rows = (bases == 0).all(axis=1)
+    assert z_rows.any()
+    assert (outcomes[z_rows] == [1, 0]).all()
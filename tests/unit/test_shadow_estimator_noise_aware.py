@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
@@ -149,3 +150,18 @@ def test_noise_aware_replay_missing_confusion_matrix(tmp_path):
     manifest_path = Path(original_result.manifest_path)
     with pytest.raises(FileNotFoundError):
         replay_estimator.replay_from_manifest(manifest_path)
+
+
+def test_noise_aware_expectation_sums_signed_probabilities():
+    config = ShadowConfig(version=ShadowVersion.V1_NOISE_AWARE, shadow_size=1, random_seed=0)
+    shadows = NoiseAwareRandomLocalCliffordShadows(config, mem=None)
+    shadows.measurement_bases = np.array([[0, 1, 0]])
+    shadows.measurement_outcomes = np.zeros((1, 3), dtype=int)
+    distribution = np.random.default_rng(4).normal(size=8)
+    shadows.noise_corrected_distributions = distribution[np.newaxis, :]
+
+    # ZXI: sign of state i is (-1)^(bit 0 + bit 1); non-positive entries are skipped
+    signs = np.array([(-1) ** (bin(i & 0b011).count("1")) for i in range(8)])
+    expected = 9 * 0.5 * np.sum(np.clip(distribution, 0.0, None) * signs)
+    value = shadows._pauli_expectation_single_shadow(0, Observable("ZXI", coefficient=0.5))
+    assert value == pytest.approx(expected)
@@ -86,8 +86,8 @@ class TestShadowsV0Protocol:
         data_chunk = protocol.acquire(bell_circuit, plan, backend, seed=42)
 
         assert data_chunk.n_qubits == 2
-        assert "shadows_random_local_clifford" in data_chunk.bitstrings
-        assert len(data_chunk.bitstrings["shadows_random_local_clifford"]) == 50
+        assert data_chunk.settings_executed == ["shadows_random_local_clifford"]
+        assert len(data_chunk.get_bitstrings("shadows_random_local_clifford")) == 50
         assert "measurement_bases" in data_chunk.metadata
 
     def test_update_stores_shadow_data(self, bell_circuit, simple_obs_set, backend):
@@ -106,6 +106,22 @@ class TestShadowsV0Protocol:
         assert updated_state.remaining_budget == 0
         assert updated_state.n_rounds == 1
 
+    def test_update_parses_bitstrings_without_arrays(self, bell_circuit, simple_obs_set, backend):
+        """Chunks carrying only bitstrings decode to the same outcome array."""
+        protocol = ShadowsV0Protocol()
+        state = protocol.initialize(simple_obs_set, total_budget=50, seed=42)
+        data_chunk = protocol.acquire(bell_circuit, protocol.plan(state), backend, seed=42)
+        outcomes = data_chunk.bitstring_arrays["shadows_random_local_clifford"]
+        bitstrings = data_chunk.get_bitstrings("shadows_random_local_clifford")
+        assert bitstrings[0] == "".join(str(bit) for bit in outcomes[0])
+
+        data_chunk.bitstrings = {"shadows_random_local_clifford": bitstrings}
+        data_chunk.bitstring_arrays = {}
+        updated_state = protocol.update(state, data_chunk)
+
+        np.testing.assert_array_equal(updated_state.measurement_outcomes, outcomes)
+        assert updated_state.measurement_outcomes.flags.writeable
+
     def test_finalize_produces_estimates(self, bell_circuit, simple_obs_set, backend):
         """Test finalize() produces observable estimates."""
         protocol = ShadowsV0Protocol()
@@ -77,6 +77,20 @@ class TestRandomLocalCliffordShadows:
         assert bound2 == pytest.approx(16.0 / 100)  # 4^2 / 100
         assert bound3 == pytest.approx(64.0 / 100)  # 4^3 / 100
 
+    def test_vectorized_matches_single_shadow(self, shadow_config):
+        """Indexing with the cached support array agrees with the per-shadow path."""
+        shadows = RandomLocalCliffordShadows(shadow_config)
+        rng = np.random.default_rng(3)
+        shadows.measurement_bases = rng.integers(0, 3, size=(50, 3))
+        shadows.measurement_outcomes = rng.integers(0, 2, size=(50, 3))
+        obs = Observable("XIZ", coefficient=0.5)
+
+        assert obs.support_array is obs.support_array
+        assert obs.support_array.dtype == np.intp
+        assert not obs.support_array.flags.writeable
+        expected = [shadows._pauli_expectation_single_shadow(i, obs) for i in range(50)]
+        np.testing.assert_allclose(shadows._pauli_expectation_vectorized(obs), expected)
+
     @pytest.mark.slow
     def test_estimate_observable_on_ghz(self, shadow_config, ghz_circuit_3q, backend):
         """Test observable estimation on GHZ state."""
@@ -4,13 +4,14 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
 
 from quartumse import ShadowEstimator
 from quartumse.reporting.manifest import ProvenanceManifest
-from quartumse.reporting.shot_data import ShotDataDiagnostics, ShotDataWriter
+from quartumse.reporting.shot_data import ShotDataDiagnostics, ShotDataWriter, summarize_dataframe
 from quartumse.shadows import ShadowConfig
 from quartumse.shadows.core import Observable
 
@@ -335,3 +336,17 @@ def test_summarize_shadow_measurements_computes_expected_statistics():
         marginals = diagnostics.qubit_marginals
         assert pytest.approx(marginals[0]["0"], 1e-6) == 2 / 3
         assert pytest.approx(marginals[1]["1"], 1e-6) == 2 / 3
+
+
+def test_summarize_dataframe_rejects_malformed_outcomes():
+    """Characters other than 0/1 in persisted outcomes are reported, not misread."""
+    df = pd.DataFrame(
+        {
+            "num_qubits": [2, 2],
+            "measurement_bases": ["ZX", "ZZ"],
+            "measurement_outcomes": ["01", "0?"],
+        }
+    )
+
+    with pytest.raises(ValueError, match=r"\?"):
+        summarize_dataframe(df, experiment_id="bad")